@@ -0,0 +1,93 @@
+"""
+Throughput benchmark for the batch command API of the Parking Management System.
+
+It executes the same bursts of Park and Leave commands, with a few queries in between, through parse_commands one line
+at a time and through execute_batch, and reports the throughput of both in commands per second.
+
+Run it from the repository root as `python3 -m Benchmarks.benchmark_batch`.
+"""
+
+import io
+import random
+from contextlib import redirect_stdout
+from time import perf_counter
+
+from parking_management import ParkingManagement
+
+CAPACITY = 10_000
+BURSTS = 200
+BURST_SIZE = 500
+
+
+def generate_commands(seed=0):
+    """
+    This function generates bursts of Park commands followed by bursts of Leave commands, in typed form.
+    :param seed:int Seed for the random generator
+    :return: commands:list List of commands in the format accepted by execute_batch.
+    """
+
+    random_generator = random.Random(seed)
+    commands = [('Create_parking_lot', CAPACITY)]
+    vehicle_count = 0
+
+    for _ in range(BURSTS):
+        for _ in range(BURST_SIZE):
+            vehicle_count += 1
+            commands.append(('Park', f'KA-01-HH-{vehicle_count}', random_generator.randint(18, 70)))
+        commands.append(('Slot_numbers_for_driver_of_age', random_generator.randint(18, 70)))
+        for _ in range(BURST_SIZE):
+            commands.append(('Leave', random_generator.randint(1, CAPACITY)))
+        commands.append(('Slot_number_for_car_with_number', f'KA-01-HH-{random_generator.randint(1, vehicle_count)}'))
+
+    return commands
+
+
+def to_query(command):
+    """
+    This function converts a typed command to the query string accepted by parse_commands.
+    :param command:tuple Command in the format accepted by execute_batch
+    :return: query:str
+    """
+
+    if command[0] == 'Park':
+        return f'Park {command[1]} driver_age {command[2]}'
+    return ' '.join(str(argument) for argument in command)
+
+
+def benchmark_parse_commands(queries):
+    """
+    This function returns the throughput of parse_commands in commands per second.
+    :param queries:list List of queries to be executed
+    :return: throughput:float
+    """
+
+    parking_management = ParkingManagement()
+    with redirect_stdout(io.StringIO()):
+        start = perf_counter()
+        for query in queries:
+            parking_management.parse_commands(query)
+        elapsed = perf_counter() - start
+    return len(queries) / elapsed
+
+
+def benchmark_execute_batch(commands):
+    """
+    This function returns the throughput of execute_batch in commands per second.
+    :param commands:list List of typed commands to be executed
+    :return: throughput:float
+    """
+
+    parking_management = ParkingManagement()
+    start = perf_counter()
+    parking_management.execute_batch(commands)
+    elapsed = perf_counter() - start
+    return len(commands) / elapsed
+
+
+if __name__ == '__main__':
+    typed_commands = generate_commands()
+    parse_commands_throughput = benchmark_parse_commands([to_query(command) for command in typed_commands])
+    execute_batch_throughput = benchmark_execute_batch(typed_commands)
+    print(f'parse_commands {parse_commands_throughput:12,.0f} commands/sec')
+    print(f'execute_batch  {execute_batch_throughput:12,.0f} commands/sec '
+          f'({execute_batch_throughput / parse_commands_throughput:.1f}x)')
@@ -0,0 +1,70 @@
+"""
+Mixed-type benchmark for the parking bay types of the Parking Management System.
+
+It fills parking lots of increasing capacity, laid out as motorcycle, car, EV charging and truck bays, with a mix of
+vehicle types, and measures the average latency of a Leave followed by a Park of a random vehicle type. The same is
+measured on a parking lot without parking bay types. Both should stay flat as the parking lot grows, since every
+BayPool hands out its nearest vacant parking slot in O(log n).
+
+Run it from the repository root as `python3 -m Benchmarks.benchmark_bay_pools`.
+"""
+
+import random
+from time import perf_counter
+
+from parking_management import ParkingManagement
+
+CAPACITIES = [1_000, 10_000, 100_000, 1_000_000]
+OPERATIONS_PER_RUN = 20_000
+
+# Share of the parking bays and of the arriving vehicles of every type.
+BAY_SHARES = {'Motorcycle': 0.2, 'Car': 0.6, 'EV': 0.1, 'Truck': 0.1}
+
+
+def get_bay_counts(capacity):
+    """
+    This function returns the parking bays of a parking lot of the given capacity, split by BAY_SHARES.
+    :param capacity:int Capacity of the parking lot
+    :return: bay_counts:list List of (bay_type:str, count:int) tuples
+    """
+
+    bay_counts = [(bay_type, int(capacity * share)) for bay_type, share in BAY_SHARES.items()]
+    bay_counts[1] = ('Car', capacity - sum(count for bay_type, count in bay_counts if bay_type != 'Car'))
+    return bay_counts
+
+
+def benchmark_bay_pools(capacity, with_bay_types, operations=OPERATIONS_PER_RUN, seed=0):
+    """
+    This function fills a parking lot of the given capacity, and returns the average latency of a Leave of a random
+    parking slot followed by a Park of a random vehicle type, in nanoseconds.
+    :param capacity:int Capacity of the parking lot
+    :param with_bay_types:boolean Whether the parking lot is laid out in parking bay types.
+    :param operations:int Number of Leave and Park operations timed
+    :param seed:int Seed for choosing the parking slots and the vehicle types
+    :return: latency:float Average latency of a Leave and a Park in nanoseconds
+    """
+
+    random_generator = random.Random(seed)
+    vehicle_types = random_generator.choices(list(BAY_SHARES), weights=list(BAY_SHARES.values()),
+                                             k=capacity + operations)
+
+    parking_management = ParkingManagement()
+    parking_management.create_parking_slots(capacity, get_bay_counts(capacity) if with_bay_types else None)
+    for index in range(capacity):
+        parking_management.issue_parking_ticket(f'KA-01-HH-{index}', 30, vehicle_types[index])
+
+    parking_slots = [random_generator.randint(1, capacity) for _ in range(operations)]
+
+    start = perf_counter()
+    for index, parking_slot in enumerate(parking_slots):
+        parking_management.return_parking_ticket(parking_slot)
+        parking_management.issue_parking_ticket(f'PB-01-HH-{index}', 30, vehicle_types[capacity + index])
+    return (perf_counter() - start) / operations * 1e9
+
+
+if __name__ == '__main__':
+    for benchmark_capacity in CAPACITIES:
+        untyped_latency = benchmark_bay_pools(benchmark_capacity, False)
+        typed_latency = benchmark_bay_pools(benchmark_capacity, True)
+        print(f'capacity={benchmark_capacity:>9,}  without bay types {untyped_latency:7.0f} ns  '
+              f'with bay types {typed_latency:7.0f} ns')
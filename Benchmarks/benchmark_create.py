@@ -0,0 +1,46 @@
+"""
+Benchmark for the Create_parking_lot command of the Parking Management System.
+
+It measures the time taken by create_parking_slots and by the first issue_parking_ticket on parking lots of increasing
+capacity, along with the memory allocated for the parking lot. Both should stay flat as the capacity grows, since
+parking slots are handed out lazily from next_parking_slot.
+
+Run it from the repository root as `python3 -m Benchmarks.benchmark_create`.
+"""
+
+import tracemalloc
+from time import perf_counter
+
+from parking_management import ParkingManagement
+
+CAPACITIES = [1_000, 100_000, 10_000_000]
+
+
+def benchmark_create(capacity):
+    """
+    This function creates a parking lot of the given capacity and parks the first car in it.
+    :param capacity:int Capacity of the parking lot
+    :return: (create_time, first_park_time, allocated_bytes):tuple Time taken by create_parking_slots and by the first
+    issue_parking_ticket in seconds, and the memory allocated in the process in bytes.
+    """
+
+    tracemalloc.start()
+    start = perf_counter()
+
+    parking_management = ParkingManagement()
+    parking_management.create_parking_slots(capacity)
+    created = perf_counter()
+    parking_management.issue_parking_ticket('KA-01-HH-1234', 30)
+    parked = perf_counter()
+
+    allocated_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return created - start, parked - created, allocated_bytes
+
+
+if __name__ == '__main__':
+    for parking_lot_capacity in CAPACITIES:
+        create_time, first_park_time, memory = benchmark_create(parking_lot_capacity)
+        print(f'capacity={parking_lot_capacity:>10} create={create_time * 1e6:8.1f} us '
+              f'first_park={first_park_time * 1e6:8.1f} us memory={memory:>8} bytes')
@@ -0,0 +1,168 @@
+"""
+Benchmark harness for the Parking Management System.
+
+It replays a seeded workload from Benchmarks/workload.py on a ParkingManagement and measures :
+1. throughput of the whole workload in operations per second,
+2. latency percentiles of every operation, per ParkingManagement method,
+3. peak memory allocated while replaying the workload.
+Each is measured in its own replay, so that timing every operation and tracing memory do not skew the throughput.
+The results are written to a JSON file, which can be compared against the results of another version.
+
+Run it from the repository root as
+`python3 -m Benchmarks.benchmark_harness --capacity=10000 --operations=1000000 --output_file=results.json`
+and compare two versions with `python3 -m Benchmarks.benchmark_harness --compare old.json new.json`.
+"""
+
+import argparse
+import json
+import platform
+import tracemalloc
+from time import perf_counter, perf_counter_ns
+
+from Benchmarks.workload import generate_workload
+from parking_management import ParkingManagement
+
+PERCENTILES = [50, 90, 99, 99.9]
+
+
+def replay(workload):
+    """
+    This function replays the workload on a new ParkingManagement.
+    :param workload:list List of (method_name, *arguments) tuples
+    :return: elapsed:float Time taken in seconds
+    """
+
+    parking_management = ParkingManagement()
+    operations = [(getattr(parking_management, operation[0]), operation[1:]) for operation in workload]
+
+    start = perf_counter()
+    for method, arguments in operations:
+        method(*arguments)
+    return perf_counter() - start
+
+
+def replay_timed(workload):
+    """
+    This function replays the workload on a new ParkingManagement, timing every operation.
+    :param workload:list List of (method_name, *arguments) tuples
+    :return: latencies:dict Dictionary of method name to the list of latencies of its operations in nanoseconds
+    """
+
+    parking_management = ParkingManagement()
+    latencies = {}
+
+    for operation in workload:
+        method = getattr(parking_management, operation[0])
+        arguments = operation[1:]
+        start = perf_counter_ns()
+        method(*arguments)
+        latencies.setdefault(operation[0], []).append(perf_counter_ns() - start)
+
+    return latencies
+
+
+def replay_traced(workload):
+    """
+    This function replays the workload on a new ParkingManagement while tracing memory allocations.
+    :param workload:list List of (method_name, *arguments) tuples
+    :return: peak_memory:int Peak memory allocated in bytes
+    """
+
+    tracemalloc.start()
+    replay(workload)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak_memory
+
+
+def get_percentile(sorted_values, percentile):
+    """
+    This function returns the percentile of sorted values, using the nearest rank.
+    :param sorted_values:list
+    :param percentile:float
+    :return: value
+    """
+
+    rank = max(int(round(percentile / 100 * len(sorted_values))) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def run_benchmark(capacity, operations, seed, query_ratio):
+    """
+    This function generates the workload and measures it.
+    :param capacity:int Capacity of the parking lot
+    :param operations:int Number of operations
+    :param seed:int Seed of the workload
+    :param query_ratio:float Fraction of the operations which are queries
+    :return: results:dict Results in the format written to the JSON file.
+    """
+
+    workload = generate_workload(capacity, operations, seed=seed, query_ratio=query_ratio)
+
+    elapsed = replay(workload)
+
+    methods = {}
+    for method_name, latencies in sorted(replay_timed(workload).items()):
+        latencies.sort()
+        methods[method_name] = {
+            'count': len(latencies),
+            'mean_ns': sum(latencies) / len(latencies),
+            **{f'p{percentile}_ns': get_percentile(latencies, percentile) for percentile in PERCENTILES},
+            'max_ns': latencies[-1],
+        }
+
+    return {
+        'parameters': {'capacity': capacity, 'operations': operations, 'seed': seed, 'query_ratio': query_ratio},
+        'python': platform.python_version(),
+        'throughput_operations_per_second': len(workload) / elapsed,
+        'peak_memory_bytes': replay_traced(workload),
+        'methods': methods,
+    }
+
+
+def compare_results(old_results, new_results):
+    """
+    This function prints the ratio of every new result to the old result, where a ratio above one is slower or bigger.
+    :param old_results:dict
+    :param new_results:dict
+    """
+
+    old_throughput = old_results['throughput_operations_per_second']
+    new_throughput = new_results['throughput_operations_per_second']
+    print(f'{"throughput":<56} {old_throughput / new_throughput:.2f}x time')
+    print(f'{"peak memory":<56} {new_results["peak_memory_bytes"] / old_results["peak_memory_bytes"]:.2f}x')
+
+    for method_name, new_method_results in new_results['methods'].items():
+        old_method_results = old_results['methods'].get(method_name)
+        if old_method_results is None:
+            continue
+        ratios = [new_method_results[f'p{percentile}_ns'] / max(old_method_results[f'p{percentile}_ns'], 1)
+                  for percentile in PERCENTILES]
+        print(f'{method_name:<56} ' + ' '.join(f'p{percentile}={ratio:.2f}x'
+                                               for percentile, ratio in zip(PERCENTILES, ratios)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--capacity', action="store", type=int, default=10_000, dest='capacity', help="Capacity")
+    parser.add_argument('--operations', action="store", type=int, default=200_000, dest='operations',
+                        help="Number of operations")
+    parser.add_argument('--seed', action="store", type=int, default=0, dest='seed', help="Seed of the workload")
+    parser.add_argument('--query_ratio', action="store", type=float, default=0.2, dest='query_ratio',
+                        help="Fraction of the operations which are queries")
+    parser.add_argument('--output_file', action="store", required=False, dest='output_file', help="JSON Output File")
+    parser.add_argument('--compare', action="store", nargs=2, required=False, dest='compare',
+                        help="Compare two JSON Output Files")
+
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as old_file, open(args.compare[1]) as new_file:
+            compare_results(json.load(old_file), json.load(new_file))
+    else:
+        results = run_benchmark(args.capacity, args.operations, args.seed, args.query_ratio)
+        output = json.dumps(results, indent=2)
+        if args.output_file:
+            with open(args.output_file, 'w') as output_file:
+                output_file.write(output + '\n')
+        print(output)
@@ -0,0 +1,79 @@
+"""
+Analytics benchmark for the ticket history of the Parking Management System.
+
+It loads a seeded synthetic history of departed cars into a TicketHistory, and measures the time taken by the
+occupancy, peak occupancy, dwell time percentiles and driver's age distribution analytics over all of it. The
+analytics run on NumPy if it is installed, otherwise on the C loops of the standard library.
+
+Run it from the repository root as `python3 -m Benchmarks.benchmark_history --tickets=100000000`.
+"""
+
+import argparse
+import random
+from array import array
+from time import perf_counter
+
+import parking_history
+from parking_history import TicketHistory
+
+TICKETS = 10_000_000
+# Length of the simulated period in seconds, and number of times the occupancy is looked up at.
+PERIOD = 90 * 24 * 3600
+OCCUPANCY_TIMES = 24 * 90
+
+
+def generate_history(tickets, seed=0):
+    """
+    This function returns a TicketHistory of randomly generated departed cars, arriving uniformly over PERIOD and
+    staying for up to a day.
+    :param tickets:int Number of departed cars
+    :param seed:int Seed for the random generator
+    :return: history:obj Object of the TicketHistory Class
+    """
+
+    random_generator = random.Random(seed)
+    entry_times = array('d', [random_generator.random() * PERIOD for _ in range(tickets)])
+    exit_times = array('d', [entry_time + random_generator.expovariate(1 / 7200) for entry_time in entry_times])
+    driver_ages = array('i', [random_generator.randint(18, 80) for _ in range(tickets)])
+    parking_slots = array('q', [random_generator.randint(1, 10_000) for _ in range(tickets)])
+
+    history = TicketHistory()
+    history.extend(entry_times, exit_times, driver_ages, parking_slots)
+    return history
+
+
+def time_analytics(history):
+    """
+    This function runs every analytics of the history once, starting with no sorted columns, and returns the time
+    taken by each in seconds.
+    :param history:obj Object of the TicketHistory Class
+    :return: timings:dict Dictionary of analytics name to time taken in seconds.
+    """
+
+    history.sorted_columns = {}
+    occupancy_times = [PERIOD * index / OCCUPANCY_TIMES for index in range(OCCUPANCY_TIMES)]
+    analytics = {
+        'occupancy': lambda: history.get_occupancy(occupancy_times),
+        'peak occupancy': history.get_peak_occupancy,
+        'dwell time percentiles': history.get_dwell_time_percentiles,
+        'driver age distribution': history.get_driver_age_distribution,
+    }
+
+    timings = {}
+    for name, run_analytics in analytics.items():
+        start = perf_counter()
+        run_analytics()
+        timings[name] = perf_counter() - start
+    return timings
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--tickets', action="store", type=int, default=TICKETS, dest='tickets',
+                        help="Number of departed cars in the history")
+    args = parser.parse_args()
+
+    benchmark_history = generate_history(args.tickets)
+    print(f'{args.tickets:,} tickets, analytics on {"NumPy" if parking_history.numpy else "the standard library"}')
+    for analytics_name, elapsed in time_analytics(benchmark_history).items():
+        print(f'{analytics_name:<24} {elapsed:8.2f} s')
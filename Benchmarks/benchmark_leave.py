@@ -0,0 +1,51 @@
+"""
+Benchmark for the Leave command of the Parking Management System.
+
+It fills parking lots of increasing capacity and measures the average latency of return_parking_ticket, which should
+stay flat as the parking lot grows since the parking slot is looked up in the parking_slot_tickets dictionary.
+
+Run it from the repository root as `python3 -m Benchmarks.benchmark_leave`.
+"""
+
+import random
+from time import perf_counter
+
+from parking_management import ParkingManagement
+
+CAPACITIES = [1_000, 10_000, 100_000, 1_000_000]
+LEAVES_PER_RUN = 1_000
+
+
+def benchmark_leave(capacity, leaves=LEAVES_PER_RUN, seed=0):
+    """
+    This function fills a parking lot of the given capacity, and returns the average latency of a Leave followed by
+    a Park on a random parking slot, in nanoseconds.
+    :param capacity:int Capacity of the parking lot
+    :param leaves:int Number of Leave operations timed
+    :param seed:int Seed for choosing the parking slots that are vacated
+    :return: latency:float Average latency of return_parking_ticket in nanoseconds
+    """
+
+    parking_management = ParkingManagement()
+    parking_management.create_parking_slots(capacity)
+    for index in range(capacity):
+        parking_management.issue_parking_ticket(f'KA-01-HH-{index}', 30)
+
+    random_generator = random.Random(seed)
+    parking_slots = [random_generator.randint(1, capacity) for _ in range(leaves)]
+
+    elapsed = 0.0
+    for index, parking_slot in enumerate(parking_slots):
+        start = perf_counter()
+        parking_management.return_parking_ticket(parking_slot)
+        elapsed += perf_counter() - start
+
+        # Parking a new car keeps the parking lot full for the next Leave.
+        parking_management.issue_parking_ticket(f'KA-02-HH-{index}', 30)
+
+    return elapsed / leaves * 1e9
+
+
+if __name__ == '__main__':
+    for parking_lot_capacity in CAPACITIES:
+        print(f'capacity={parking_lot_capacity:>9} leave_latency={benchmark_leave(parking_lot_capacity):10.1f} ns')
@@ -0,0 +1,59 @@
+"""
+Thread pool load test for the ParkingLotManager of the Parking Management System.
+
+Every worker thread drives the terminals of its own parking lot with Park and Leave commands. It reports the total
+throughput for an increasing number of parking lots, with one worker per parking lot. Since every parking lot has its
+own lock, workers on different parking lots never wait on each other; how far the throughput scales also depends on
+the interpreter, as CPython threads share the global interpreter lock.
+
+Run it from the repository root as `python3 -m Benchmarks.benchmark_lot_manager`.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from parking_lot_manager import ParkingLotManager
+
+LOT_COUNTS = [1, 2, 4, 8]
+CAPACITY = 1_000
+OPERATIONS_PER_LOT = 100_000
+
+
+def drive_parking_lot(parking_lot_manager, lot_id, operations=OPERATIONS_PER_LOT):
+    """
+    This function parks cars in the parking lot lot_id until it is full, and then alternates Leave and Park.
+    :param parking_lot_manager:obj Object of the ParkingLotManager Class
+    :param lot_id:hashable Id of the parking lot
+    :param operations:int Number of Park and Leave operations
+    """
+
+    for index in range(operations):
+        if index < CAPACITY or index % 2 == 0:
+            parking_slot = parking_lot_manager.issue_parking_ticket(lot_id, f'KA-{lot_id}-HH-{index}', 30)
+        else:
+            parking_lot_manager.return_parking_ticket(lot_id, parking_slot)
+
+
+def benchmark_lot_manager(lot_count):
+    """
+    This function returns the total throughput of lot_count worker threads, each driving its own parking lot.
+    :param lot_count:int Number of parking lots and worker threads
+    :return: throughput:float Operations per second
+    """
+
+    parking_lot_manager = ParkingLotManager()
+    for lot_id in range(lot_count):
+        parking_lot_manager.create_parking_lot(lot_id, CAPACITY)
+
+    with ThreadPoolExecutor(max_workers=lot_count) as executor:
+        start = perf_counter()
+        list(executor.map(lambda lot_id: drive_parking_lot(parking_lot_manager, lot_id), range(lot_count)))
+        elapsed = perf_counter() - start
+
+    return lot_count * OPERATIONS_PER_LOT / elapsed
+
+
+if __name__ == '__main__':
+    for parking_lot_count in LOT_COUNTS:
+        throughput = benchmark_lot_manager(parking_lot_count)
+        print(f'lots={parking_lot_count:>2} throughput={throughput:12,.0f} operations/sec')
@@ -0,0 +1,101 @@
+"""
+Memory benchmark for the parking tickets of the Parking Management System.
+
+It compares the bytes allocated per parked car by the ParkingTicket, Car and Driver object graph without __slots__
+(as the Models were before), with __slots__, and by the columnar TicketStore with a StoredParkingTicket per parked car.
+The vehicle registration numbers are created up front so that only the ticket storage is measured.
+
+Run it from the repository root as `python3 -m Benchmarks.benchmark_memory`.
+"""
+
+import tracemalloc
+
+from Models.Car import Car
+from Models.Driver import Driver
+from Models.ParkingTicket import ParkingTicket
+from Models.TicketStore import TicketStore
+from parking_management import VEHICLE_CLASSES
+
+PARKED_CARS = 1_000_000
+
+
+class DictDriver(Driver):
+    """
+    Driver without __slots__, every object gets its own __dict__.
+    """
+
+
+class DictCar(Car):
+    """
+    Car without __slots__, every object gets its own __dict__.
+    """
+
+    def __init__(self, registration_number, driver_age):
+        """
+        This constructor method sets the attributes directly, as Vehicle and Car no longer have a __dict__.
+        """
+
+        self.registration_number = registration_number
+        self.driver = DictDriver(driver_age)
+
+
+class DictParkingTicket(ParkingTicket):
+    """
+    ParkingTicket without __slots__, every object gets its own __dict__.
+    """
+
+
+def measure(store_parking_tickets, vehicle_registration_numbers):
+    """
+    This function returns the bytes allocated per parked car by the store_parking_tickets function.
+    :param store_parking_tickets:function It takes the vehicle registration numbers and returns the stored tickets.
+    :param vehicle_registration_numbers:list Vehicle Registration Numbers of the parked cars
+    :return: bytes_per_parked_car:float
+    """
+
+    tracemalloc.start()
+    parking_tickets = store_parking_tickets(vehicle_registration_numbers)
+    allocated_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del parking_tickets
+    return allocated_bytes / len(vehicle_registration_numbers)
+
+
+def store_dict_objects(vehicle_registration_numbers):
+    """
+    This function stores a parking ticket per vehicle registration number in ParkingTicket, Car and Driver objects
+    without __slots__.
+    """
+
+    return [DictParkingTicket(DictCar(vehicle_registration_number, 30), parking_slot)
+            for parking_slot, vehicle_registration_number in enumerate(vehicle_registration_numbers, 1)]
+
+
+def store_slotted_objects(vehicle_registration_numbers):
+    """
+    This function stores a parking ticket per vehicle registration number in ParkingTicket, Car and Driver objects
+    with __slots__.
+    """
+
+    return [ParkingTicket(Car(vehicle_registration_number, 30), parking_slot)
+            for parking_slot, vehicle_registration_number in enumerate(vehicle_registration_numbers, 1)]
+
+
+def store_columnar(vehicle_registration_numbers):
+    """
+    This function stores a parking ticket per vehicle registration number in the columnar TicketStore, keeping the
+    StoredParkingTicket of every parked car as ParkingManagement does.
+    """
+
+    ticket_store = TicketStore(VEHICLE_CLASSES)
+    return ticket_store, [ticket_store.add_parking_ticket(Car(vehicle_registration_number, 30), parking_slot, 0.0)
+                          for parking_slot, vehicle_registration_number in enumerate(vehicle_registration_numbers, 1)]
+
+
+if __name__ == '__main__':
+    registration_numbers = [f'KA-{index % 100:02d}-HH-{index}' for index in range(PARKED_CARS)]
+    for name, store in [('objects without __slots__', store_dict_objects),
+                        ('objects with __slots__', store_slotted_objects),
+                        ('columnar TicketStore', store_columnar)]:
+        print(f'{name:<26} {measure(store, registration_numbers):8.1f} bytes per parked car')
@@ -0,0 +1,66 @@
+"""
+Overhead benchmark for the metrics of the Parking Management System.
+
+It replays the same queries through execute_query with metrics never turned on, turned on and off again, turned on,
+and turned on with one in a hundred commands profiled, and reports the time per query of each. While metrics are off,
+execute_command only checks the metrics attribute, so the first two should match.
+
+Run it from the repository root as `python3 -m Benchmarks.benchmark_metrics`.
+"""
+
+from time import perf_counter
+
+from Benchmarks.benchmark_replay import CAPACITY
+from parking_management import ParkingManagement
+
+QUERIES = 300_000
+ROUNDS = 5
+
+
+def generate_queries():
+    """
+    This function returns Park and Leave queries filling and emptying a parking lot, with a query in between.
+    """
+
+    queries = [f'Create_parking_lot {CAPACITY}']
+    for index in range(QUERIES // 3):
+        queries.append(f'Park KA-01-HH-{index} driver_age {18 + index % 50}')
+        queries.append(f'Slot_number_for_car_with_number KA-01-HH-{index}')
+        queries.append(f'Leave {1 + index % CAPACITY}')
+    return queries
+
+
+def time_per_query(queries, metrics_mode):
+    """
+    This function returns the best time per query over ROUNDS replays, in nanoseconds.
+    :param queries:list List of queries
+    :param metrics_mode:str One of 'never enabled', 'disabled', 'enabled' and 'profiling'
+    :return: time_per_query:float
+    """
+
+    best_elapsed = float('inf')
+    for _ in range(ROUNDS):
+        parking_management = ParkingManagement()
+        if metrics_mode != 'never enabled':
+            metrics = parking_management.enable_metrics()
+            if metrics_mode == 'disabled':
+                parking_management.disable_metrics()
+            elif metrics_mode == 'profiling':
+                metrics.start_profiling(100)
+
+        execute_query = parking_management.execute_query
+        start = perf_counter()
+        for query in queries:
+            execute_query(query)
+        best_elapsed = min(best_elapsed, perf_counter() - start)
+
+    return best_elapsed / len(queries) * 1e9
+
+
+if __name__ == '__main__':
+    benchmark_queries = generate_queries()
+    baseline = time_per_query(benchmark_queries, 'never enabled')
+    print(f'{"never enabled":<14} {baseline:7.0f} ns/query')
+    for mode in ['disabled', 'enabled', 'profiling']:
+        elapsed_per_query = time_per_query(benchmark_queries, mode)
+        print(f'{mode:<14} {elapsed_per_query:7.0f} ns/query ({elapsed_per_query / baseline - 1:+.1%})')
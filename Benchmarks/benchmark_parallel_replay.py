@@ -0,0 +1,66 @@
+"""
+Parallel replay benchmark for the command line runner of the Parking Management System.
+
+It generates an input file of many parking lots, each starting with a Create_parking_lot command, and replays it once
+through execute_query_stream and once through replay_file with an increasing number of worker processes. It reports
+the speedup of every replay over the serial one and checks that all the outputs are byte-identical.
+
+Run it from the repository root as `python3 -m Benchmarks.benchmark_parallel_replay`.
+"""
+
+import filecmp
+import os
+import tempfile
+from time import perf_counter
+
+from Benchmarks.benchmark_replay import generate_input_file, replay_stream
+from parking_replay import replay_file
+
+PARKING_LOTS = 64
+LINES_PER_PARKING_LOT = 50_000
+
+
+def generate_parking_lots_input_file(path):
+    """
+    This function writes an input file of PARKING_LOTS parking lots one after another, each generated by
+    generate_input_file with its own seed.
+    :param path:str Path of the input file
+    """
+
+    with open(path, 'w') as input_file:
+        for seed in range(PARKING_LOTS):
+            parking_lot_path = f'{path}.{seed}'
+            generate_input_file(parking_lot_path, LINES_PER_PARKING_LOT, seed)
+            with open(parking_lot_path) as parking_lot_file:
+                input_file.write(parking_lot_file.read())
+            os.remove(parking_lot_path)
+
+
+def replay_parallel(input_path, output_path, workers):
+    """
+    This function replays the input file through replay_file with workers worker processes.
+    :return: elapsed:float Time taken in seconds
+    """
+
+    start = perf_counter()
+    with open(input_path) as input_file, open(output_path, 'w') as output_file:
+        replay_file(input_file, output_file, workers)
+    return perf_counter() - start
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        input_file_path = os.path.join(directory, 'input.txt')
+        generate_parking_lots_input_file(input_file_path)
+
+        serial_output_path = os.path.join(directory, 'serial.txt')
+        serial_time = replay_stream(input_file_path, serial_output_path)
+        print(f'{"serial":<10} {serial_time:7.2f} s')
+
+        worker_counts = sorted({1, 2, 4, 8, os.cpu_count()})
+        for worker_count in worker_counts:
+            parallel_output_path = os.path.join(directory, f'parallel-{worker_count}.txt')
+            parallel_time = replay_parallel(input_file_path, parallel_output_path, worker_count)
+            identical = filecmp.cmp(serial_output_path, parallel_output_path, shallow=False)
+            print(f'{worker_count:>2} workers {parallel_time:7.2f} s ({serial_time / parallel_time:.1f}x), '
+                  f'byte-identical output: {identical}')
@@ -0,0 +1,61 @@
+"""
+Micro-benchmark for the command parser of the Parking Management System.
+
+For every predefined command, it reports the time per command in nanoseconds taken by parse_query alone, and by
+parse_query followed by the dispatch in execute_command (parse+dispatch), on a parking lot with a few parked cars.
+
+Run it from the repository root as `python3 -m Benchmarks.benchmark_parser`.
+"""
+
+from time import perf_counter
+
+from command_parser import parse_query
+from parking_management import ParkingManagement
+
+REPETITIONS = 200_000
+
+QUERIES = {
+    'Create_parking_lot': ['Create_parking_lot 1000'],
+    'Park': [f'Park KA-01-HH-{index} driver_age {18 + index % 50}' for index in range(REPETITIONS)],
+    'Leave': ['Leave 999'],
+    'Slot_number_for_car_with_number': ['Slot_number_for_car_with_number KA-01-HH-7'],
+    'Slot_numbers_for_driver_of_age': ['Slot_numbers_for_driver_of_age 21'],
+    'Vehicle_registration_number_for_driver_of_age': ['Vehicle_registration_number_for_driver_of_age 21'],
+    'Not recognized': ['Unpark 1'],
+}
+
+
+def time_per_query(function, queries, repetitions=REPETITIONS):
+    """
+    This function returns the average time per call of function over queries, repeated cyclically.
+    :param function:function It takes a query
+    :param queries:list List of queries
+    :param repetitions:int Number of calls
+    :return: time_per_query:float Time per call in nanoseconds
+    """
+
+    queries = (queries * (repetitions // len(queries) + 1))[:repetitions]
+    start = perf_counter()
+    for query in queries:
+        function(query)
+    return (perf_counter() - start) / repetitions * 1e9
+
+
+def new_parking_management():
+    """
+    This function returns a parking lot with a capacity of REPETITIONS parking slots, and ten parked cars.
+    """
+
+    parking_management = ParkingManagement()
+    parking_management.create_parking_slots(REPETITIONS)
+    for index in range(10):
+        parking_management.issue_parking_ticket(f'KA-02-HH-{index}', 21)
+    return parking_management
+
+
+if __name__ == '__main__':
+    print(f'{"command":<46} {"parse ns":>10} {"parse+dispatch ns":>18}')
+    for command_name, command_queries in QUERIES.items():
+        parse_time = time_per_query(parse_query, command_queries)
+        execute_time = time_per_query(new_parking_management().execute_query, command_queries)
+        print(f'{command_name:<46} {parse_time:10.0f} {execute_time:18.0f}')
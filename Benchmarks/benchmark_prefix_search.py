@@ -0,0 +1,87 @@
+"""
+Benchmark for the vehicle registration number prefix queries of the Parking Management System.
+
+It fills parking lots of increasing capacity with cars from many region codes, and measures the average latency of a
+prefix query through the registration_number_index against a naive scan of occupied_parking_slots. It also measures
+the average latency of a Leave followed by a Park, which keeps the registration_number_index up to date.
+
+Run it from the repository root as `python3 -m Benchmarks.benchmark_prefix_search`.
+"""
+
+import random
+from time import perf_counter
+
+from parking_management import ParkingManagement
+
+CAPACITIES = [1_000, 10_000, 100_000, 1_000_000]
+QUERIES_PER_RUN = 200
+STATES = ['KA', 'PB', 'DL', 'MH', 'TN', 'WB', 'HR', 'UP']
+DISTRICTS = 60
+
+
+def generate_vehicle_registration_number(random_generator, number):
+    """
+    This function returns a vehicle registration number in the format <state>-<district>-<series>-<number>, with a
+    random state, district and series. Distinct numbers give distinct vehicle registration numbers.
+    """
+
+    return (f'{random_generator.choice(STATES)}-{random_generator.randint(1, DISTRICTS):02}-'
+            f'{random_generator.choice("ABCDEFGH")}{random_generator.choice("ABCDEFGH")}-{number:07}')
+
+
+def scan_prefix(parking_management, prefix):
+    """
+    This function returns the parking tickets for the cars whose vehicle registration number starts with prefix, by
+    scanning occupied_parking_slots.
+    """
+
+    return [parking_ticket for vehicle_registration_number, parking_ticket in
+            parking_management.occupied_parking_slots.items() if vehicle_registration_number.startswith(prefix)]
+
+
+def benchmark_prefix_search(capacity, queries=QUERIES_PER_RUN, seed=0):
+    """
+    This function fills a parking lot of the given capacity, and returns the average latency in nanoseconds of a
+    prefix query through the index, of a prefix query by a naive scan, and of a Leave followed by a Park.
+    :param capacity:int Capacity of the parking lot
+    :param queries:int Number of prefix queries and of Leave and Park operations timed
+    :param seed:int Seed for the random generator
+    :return: (index_latency:float, scan_latency:float, update_latency:float)
+    """
+
+    random_generator = random.Random(seed)
+    parking_management = ParkingManagement()
+    parking_management.create_parking_slots(capacity)
+    for number in range(capacity):
+        parking_management.issue_parking_ticket(generate_vehicle_registration_number(random_generator, number), 30)
+
+    prefixes = [generate_vehicle_registration_number(random_generator, 0)[:random_generator.choice([6, 8])]
+                for _ in range(queries)]
+
+    start = perf_counter()
+    for prefix in prefixes:
+        parking_management.get_parking_tickets_from_vehicle_registration_number_prefix(prefix)
+    index_latency = (perf_counter() - start) / queries * 1e9
+
+    start = perf_counter()
+    for prefix in prefixes:
+        scan_prefix(parking_management, prefix)
+    scan_latency = (perf_counter() - start) / queries * 1e9
+
+    parking_slots = [random_generator.randint(1, capacity) for _ in range(queries)]
+    vehicle_registration_numbers = [generate_vehicle_registration_number(random_generator, capacity + number)
+                                    for number in range(queries)]
+    start = perf_counter()
+    for parking_slot, vehicle_registration_number in zip(parking_slots, vehicle_registration_numbers):
+        parking_management.return_parking_ticket(parking_slot)
+        parking_management.issue_parking_ticket(vehicle_registration_number, 30)
+    update_latency = (perf_counter() - start) / queries * 1e9
+
+    return index_latency, scan_latency, update_latency
+
+
+if __name__ == '__main__':
+    for benchmark_capacity in CAPACITIES:
+        index, scan, update = benchmark_prefix_search(benchmark_capacity)
+        print(f'capacity={benchmark_capacity:>9,}  index {index:11,.0f} ns  scan {scan:13,.0f} ns '
+              f'({scan / index:7.1f}x)  leave and park {update:7,.0f} ns')
@@ -0,0 +1,84 @@
+"""
+Read-heavy benchmark for the query cache of the Parking Management System.
+
+It fills a parking lot, then replays dashboard polls of the driver's age queries for a handful of ages, with one Park
+or Leave in every hundred queries, once with the query cache turned off and once with it on. It reports the time per
+query of each and the hit rate of the query cache.
+
+Run it from the repository root as `python3 -m Benchmarks.benchmark_query_cache`.
+"""
+
+import random
+from time import perf_counter
+
+from parking_management import ParkingManagement
+from query_cache import QueryCache
+
+CAPACITY = 10_000
+QUERIES = 200_000
+POLLED_DRIVER_AGES = [21, 30, 45, 60]
+WRITES_PER_HUNDRED_QUERIES = 1
+ROUNDS = 5
+
+
+def generate_queries(seed=0):
+    """
+    This function returns the queries filling the parking lot, and the polls of the driver's age queries interleaved
+    with Park and Leave queries.
+    :param seed:int Seed for choosing the driver's ages and the parking slots that are vacated
+    :return: (fill_queries:list, poll_queries:list)
+    """
+
+    random_generator = random.Random(seed)
+
+    fill_queries = [f'Create_parking_lot {CAPACITY}']
+    for index in range(CAPACITY - 1):
+        fill_queries.append(f'Park KA-01-HH-{index} driver_age {random_generator.randint(18, 80)}')
+
+    poll_queries = []
+    for index in range(QUERIES):
+        if index % 100 < WRITES_PER_HUNDRED_QUERIES:
+            # The parking lot is kept one slot short of full, so every Leave is followed by a Park on the same slot.
+            poll_queries.append(f'Leave {random_generator.randint(1, CAPACITY - 1)}')
+            poll_queries.append(f'Park PB-01-HH-{index} driver_age {random_generator.randint(18, 80)}')
+        else:
+            command = random_generator.choice(['Slot_numbers_for_driver_of_age',
+                                               'Vehicle_registration_number_for_driver_of_age'])
+            poll_queries.append(f'{command} {random_generator.choice(POLLED_DRIVER_AGES)}')
+
+    return fill_queries, poll_queries
+
+
+def time_per_query(fill_queries, poll_queries, cached):
+    """
+    This function returns the best time per poll query over ROUNDS replays, in nanoseconds, and the hit rate of the
+    query cache in the last replay.
+    :param fill_queries:list List of queries filling the parking lot, which are not timed.
+    :param poll_queries:list List of queries timed.
+    :param cached:boolean Whether the query cache is turned on.
+    :return: (time_per_query:float, hit_rate:float)
+    """
+
+    best_elapsed = float('inf')
+    for _ in range(ROUNDS):
+        parking_management = ParkingManagement()
+        if not cached:
+            parking_management.query_cache = QueryCache(0)
+        execute_query = parking_management.execute_query
+        for query in fill_queries:
+            execute_query(query)
+
+        start = perf_counter()
+        for query in poll_queries:
+            execute_query(query)
+        best_elapsed = min(best_elapsed, perf_counter() - start)
+
+    return best_elapsed / len(poll_queries) * 1e9, parking_management.query_cache.get_hit_rate()
+
+
+if __name__ == '__main__':
+    benchmark_fill_queries, benchmark_poll_queries = generate_queries()
+    uncached, _ = time_per_query(benchmark_fill_queries, benchmark_poll_queries, False)
+    cached, hit_rate = time_per_query(benchmark_fill_queries, benchmark_poll_queries, True)
+    print(f'{"uncached":<9} {uncached:8.0f} ns/query')
+    print(f'{"cached":<9} {cached:8.0f} ns/query ({uncached / cached:.1f}x faster, {hit_rate:.1%} hit rate)')
@@ -0,0 +1,64 @@
+"""
+Recovery benchmark for the PersistentParkingManagement of the Parking Management System.
+
+It fills a parking lot of 1M parking slots through the journal, takes a snapshot, and keeps parking and leaving for a
+journal tail. It reports the time taken to restart from the snapshot and the journal tail, and the time taken to
+restart from the journal alone without any snapshot.
+
+Run it from the repository root as `python3 -m Benchmarks.benchmark_recovery`.
+"""
+
+import random
+import tempfile
+from time import perf_counter
+
+from parking_persistence import PersistentParkingManagement
+
+CAPACITY = 1_000_000
+TAIL_OPERATIONS = 100_000
+
+
+def fill_parking_lot(directory, take_snapshot, seed=0):
+    """
+    This function fills a persistent parking lot in directory, and then alternates Leave and Park for the tail.
+    :param directory:str Directory of the snapshot and journal files
+    :param take_snapshot:boolean Whether a snapshot is taken once the parking lot is full
+    :param seed:int Seed for the random generator
+    """
+
+    random_generator = random.Random(seed)
+    parking_management = PersistentParkingManagement(directory, snapshot_interval=float('inf'))
+    parking_management.create_parking_slots(CAPACITY)
+    parking_management.park_many([(f'KA-01-HH-{index}', random_generator.randint(18, 70)) for index in range(CAPACITY)])
+    if take_snapshot:
+        parking_management.snapshot()
+
+    for index in range(TAIL_OPERATIONS // 2):
+        parking_management.return_parking_ticket(random_generator.randint(1, CAPACITY))
+        parking_management.issue_parking_ticket(f'KA-02-HH-{index}', random_generator.randint(18, 70))
+    parking_management.close()
+
+
+def benchmark_recovery(take_snapshot):
+    """
+    This function returns the time taken to recover the parking lot filled by fill_parking_lot.
+    :param take_snapshot:boolean Whether a snapshot is taken once the parking lot is full
+    :return: recovery_time:float Time in seconds
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        fill_parking_lot(directory, take_snapshot)
+
+        start = perf_counter()
+        parking_management = PersistentParkingManagement(directory)
+        recovery_time = perf_counter() - start
+
+        assert len(parking_management.occupied_parking_slots) == CAPACITY
+        parking_management.close()
+
+    return recovery_time
+
+
+if __name__ == '__main__':
+    print(f'snapshot + journal tail {benchmark_recovery(True):6.2f} s')
+    print(f'journal only            {benchmark_recovery(False):6.2f} s')
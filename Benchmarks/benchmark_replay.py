@@ -0,0 +1,99 @@
+"""
+Replay benchmark for the command line runner of the Parking Management System.
+
+It generates an input file in the format of Data/sample_input.txt, and replays it once by calling parse_commands for
+every line with sys.stdout redirected to the output file, and once through execute_query_stream. It reports the
+throughput of both in lines per second and checks that both outputs are byte-identical.
+
+Run it from the repository root as `python3 -m Benchmarks.benchmark_replay`.
+"""
+
+import filecmp
+import os
+import random
+import sys
+import tempfile
+from time import perf_counter
+
+from parking_management import ParkingManagement
+
+CAPACITY = 1_000
+LINES = 1_000_000
+
+
+def generate_input_file(path, lines=LINES, seed=0):
+    """
+    This function writes an input file with a Create_parking_lot command followed by a random mix of the predefined
+    commands.
+    :param path:str Path of the input file
+    :param lines:int Number of lines in the input file
+    :param seed:int Seed for the random generator
+    """
+
+    random_generator = random.Random(seed)
+    vehicle_count = 0
+
+    with open(path, 'w') as input_file:
+        input_file.write(f'Create_parking_lot {CAPACITY}\n')
+        for _ in range(lines - 1):
+            choice = random_generator.random()
+            if choice < 0.45:
+                vehicle_count += 1
+                query = f'Park KA-01-HH-{vehicle_count} driver_age {random_generator.randint(18, 70)}'
+            elif choice < 0.9:
+                query = f'Leave {random_generator.randint(1, CAPACITY)}'
+            elif choice < 0.95:
+                query = f'Slot_number_for_car_with_number KA-01-HH-{random_generator.randint(1, vehicle_count + 1)}'
+            else:
+                query = f'Vehicle_registration_number_for_driver_of_age {random_generator.randint(18, 70)}'
+            input_file.write(query + '\n')
+
+
+def replay_line_by_line(input_path, output_path):
+    """
+    This function replays the input file the way the command line runner used to, calling parse_commands for every
+    line with sys.stdout redirected to the output file.
+    :return: elapsed:float Time taken in seconds
+    """
+
+    parking_management = ParkingManagement()
+    start = perf_counter()
+    stdout = sys.stdout
+    sys.stdout = open(output_path, 'w')
+    try:
+        with open(input_path) as input_file:
+            for line in input_file:
+                line = line.rstrip('\n')
+                parking_management.parse_commands(line)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+    return perf_counter() - start
+
+
+def replay_stream(input_path, output_path):
+    """
+    This function replays the input file through execute_query_stream.
+    :return: elapsed:float Time taken in seconds
+    """
+
+    parking_management = ParkingManagement()
+    start = perf_counter()
+    with open(input_path) as input_file, open(output_path, 'w') as output_file:
+        parking_management.execute_query_stream(input_file, output_file)
+    return perf_counter() - start
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        input_file_path = os.path.join(directory, 'input.txt')
+        generate_input_file(input_file_path)
+
+        line_by_line_time = replay_line_by_line(input_file_path, os.path.join(directory, 'line_by_line.txt'))
+        stream_time = replay_stream(input_file_path, os.path.join(directory, 'stream.txt'))
+        identical = filecmp.cmp(os.path.join(directory, 'line_by_line.txt'), os.path.join(directory, 'stream.txt'),
+                                shallow=False)
+
+    print(f'line by line {LINES / line_by_line_time:12,.0f} lines/sec')
+    print(f'stream       {LINES / stream_time:12,.0f} lines/sec ({line_by_line_time / stream_time:.1f}x)')
+    print(f'byte-identical output: {identical}')
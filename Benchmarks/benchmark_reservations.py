@@ -0,0 +1,69 @@
+"""
+Benchmark for the reservations of the Parking Management System.
+
+It books up to a million reservations spread over a month on a parking lot, and measures the average latency of a
+booking, of a Leave followed by a Park with all the reservations outstanding, and of a Park moving the clock forward
+so that reservations start and expire on the way. Every latency should stay logarithmic in the number of outstanding
+reservations, as the calendar is a min heap and the parking lot is never scanned.
+
+Run it from the repository root as `python3 -m Benchmarks.benchmark_reservations`.
+"""
+
+import random
+from time import perf_counter
+
+from parking_management import ParkingManagement
+
+CAPACITY = 100_000
+RESERVATION_COUNTS = [10_000, 100_000, 1_000_000]
+OPERATIONS_PER_RUN = 20_000
+PERIOD = 30 * 24 * 3600
+
+
+def benchmark_reservations(reservations, operations=OPERATIONS_PER_RUN, seed=0):
+    """
+    This function books the reservations on a half full parking lot, and returns the average latencies in nanoseconds.
+    :param reservations:int Number of reservations booked
+    :param operations:int Number of Leave and Park operations timed
+    :param seed:int Seed for the random generator
+    :return: (booking_latency:float, allocation_latency:float, advancing_allocation_latency:float)
+    """
+
+    random_generator = random.Random(seed)
+    parking_management = ParkingManagement()
+    now = [0.0]
+    parking_management.clock = lambda: now[0]
+    parking_management.create_parking_slots(CAPACITY)
+    for index in range(CAPACITY // 2):
+        parking_management.issue_parking_ticket(f'KA-01-HH-{index}', 30)
+
+    start_times = [1.0 + random_generator.random() * PERIOD for _ in range(reservations)]
+    start = perf_counter()
+    for index, start_time in enumerate(start_times):
+        parking_management.reserve_parking_slot(f'PB-01-HH-{index}', start_time, start_time + 7200.0)
+    booking_latency = (perf_counter() - start) / reservations * 1e9
+
+    parking_slots = [random_generator.randint(1, CAPACITY // 2) for _ in range(operations)]
+    start = perf_counter()
+    for index, parking_slot in enumerate(parking_slots):
+        parking_management.return_parking_ticket(parking_slot)
+        parking_management.issue_parking_ticket(f'DL-01-HH-{index}', 30)
+    allocation_latency = (perf_counter() - start) / operations * 1e9
+
+    # The clock moves a tenth of the period forward over the Park operations, so that reservations start and expire.
+    step = PERIOD / 10 / operations
+    start = perf_counter()
+    for index in range(operations):
+        now[0] += step
+        parking_management.return_parking_ticket(parking_slots[index])
+        parking_management.issue_parking_ticket(f'WB-01-HH-{index}', 30)
+    advancing_allocation_latency = (perf_counter() - start) / operations * 1e9
+
+    return booking_latency, allocation_latency, advancing_allocation_latency
+
+
+if __name__ == '__main__':
+    for reservation_count in RESERVATION_COUNTS:
+        booking, allocation, advancing_allocation = benchmark_reservations(reservation_count)
+        print(f'reservations={reservation_count:>9,}  book {booking:7,.0f} ns  leave and park {allocation:7,.0f} ns  '
+              f'leave and park with the clock moving {advancing_allocation:7,.0f} ns')
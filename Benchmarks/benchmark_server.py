@@ -0,0 +1,85 @@
+"""
+Load generator for the asyncio ParkingServer of the Parking Management System.
+
+It starts a ParkingServer on localhost and connects many gate clients to it. Every client keeps a window of pipelined
+Park, Leave and query commands in flight, and the latency of every command is recorded from send to output. It
+reports the requests per second and the p50 and p99 latencies.
+
+Run it from the repository root as `python3 -m Benchmarks.benchmark_server`.
+"""
+
+import asyncio
+import random
+from statistics import quantiles
+from time import perf_counter
+
+from parking_server import ParkingClient, ParkingServer
+
+CLIENTS = 50
+REQUESTS_PER_CLIENT = 2_000
+PIPELINE_WINDOW = 16
+CAPACITY = 10_000
+
+
+async def run_gate(parking_client, client_index, latencies, seed):
+    """
+    This function sends REQUESTS_PER_CLIENT commands from one gate client, keeping PIPELINE_WINDOW of them in flight.
+    :param parking_client:obj Connected object of the ParkingClient Class
+    :param client_index:int Index of the client, used in the vehicle registration numbers
+    :param latencies:list List the latency of every command is appended to, in seconds
+    :param seed:int Seed for the random generator
+    """
+
+    random_generator = random.Random(seed)
+    window = asyncio.Semaphore(PIPELINE_WINDOW)
+
+    async def send(query):
+        async with window:
+            start = perf_counter()
+            await parking_client.execute_query(query)
+            latencies.append(perf_counter() - start)
+
+    queries = []
+    for index in range(REQUESTS_PER_CLIENT):
+        choice = random_generator.random()
+        if choice < 0.45:
+            queries.append(f'Park KA-{client_index}-HH-{index} driver_age {random_generator.randint(18, 70)}')
+        elif choice < 0.9:
+            queries.append(f'Leave {random_generator.randint(1, CAPACITY)}')
+        else:
+            queries.append(f'Slot_number_for_car_with_number KA-{client_index}-HH-{random_generator.randint(0, index)}')
+
+    await asyncio.gather(*[send(query) for query in queries])
+
+
+async def benchmark_server():
+    """
+    This function runs the load generator against a ParkingServer on localhost.
+    :return: (requests_per_second, p50, p99):tuple Throughput and latencies in seconds
+    """
+
+    parking_server = ParkingServer()
+    host, port = await parking_server.start()
+
+    parking_clients = [ParkingClient() for _ in range(CLIENTS)]
+    for parking_client in parking_clients:
+        await parking_client.connect(host, port)
+    await parking_clients[0].execute_query(f'Create_parking_lot {CAPACITY}')
+
+    latencies = []
+    start = perf_counter()
+    await asyncio.gather(*[run_gate(parking_client, client_index, latencies, client_index)
+                           for client_index, parking_client in enumerate(parking_clients)])
+    elapsed = perf_counter() - start
+
+    for parking_client in parking_clients:
+        await parking_client.close()
+    await parking_server.close()
+
+    percentiles = quantiles(latencies, n=100)
+    return len(latencies) / elapsed, percentiles[49], percentiles[98]
+
+
+if __name__ == '__main__':
+    requests_per_second, p50, p99 = asyncio.run(benchmark_server())
+    print(f'{requests_per_second:10,.0f} requests/sec p50={p50 * 1e3:.2f} ms p99={p99 * 1e3:.2f} ms')
@@ -0,0 +1,107 @@
+"""
+Startup benchmark for the command line runner of the Parking Management System.
+
+It compiles the modules to bytecode first, as a gate device would ship them, and reports :
+1. The import time of parking_management from `python -X importtime`, and the modules taking the longest to import.
+2. The time to first command, the wall time of running the command line runner on a single query, as the
+parking_management.py and parking_cli.py scripts and with `python -m parking_cli`, less the wall time of starting the
+interpreter.
+3. The time to first command with a parking lot of PARKED_CARS cars, rebuilt through its queries or loaded with
+--snapshot_file.
+
+Run it from the repository root as `python3 -m Benchmarks.benchmark_startup`.
+"""
+
+import compileall
+import os
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+
+from parking_management import ParkingManagement
+from parking_persistence import write_snapshot
+
+ROUNDS = 10
+PARKED_CARS = 100_000
+SLOWEST_IMPORTS = 5
+
+
+def get_import_times():
+    """
+    This function returns the import times of parking_management and its imports, from `python -X importtime`.
+    :return: import_times:list List of (module:str, self_time:int, cumulative_time:int) tuples in microseconds.
+    """
+
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import parking_management'],
+                            capture_output=True, text=True, check=True)
+    import_times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_time, cumulative_time, module = line[len('import time:'):].split('|')
+        import_times.append((module.strip(), int(self_time), int(cumulative_time)))
+    return import_times
+
+
+def time_command(arguments, rounds=ROUNDS):
+    """
+    This function returns the best wall time of running the interpreter with the arguments, in seconds.
+    :param arguments:list
+    :param rounds:int
+    :return: elapsed:float
+    """
+
+    best_elapsed = float('inf')
+    for _ in range(rounds):
+        start = perf_counter()
+        subprocess.run([sys.executable] + arguments, check=True, stdout=subprocess.DEVNULL)
+        best_elapsed = min(best_elapsed, perf_counter() - start)
+    return best_elapsed
+
+
+if __name__ == '__main__':
+    compileall.compile_dir('.', quiet=1)
+
+    benchmark_import_times = get_import_times()
+    total = next(cumulative for module, _, cumulative in benchmark_import_times if module == 'parking_management')
+    print(f'import parking_management {total / 1000:8.2f} ms, slowest imports :')
+    for module, self_time, _ in sorted(benchmark_import_times, key=lambda import_time: -import_time[1])[
+                                 :SLOWEST_IMPORTS]:
+        print(f'  {module:<30} {self_time / 1000:8.2f} ms')
+
+    interpreter_time = time_command(['-c', 'pass'])
+    with tempfile.TemporaryDirectory() as directory:
+        first_command_path = os.path.join(directory, 'first_command.txt')
+        with open(first_command_path, 'w') as first_command_file:
+            first_command_file.write('Create_parking_lot 6\n')
+        # A script is compiled on every run, while a module run with -m, or imported by the thin parking_cli.py script,
+        # is loaded from its bytecode.
+        first_command_time = time_command(['parking_management.py', f'--input_file={first_command_path}'])
+        cli_first_command_time = time_command(['parking_cli.py', f'--input_file={first_command_path}'])
+        module_first_command_time = time_command(['-m', 'parking_cli', f'--input_file={first_command_path}'])
+        print(f'time to first command     {(first_command_time - interpreter_time) * 1000:8.2f} ms as '
+              f'parking_management.py, {(cli_first_command_time - interpreter_time) * 1000:.2f} ms as parking_cli.py, '
+              f'{(module_first_command_time - interpreter_time) * 1000:.2f} ms with -m '
+              f'(interpreter {interpreter_time * 1000:.2f} ms)')
+
+        # A parking lot of PARKED_CARS cars, rebuilt through its queries or loaded from a snapshot.
+        rebuild_path = os.path.join(directory, 'rebuild.txt')
+        with open(rebuild_path, 'w') as rebuild_file:
+            rebuild_file.write(f'Create_parking_lot {PARKED_CARS}\n')
+            for index in range(PARKED_CARS):
+                rebuild_file.write(f'Park KA-01-HH-{index} driver_age {18 + index % 50}\n')
+            rebuild_file.write('Slot_number_for_car_with_number KA-01-HH-0\n')
+
+        parking_management = ParkingManagement()
+        parking_management.create_parking_slots(PARKED_CARS)
+        for index in range(PARKED_CARS):
+            parking_management.issue_parking_ticket(f'KA-01-HH-{index}', 18 + index % 50)
+        snapshot_path = os.path.join(directory, 'snapshot.bin')
+        write_snapshot(parking_management, snapshot_path)
+
+        rebuild_time = time_command(['-m', 'parking_cli', f'--input_file={rebuild_path}'], 3)
+        snapshot_time = time_command(['-m', 'parking_cli', f'--input_file={first_command_path}',
+                                      f'--snapshot_file={snapshot_path}'], 3)
+        print(f'{PARKED_CARS:,} parked cars rebuilt    {(rebuild_time - interpreter_time) * 1000:8.2f} ms')
+        print(f'{PARKED_CARS:,} parked cars snapshot   {(snapshot_time - interpreter_time) * 1000:8.2f} ms')
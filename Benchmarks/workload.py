@@ -0,0 +1,129 @@
+"""
+Seeded synthetic workload generator for the Parking Management System.
+
+It simulates the arrivals and departures of cars at a parking lot over a number of days, with rush-hour bursts of
+arrivals in the morning and the evening, and a mix of short visits, workday stays and multi-day long stays. Queries are
+mixed in at a configurable ratio. The parking slots are simulated nearest first, so every Leave targets the parking
+slot the car was actually given.
+
+The workload is a list of operations, each a tuple of a ParkingManagement method name followed by its arguments, which
+replays identically for the same parameters.
+"""
+
+import math
+import random
+from heapq import heappop, heappush
+
+MINUTES_PER_DAY = 24 * 60
+
+# Mixture of stays : (probability, function of the random generator returning the stay in minutes).
+STAYS = [
+    (0.70, lambda random_generator: random_generator.expovariate(1 / 60)),
+    (0.25, lambda random_generator: max(random_generator.gauss(8 * 60, 60), 30)),
+    (0.05, lambda random_generator: random_generator.expovariate(1 / (3 * MINUTES_PER_DAY))),
+]
+MEAN_STAY = 0.70 * 60 + 0.25 * 8 * 60 + 0.05 * 3 * MINUTES_PER_DAY
+
+# Mix of queries : (probability, ParkingManagement method name).
+QUERIES = [
+    (0.40, 'get_parking_slot_number_from_vehicle_registration_number'),
+    (0.20, 'get_parking_slots_from_driver_age'),
+    (0.20, 'get_vehicle_registration_numbers_from_driver_age'),
+    (0.10, 'get_parking_slots_from_driver_age_range'),
+    (0.10, 'get_vehicle_registration_numbers_from_driver_age_range'),
+]
+
+MIN_DRIVER_AGE = 18
+MAX_DRIVER_AGE = 80
+
+
+def get_arrival_rate(minute, capacity, target_occupancy):
+    """
+    This function returns the arrival rate in cars per minute at a minute of the simulation. The base rate keeps the
+    parking lot at target_occupancy on average, and rush hours around 09:00 and 18:00 triple it.
+    :param minute:float Minute of the simulation
+    :param capacity:int Capacity of the parking lot
+    :param target_occupancy:float Average fraction of occupied parking slots
+    :return: arrival_rate:float
+    """
+
+    hour = (minute % MINUTES_PER_DAY) / 60
+    rush_hour = math.exp(-((hour - 9) ** 2) / 2) + math.exp(-((hour - 18) ** 2) / 2)
+    return target_occupancy * capacity / MEAN_STAY * (0.5 + 2.5 * rush_hour)
+
+
+def choose(random_generator, weighted_choices):
+    """
+    This function returns the value of a (probability, value) pair chosen at random.
+    :param random_generator:obj random.Random
+    :param weighted_choices:list List of (probability, value) tuples
+    :return: value
+    """
+
+    threshold = random_generator.random()
+    for probability, value in weighted_choices:
+        threshold -= probability
+        if threshold < 0:
+            return value
+    return weighted_choices[-1][1]
+
+
+def generate_workload(capacity, operations, seed=0, query_ratio=0.2, target_occupancy=0.8):
+    """
+    This function generates a workload of a parking lot of the given capacity.
+    :param capacity:int Capacity of the parking lot
+    :param operations:int Number of operations after the create_parking_slots operation
+    :param seed:int Seed for the random generator
+    :param query_ratio:float Fraction of the operations which are queries
+    :param target_occupancy:float Average fraction of occupied parking slots outside rush hours
+    :return: workload:list List of (method_name, *arguments) tuples
+    """
+
+    random_generator = random.Random(seed)
+    workload = [('create_parking_slots', capacity)]
+
+    # Simulated parking lot, departures is a min heap of (minute, parking_slot) of the parked cars.
+    next_parking_slot = 1
+    available_parking_slots = []
+    departures = []
+    vehicle_count = 0
+    minute = 0.0
+
+    while len(workload) <= operations:
+        if random_generator.random() < query_ratio:
+            method_name = choose(random_generator, QUERIES)
+            if method_name == 'get_parking_slot_number_from_vehicle_registration_number':
+                vehicle_number = random_generator.randint(1, max(vehicle_count, 1))
+                workload.append((method_name, f'KA-{vehicle_number % 100:02d}-HH-{vehicle_number}'))
+            elif method_name.endswith('_range'):
+                min_driver_age = random_generator.randint(MIN_DRIVER_AGE, MAX_DRIVER_AGE)
+                workload.append((method_name, min_driver_age, min_driver_age + random_generator.randint(0, 10)))
+            else:
+                workload.append((method_name, random_generator.randint(MIN_DRIVER_AGE, MAX_DRIVER_AGE)))
+            continue
+
+        # Departures due before the next arrival come first.
+        next_arrival = minute + random_generator.expovariate(get_arrival_rate(minute, capacity, target_occupancy))
+        if departures and departures[0][0] <= next_arrival:
+            minute, parking_slot = heappop(departures)
+            heappush(available_parking_slots, parking_slot)
+            workload.append(('return_parking_ticket', parking_slot))
+            continue
+
+        minute = next_arrival
+        vehicle_count += 1
+        vehicle_registration_number = f'KA-{vehicle_count % 100:02d}-HH-{vehicle_count}'
+        workload.append(('issue_parking_ticket', vehicle_registration_number,
+                         random_generator.randint(MIN_DRIVER_AGE, MAX_DRIVER_AGE)))
+
+        # A car arriving at a full parking lot is turned away.
+        if available_parking_slots:
+            parking_slot = heappop(available_parking_slots)
+        elif next_parking_slot <= capacity:
+            parking_slot = next_parking_slot
+            next_parking_slot += 1
+        else:
+            continue
+        heappush(departures, (minute + choose(random_generator, STAYS)(random_generator), parking_slot))
+
+    return workload
@@ -0,0 +1,104 @@
+from heapq import heappush, heappop
+
+# Parking bay types, which are the vehicle types the parking bays are built for.
+BAY_TYPES = ('Motorcycle', 'Car', 'EV', 'Truck')
+
+
+class BayPool:
+    """
+    BayPool class holds the vacant parking slots of the parking bays of one type, which take up the parking slots in
+    the range [first_parking_slot..last_parking_slot] of a parking lot.
+    Parking slots are handed out lazily from next_parking_slot, so only vacated parking slots are ever pushed to the
+    available_parking_slots min heap, and the nearest vacant parking slot is found in O(log n).
+    """
+
+    __slots__ = ('bay_type', 'first_parking_slot', 'last_parking_slot', 'next_parking_slot', 'available_parking_slots')
+
+    def __init__(self, bay_type, first_parking_slot, last_parking_slot):
+        """
+        This constructor method is used to initialize the parameters of the class.
+        bay_type -> Type of the parking bays, i.e. the vehicle type they are built for.
+        first_parking_slot -> First parking slot of the parking bays.
+        last_parking_slot -> Last parking slot of the parking bays.
+        next_parking_slot -> It is initialized to first_parking_slot, it is the nearest parking slot which has never
+        been allocated, all the parking slots in the range [next_parking_slot..last_parking_slot] are vacant.
+        available_parking_slots -> It is initialized to an empty list, it is a min heap of the vacated parking slots
+        below next_parking_slot.
+        """
+
+        self.bay_type = bay_type
+        self.first_parking_slot = first_parking_slot
+        self.last_parking_slot = last_parking_slot
+        self.next_parking_slot = first_parking_slot
+        self.available_parking_slots = []
+
+    @staticmethod
+    def lay_out(capacity, bay_counts):
+        """
+        This method lays out the parking bays of a parking lot from parking slot 1, in the order of bay_counts, and
+        returns a BayPool for every parking bay type.
+        :param capacity:int Capacity of the parking lot
+        :param bay_counts:list List of (bay_type:str, count:int) tuples of the parking bays.
+        :return: bay_pools:dict Dictionary of parking bay type to its BayPool, in the order of the parking slots.
+        """
+
+        bay_pools = {}
+        first_parking_slot = 1
+        for bay_type, count in bay_counts:
+            count = int(count)
+            if bay_type not in BAY_TYPES:
+                raise ValueError(f'Parking bay type not recognized - {bay_type}')
+            if bay_type in bay_pools:
+                raise ValueError(f'Parking bay type {bay_type} is laid out more than once')
+            if count <= 0:
+                raise ValueError(f'Number of {bay_type} parking bays must be positive')
+            bay_pools[bay_type] = BayPool(bay_type, first_parking_slot, first_parking_slot + count - 1)
+            first_parking_slot += count
+
+        if first_parking_slot - 1 != capacity:
+            raise ValueError(f'Parking bays add up to {first_parking_slot - 1} parking slots instead of {capacity}')
+
+        return bay_pools
+
+    def has_empty_parking_slot(self):
+        """
+        This method returns whether a parking slot of the parking bays is vacant.
+        :return: status:boolean
+        """
+
+        return bool(self.available_parking_slots) or self.next_parking_slot <= self.last_parking_slot
+
+    def get_nearest_empty_parking_slot(self):
+        """
+        This method returns the nearest vacant parking slot of the parking bays, and takes it out of the vacant parking
+        slots.
+        :return: available_parking_slot:int
+        """
+
+        if self.available_parking_slots:
+            return heappop(self.available_parking_slots)
+
+        # Raising the same error as heappop on an empty heap, when every parking slot is allocated.
+        if self.next_parking_slot > self.last_parking_slot:
+            raise IndexError('index out of range')
+
+        available_parking_slot = self.next_parking_slot
+        self.next_parking_slot += 1
+        return available_parking_slot
+
+    def release_parking_slot(self, parking_slot):
+        """
+        This method pushes a vacated parking slot of the parking bays back to the available_parking_slots min heap.
+        :param parking_slot:int
+        """
+
+        heappush(self.available_parking_slots, parking_slot)
+
+    def __repr__(self):
+        """
+        This method is to represent BayPool Class objects in the format,
+        <Bay Type> - <First Parking Slot>..<Last Parking Slot>
+        :return: object_representation:str
+        """
+
+        return f'{self.bay_type} - {self.first_parking_slot}..{self.last_parking_slot}'
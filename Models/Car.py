@@ -9,6 +9,8 @@ class Car(Vehicle):
     and a get method for returning age of the driver driving the car.
     """
 
+    __slots__ = ('driver',)
+
     def __init__(self, registration_number, driver_age):
         """
         The constructor method initiates the constructor method for Vehicle Class,
@@ -5,6 +5,8 @@ class Driver:
     and a get method to return the age attribute of the driver.
     """
 
+    __slots__ = ('age',)
+
     def __init__(self, age):
         """
         This constructor method sets the age driver's age to the age attribute of the driver class.
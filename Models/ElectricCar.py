@@ -0,0 +1,18 @@
+from Models.Car import Car
+
+
+class ElectricCar(Car):
+    """
+    Class ElectricCar inherits from the class Car,
+    It contains a get method for returning type of the vehicle,i.e. electric car, which is parked in an EV charging bay.
+    """
+
+    __slots__ = ()
+
+    def get_vehicle_type(self):
+        """
+        This method returns the type of vehicle, in this case 'EV' is returned.
+        :return: type_of_vehicle:string
+        """
+
+        return "EV"
@@ -2,20 +2,25 @@ class ParkingTicket:
     """
     ParkingTicket class contains information about car, driver and the parking_slot in which the car is parked.
     It contains a constructor method to set the car object and parking slot in car and parking_slot parameters.
-    It also contains get methods to return the vehicle registration number of the car, driver's age and
-    parking slot number in which the car is parked.
+    It also contains get methods to return the vehicle registration number of the car, driver's age, vehicle type,
+    parking slot number in which the car is parked, and the entry and exit times of the car.
     """
 
-    def __init__(self, car, parking_slot):
+    __slots__ = ('car', 'parking_slot', 'entry_time', 'exit_time')
+
+    def __init__(self, car, parking_slot, entry_time=None):
         """
         This constructor method is used to assign the object of the Class Car to car attribute and parking slot number
-        to parking_slot attribute of the class.
+        to parking_slot attribute of the class. The exit time is set once the car leaves.
         :param car:obj
         :param parking_slot:int
+        :param entry_time:float Time the car entered the parking lot in seconds since the epoch, or None if unknown.
         """
 
         self.car = car
         self.parking_slot = parking_slot
+        self.entry_time = entry_time
+        self.exit_time = None
 
     def get_vehicle_registration_number(self):
         """
@@ -33,6 +38,22 @@ class ParkingTicket:
 
         return self.car.get_driver_age()
 
+    def get_vehicle_type(self):
+        """
+        This method is used to return the type of the vehicle.
+        :return: vehicle_type:str
+        """
+
+        return self.car.get_vehicle_type()
+
+    def get_vehicle(self):
+        """
+        This method is used to return the object of the Car Class, or any other vehicle class, of the car.
+        :return: vehicle:obj
+        """
+
+        return self.car
+
     def get_parking_slot(self):
         """
         This method is used to return the parking slot number in which the car is parked.
@@ -41,6 +62,22 @@ class ParkingTicket:
 
         return self.parking_slot
 
+    def get_entry_time(self):
+        """
+        This method is used to return the time the car entered the parking lot.
+        :return: entry_time:float or None if unknown.
+        """
+
+        return self.entry_time
+
+    def get_exit_time(self):
+        """
+        This method is used to return the time the car left the parking lot.
+        :return: exit_time:float or None if the car is still parked.
+        """
+
+        return self.exit_time
+
     def __repr__(self):
         """
         This method is to ParkingTicket Class objects in the format,
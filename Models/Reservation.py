@@ -0,0 +1,71 @@
+class Reservation:
+    """
+    Reservation class contains an advance booking of a parking slot for a car, for the time window
+    [start_time..end_time). It contains a constructor method to set the details of the booking, and get methods to
+    return the reservation id, vehicle registration number, parking slot held for the car and status of the booking.
+    """
+
+    __slots__ = ('reservation_id', 'vehicle_registration_number', 'start_time', 'end_time', 'vehicle_type',
+                 'parking_slot', 'status')
+
+    def __init__(self, reservation_id, vehicle_registration_number, start_time, end_time, vehicle_type='Car'):
+        """
+        This constructor method is used to set the details of the booking. The reservation starts as booked, without a
+        parking slot.
+        :param reservation_id:int
+        :param vehicle_registration_number:str Vehicle Registration Number of the car the parking slot is booked for.
+        :param start_time:float Start of the time window in seconds since the epoch.
+        :param end_time:float End of the time window in seconds since the epoch.
+        :param vehicle_type:str Type of the vehicle the parking slot is booked for.
+        """
+
+        self.reservation_id = reservation_id
+        self.vehicle_registration_number = vehicle_registration_number
+        self.start_time = start_time
+        self.end_time = end_time
+        self.vehicle_type = vehicle_type
+        self.parking_slot = None
+        self.status = 'booked'
+
+    def get_reservation_id(self):
+        """
+        This method is used to return the id of the reservation.
+        :return: reservation_id:int
+        """
+
+        return self.reservation_id
+
+    def get_vehicle_registration_number(self):
+        """
+        This method is used to return the vehicle registration number of the car the parking slot is booked for.
+        :return: vehicle_registration_number:str
+        """
+
+        return self.vehicle_registration_number
+
+    def get_parking_slot(self):
+        """
+        This method is used to return the parking slot held for the car.
+        :return: parking_slot:int or None if no parking slot is held.
+        """
+
+        return self.parking_slot
+
+    def get_status(self):
+        """
+        This method is used to return the status of the reservation, one of 'booked', 'held', 'claimed', 'expired',
+        'cancelled' and 'unavailable'.
+        :return: status:str
+        """
+
+        return self.status
+
+    def __repr__(self):
+        """
+        This method is to represent Reservation Class objects in the format,
+        <Reservation Id> - <Vehicle Registration Number> - <Start Time>..<End Time> - <Status>
+        :return: object_representation:str
+        """
+
+        return (f'{self.reservation_id} - {self.vehicle_registration_number} - {self.start_time}..{self.end_time} - '
+                f'{self.status}')
@@ -0,0 +1,244 @@
+import math
+from array import array
+from sys import intern
+
+from Models.ParkingTicket import ParkingTicket
+
+
+class TicketStore:
+    """
+    TicketStore class is a compact, columnar store for the parking tickets of the cars parked in a parking lot.
+    Instead of a ParkingTicket, vehicle and Driver object per parked car, it holds the interned vehicle registration
+    number, driver's age, entry time and vehicle type of every parked car in parallel arrays indexed by the parking slot
+    number, and hands out a StoredParkingTicket per parked car, which reads its values from the arrays.
+    It contains methods to add and remove a parking ticket, and get methods to return the values stored for an occupied
+    parking slot.
+    """
+
+    __slots__ = ('vehicle_types', 'vehicle_classes', 'vehicle_registration_numbers', 'driver_ages', 'entry_times',
+                 'vehicle_type_numbers', 'occupied_parking_slots_count')
+
+    def __init__(self, vehicle_classes):
+        """
+        This constructor method is used to initialize the parallel arrays of the class.
+        vehicle_types -> Tuple of the vehicle types, in the order of their number in vehicle_type_numbers.
+        vehicle_classes -> Tuple of the vehicle classes of the vehicle types, in the same order.
+        vehicle_registration_numbers -> It is initialized to a list holding None for the unused parking slot 0, a
+        vacant parking slot also holds None.
+        driver_ages -> It is initialized to an array of signed integers holding 0 for the unused parking slot 0.
+        entry_times -> It is initialized to an array of floats holding NaN, i.e. an unknown entry time, for the unused
+        parking slot 0.
+        vehicle_type_numbers -> It is initialized to an array of bytes holding 0 for the unused parking slot 0.
+        occupied_parking_slots_count -> It is initialized to zero.
+        :param vehicle_classes:dict Dictionary of vehicle type to the vehicle class of that type.
+        """
+
+        self.vehicle_types = tuple(vehicle_classes)
+        self.vehicle_classes = tuple(vehicle_classes.values())
+        self.clear()
+
+    def clear(self):
+        """
+        This method removes all the parking tickets.
+        """
+
+        self.vehicle_registration_numbers = [None]
+        self.driver_ages = array('q', [0])
+        self.entry_times = array('d', [math.nan])
+        self.vehicle_type_numbers = array('B', [0])
+        self.occupied_parking_slots_count = 0
+
+    def add_parking_ticket(self, vehicle, parking_slot, entry_time=None):
+        """
+        This method is used to store the parking ticket of a vehicle parked in the parking_slot. The arrays are grown up
+        to the parking_slot if it is beyond their current length. The vehicle registration number is stored last, so
+        a value which does not fit in its array raises with the parking_slot still vacant.
+        :param vehicle:obj Object of the Car Class or any other vehicle class
+        :param parking_slot:int Parking Slot number allocated to the vehicle
+        :param entry_time:float Time the vehicle entered the parking lot in seconds since the epoch, or None if unknown.
+        :return: parking_ticket:obj Object of the StoredParkingTicket Class
+        """
+
+        missing_parking_slots = parking_slot + 1 - len(self.vehicle_registration_numbers)
+        if missing_parking_slots > 0:
+            self.vehicle_registration_numbers.extend([None] * missing_parking_slots)
+            self.driver_ages.extend(array('q', bytes(missing_parking_slots * self.driver_ages.itemsize)))
+            self.entry_times.extend(array('d', [math.nan]) * missing_parking_slots)
+            self.vehicle_type_numbers.extend(bytes(missing_parking_slots))
+
+        self.vehicle_type_numbers[parking_slot] = self.vehicle_types.index(vehicle.get_vehicle_type())
+        self.driver_ages[parking_slot] = vehicle.get_driver_age()
+        self.entry_times[parking_slot] = math.nan if entry_time is None else entry_time
+
+        if self.vehicle_registration_numbers[parking_slot] is None:
+            self.occupied_parking_slots_count += 1
+        self.vehicle_registration_numbers[parking_slot] = intern(vehicle.get_registration_number())
+
+        return StoredParkingTicket(self, parking_slot)
+
+    def remove_parking_ticket(self, parking_slot):
+        """
+        This method is used to remove the parking ticket of the car parked in the parking_slot. The values of the
+        parking ticket are copied to a ParkingTicket object, as they are no longer stored.
+        :param parking_slot:int Parking Slot number which is getting vacated.
+        :return: parking_ticket:obj or None if the parking_slot is vacant.
+        """
+
+        if parking_slot not in self:
+            return None
+
+        parking_ticket = ParkingTicket(self.get_vehicle(parking_slot), parking_slot, self.get_entry_time(parking_slot))
+        self.vehicle_registration_numbers[parking_slot] = None
+        self.occupied_parking_slots_count -= 1
+        return parking_ticket
+
+    def get_vehicle_registration_number(self, parking_slot):
+        """
+        This method is used to return the vehicle registration number of the car parked in the parking_slot.
+        :param parking_slot:int Parking Slot number
+        :return: vehicle_registration_number:str or None if the parking_slot is vacant.
+        """
+
+        if 0 < parking_slot < len(self.vehicle_registration_numbers):
+            return self.vehicle_registration_numbers[parking_slot]
+        return None
+
+    def get_driver_age(self, parking_slot):
+        """
+        This method is used to return the age of the driver of the car parked in the parking_slot.
+        :param parking_slot:int Parking Slot number, which must be occupied.
+        :return: driver_age:int
+        """
+
+        return self.driver_ages[parking_slot]
+
+    def get_entry_time(self, parking_slot):
+        """
+        This method is used to return the time the car parked in the parking_slot entered the parking lot.
+        :param parking_slot:int Parking Slot number, which must be occupied.
+        :return: entry_time:float or None if unknown.
+        """
+
+        entry_time = self.entry_times[parking_slot]
+        return None if math.isnan(entry_time) else entry_time
+
+    def get_vehicle_type(self, parking_slot):
+        """
+        This method is used to return the type of the vehicle parked in the parking_slot.
+        :param parking_slot:int Parking Slot number, which must be occupied.
+        :return: vehicle_type:str
+        """
+
+        return self.vehicle_types[self.vehicle_type_numbers[parking_slot]]
+
+    def get_vehicle(self, parking_slot):
+        """
+        This method is used to build an object of the vehicle class of the vehicle parked in the parking_slot.
+        :param parking_slot:int Parking Slot number, which must be occupied.
+        :return: vehicle:obj
+        """
+
+        vehicle_class = self.vehicle_classes[self.vehicle_type_numbers[parking_slot]]
+        return vehicle_class(self.vehicle_registration_numbers[parking_slot], self.driver_ages[parking_slot])
+
+    def __len__(self):
+        """
+        This method returns the number of occupied parking slots in the store.
+        :return: occupied_parking_slots_count:int
+        """
+
+        return self.occupied_parking_slots_count
+
+    def __contains__(self, parking_slot):
+        """
+        This method returns whether the parking_slot is occupied in the store.
+        :param parking_slot:int Parking Slot number
+        :return: status:boolean
+        """
+
+        return self.get_vehicle_registration_number(parking_slot) is not None
+
+
+class StoredParkingTicket:
+    """
+    StoredParkingTicket class is the parking ticket of a car parked in a parking slot of a TicketStore. It only holds
+    the TicketStore and the parking slot, and has the same get methods as the ParkingTicket Class, which read the
+    values stored for the parking slot. It is only valid while the car is parked.
+    """
+
+    __slots__ = ('ticket_store', 'parking_slot')
+
+    def __init__(self, ticket_store, parking_slot):
+        """
+        This constructor method is used to assign the TicketStore and the parking slot number of the parking ticket.
+        :param ticket_store:obj Object of the TicketStore Class
+        :param parking_slot:int
+        """
+
+        self.ticket_store = ticket_store
+        self.parking_slot = parking_slot
+
+    def get_vehicle_registration_number(self):
+        """
+        This method is used to return the vehicle registration number of the car.
+        :return: vehicle_registration_number:str
+        """
+
+        return self.ticket_store.vehicle_registration_numbers[self.parking_slot]
+
+    def get_driver_age(self):
+        """
+        This method is used to return the age of the driver, driving the car.
+        :return: driver_age:int
+        """
+
+        return self.ticket_store.driver_ages[self.parking_slot]
+
+    def get_vehicle_type(self):
+        """
+        This method is used to return the type of the vehicle.
+        :return: vehicle_type:str
+        """
+
+        return self.ticket_store.get_vehicle_type(self.parking_slot)
+
+    def get_vehicle(self):
+        """
+        This method is used to build an object of the vehicle class of the car.
+        :return: vehicle:obj
+        """
+
+        return self.ticket_store.get_vehicle(self.parking_slot)
+
+    def get_parking_slot(self):
+        """
+        This method is used to return the parking slot number in which the car is parked.
+        :return: parking_slot:int
+        """
+
+        return self.parking_slot
+
+    def get_entry_time(self):
+        """
+        This method is used to return the time the car entered the parking lot.
+        :return: entry_time:float or None if unknown.
+        """
+
+        return self.ticket_store.get_entry_time(self.parking_slot)
+
+    def get_exit_time(self):
+        """
+        This method is used to return the time the car left the parking lot, which is None as the car is parked.
+        :return: exit_time:None
+        """
+
+        return None
+
+    def __repr__(self):
+        """
+        This method is to represent StoredParkingTicket Class objects in the format,
+        <Vehicle Registration Number> - <Driver's Age> - <Parking Slot Number>
+        :return: object_representation:str
+        """
+
+        return f'{self.get_vehicle_registration_number()} - {self.get_driver_age()} - {self.get_parking_slot()}'
@@ -0,0 +1,42 @@
+from Models.Driver import Driver
+from Models.Vehicle import Vehicle
+
+
+class Truck(Vehicle):
+    """
+    Class Truck inherits from the class Vehicle,
+    It contains a get method for returning type of the vehicle,i.e. truck and
+    and a get method for returning age of the driver driving the truck.
+    """
+
+    __slots__ = ('driver',)
+
+    def __init__(self, registration_number, driver_age):
+        """
+        The constructor method initiates the constructor method for Vehicle Class,
+        passing the vehicle registration number as argument.
+        A new driver object is created from Driver Class, by passing driver's age as argument,
+        and the object is assigned to driver attribute of the class.
+
+        :param registration_number:string Vehicle Registration Number of the Truck
+        :param driver_age:int Age of the driver driving the Truck
+        """
+
+        Vehicle.__init__(self, registration_number)
+        self.driver = Driver(driver_age)
+
+    def get_vehicle_type(self):
+        """
+        This method returns the type of vehicle, in this case 'Truck' is returned.
+        :return: type_of_vehicle:string
+        """
+
+        return "Truck"
+
+    def get_driver_age(self):
+        """
+        This method returns the age of the driver driving the truck.
+        :return: driver_age:int
+        """
+
+        return self.driver.get_age()
@@ -5,6 +5,8 @@ class Vehicle:
     of the class and a get method to return the value stored in registration_number attribute of the class.
     """
 
+    __slots__ = ('registration_number',)
+
     def __init__(self, registration_number):
         """
         This constructor method is used to store the registration number of the vehicle to registration_number attribute
@@ -0,0 +1,181 @@
+"""
+Parser for the queries of the Parking Management System.
+
+A query is tokenized once and turned into a Command object holding the command name and its typed arguments, which
+is shared by every front-end executing queries on the Parking Management System. Optional arguments follow their
+keyword, and the tokens after the arguments of a query are ignored.
+"""
+
+from Models.BayPool import BayPool
+
+# Keywords of the optional arguments.
+BAYS_KEYWORD = 'bays'
+VEHICLE_TYPE_KEYWORD = 'vehicle_type'
+
+
+class Command:
+    """
+    Command class contains a parsed query.
+    name -> Name of the predefined command, or None if the query is not recognized.
+    arguments -> Tuple of the typed arguments of the command, in the order they are passed to execute_batch.
+    query -> The query the command was parsed from.
+    error -> The exception raised while parsing the arguments of the query, or None.
+    """
+
+    __slots__ = ('name', 'arguments', 'query', 'error')
+
+    def __init__(self, name, arguments, query, error=None):
+        """
+        This constructor method is used to set the name, arguments, query and error attributes of the class.
+        :param name:str
+        :param arguments:tuple
+        :param query:str
+        :param error:obj
+        """
+
+        self.name = name
+        self.arguments = arguments
+        self.query = query
+        self.error = error
+
+    def get_batch_command(self):
+        """
+        This method returns the command in the format accepted by execute_batch of ParkingManagement.
+        :return: batch_command:tuple Tuple of the command name followed by its typed arguments.
+        """
+
+        return (self.name,) + self.arguments
+
+    def __repr__(self):
+        """
+        This method is to represent Command Class objects in the format, Command(<name>, <arguments>)
+        :return: object_representation:str
+        """
+
+        return f'Command({self.name!r}, {self.arguments!r})'
+
+
+def parse_create_parking_lot_arguments(tokens):
+    """
+    Create_parking_lot <capacity:int> [bays <bay_type:str> <count:int>...]
+    The layout of the parking bays is checked here, so that a Create_parking_lot which cannot succeed is an error in
+    the query and never empties the parking lot.
+    """
+
+    capacity = int(tokens[1])
+    if len(tokens) < 3 or tokens[2].strip() != BAYS_KEYWORD:
+        return (capacity,)
+
+    bay_tokens = [token.strip() for token in tokens[3:] if token.strip()]
+    if not bay_tokens:
+        raise ValueError('Parking bays missing')
+    if len(bay_tokens) % 2:
+        raise ValueError(f'Number of parking bays missing for {bay_tokens[-1]}')
+    bay_counts = tuple((bay_tokens[index], int(bay_tokens[index + 1])) for index in range(0, len(bay_tokens), 2))
+    BayPool.lay_out(capacity, bay_counts)
+    return capacity, bay_counts
+
+
+def parse_park_arguments(tokens):
+    """
+    Park <vehicle_registration_number:str> driver_age <age:int> [vehicle_type <vehicle_type:str>]
+    """
+
+    if len(tokens) > 5 and tokens[4] == VEHICLE_TYPE_KEYWORD:
+        return tokens[1], int(tokens[3]), tokens[5].strip()
+    return tokens[1], int(tokens[3])
+
+
+def parse_parking_slot_arguments(tokens):
+    """
+    Leave <parking_slot:int>
+    """
+
+    return (int(tokens[1]),)
+
+
+def parse_vehicle_registration_number_arguments(tokens):
+    """
+    Slot_number_for_car_with_number <vehicle_registration_number:str> and
+    Slot_numbers_for_car_with_number_prefix <prefix:str>
+    """
+
+    return (tokens[1],)
+
+
+def parse_driver_age_arguments(tokens):
+    """
+    Slot_numbers_for_driver_of_age <age:int> and Vehicle_registration_number_for_driver_of_age <age:int>
+    """
+
+    return (int(tokens[1]),)
+
+
+def parse_reserve_arguments(tokens):
+    """
+    Reserve <vehicle_registration_number:str> from <start_time:float> to <end_time:float>
+    [vehicle_type <vehicle_type:str>]
+    """
+
+    if len(tokens) > 7 and tokens[6] == VEHICLE_TYPE_KEYWORD:
+        return tokens[1], float(tokens[3]), float(tokens[5]), tokens[7].strip()
+    return tokens[1], float(tokens[3]), float(tokens[5])
+
+
+def parse_reservation_id_arguments(tokens):
+    """
+    Cancel_reservation <reservation_id:int>
+    """
+
+    return (int(tokens[1]),)
+
+
+# Predefined commands and the functions parsing their arguments from the tokens of a query, in the order in which the
+# command names are matched as prefixes of a query whose first token is not a command name.
+ARGUMENT_PARSERS = {
+    'Create_parking_lot': parse_create_parking_lot_arguments,
+    'Park': parse_park_arguments,
+    'Leave': parse_parking_slot_arguments,
+    'Slot_number_for_car_with_number': parse_vehicle_registration_number_arguments,
+    'Vehicle_registration_number_for_driver_of_age': parse_driver_age_arguments,
+    'Slot_numbers_for_driver_of_age': parse_driver_age_arguments,
+    'Slot_numbers_for_car_with_number_prefix': parse_vehicle_registration_number_arguments,
+    'Reserve': parse_reserve_arguments,
+    'Cancel_reservation': parse_reservation_id_arguments,
+}
+
+
+def get_command_name(query):
+    """
+    This function returns the name of the predefined command matching a query whose first token is not a command name,
+    by matching the command names as prefixes of the query in order.
+    :param query:str
+    :return: command_name:str or None if the query is not recognized.
+    """
+
+    for command_name in ARGUMENT_PARSERS:
+        if query.startswith(command_name):
+            return command_name
+    return None
+
+
+def parse_query(query):
+    """
+    This function tokenizes the query once on " ", and returns the Command object for it. Errors in the arguments are
+    not raised, they are stored in the error attribute of the Command object.
+    :param query:str Command to be executed with arguments separated by " ".
+    :return: command:obj Object of the Command Class.
+    """
+
+    tokens = query.split(' ')
+
+    command_name = tokens[0]
+    if command_name not in ARGUMENT_PARSERS:
+        command_name = get_command_name(query)
+        if command_name is None:
+            return Command(None, (), query)
+
+    try:
+        return Command(command_name, ARGUMENT_PARSERS[command_name](tokens), query)
+    except Exception as exception:
+        return Command(command_name, (), query, exception)
@@ -0,0 +1,109 @@
+import sys
+
+from parking_management import ParkingManagement
+
+# Options of the command line runner, and whether each of them takes a value. They are parsed without argparse when
+# every option is passed in the --option=value or --option value form, as importing argparse takes longer than the rest
+# of the startup.
+CLI_OPTIONS = {'--input_file': True, '--output_file': True, '--snapshot_file': True, '--workers': True,
+               '--lot_tagged': False}
+
+
+def get_argument_parser():
+    """
+    This function returns the argparse parser of the command line runner, which reports the usage and the errors.
+    :return: parser:obj
+    """
+
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--input_file', action="store", required=True, dest='input_file', help="Input File")
+    parser.add_argument('--output_file', action="store", required=False, dest='output_file', help="Output File")
+    parser.add_argument('--snapshot_file', action="store", required=False, dest='snapshot_file',
+                        help="Snapshot File to load the parking lot from before the Input File, it cannot be "
+                             "combined with --workers or --lot_tagged")
+    parser.add_argument('--workers', action="store", type=int, required=False, dest='workers',
+                        help="Number of worker processes replaying the parking lots in parallel")
+    parser.add_argument('--lot_tagged', action="store_true", dest='lot_tagged',
+                        help="Every line of the input file starts with the id of its parking lot")
+    return parser
+
+
+def parse_arguments(argv):
+    """
+    This function parses the arguments of the command line runner. Arguments which are not understood, such as --help,
+    are parsed by argparse instead, which prints the usage or the error.
+    :param argv:list Arguments without the program name.
+    :return: args:dict Dictionary of option name, without the leading "--", to its value.
+    """
+
+    args = {'input_file': None, 'output_file': None, 'snapshot_file': None, 'workers': None, 'lot_tagged': False}
+
+    index = 0
+    while index < len(argv):
+        option, separator, value = argv[index].partition('=')
+        if option not in CLI_OPTIONS or (separator and not CLI_OPTIONS[option]):
+            return vars(get_argument_parser().parse_args(argv))
+        if not CLI_OPTIONS[option]:
+            value = True
+        elif not separator:
+            index += 1
+            if index == len(argv):
+                return vars(get_argument_parser().parse_args(argv))
+            value = argv[index]
+        args[option[2:]] = value
+        index += 1
+
+    if args['input_file'] is None:
+        return vars(get_argument_parser().parse_args(argv))
+    if args['workers'] is not None:
+        if not args['workers'].isdigit():
+            return vars(get_argument_parser().parse_args(argv))
+        args['workers'] = int(args['workers'])
+    return args
+
+
+def main(argv=None):
+    """
+    This function runs the command line runner, executing every query of the input file and writing the outputs to
+    the output file or to the console.
+    :param argv:list Arguments without the program name, it defaults to sys.argv[1:].
+    """
+
+    args = parse_arguments(sys.argv[1:] if argv is None else argv)
+    if args['snapshot_file'] and (args['workers'] or args['lot_tagged']):
+        get_argument_parser().error('--snapshot_file cannot be combined with --workers or --lot_tagged')
+
+    # Creates an object of Main Class Parking Management
+    parking_management = ParkingManagement()
+
+    # The parking lot is loaded from the snapshot file if it is specified, instead of being built query by query.
+    if args['snapshot_file']:
+        from parking_persistence import read_snapshot
+
+        read_snapshot(parking_management, args['snapshot_file'])
+
+    # if output_file is argument is specified, all the output will be written to the output_file, otherwise it is
+    # written to the console.
+    if args['output_file']:
+        output = open(args['output_file'], "w")
+    else:
+        output = sys.stdout
+
+    # Replaying the input_file in parallel by parking lot if asked, otherwise streaming it in chunks through
+    # execute_query_stream method of Parking Management Class, which writes the outputs in blocks.
+    with open(args['input_file']) as input_file:
+        if args['workers'] or args['lot_tagged']:
+            from parking_replay import replay_file
+
+            replay_file(input_file, output, args['workers'], args['lot_tagged'])
+        else:
+            parking_management.execute_query_stream(input_file, output)
+
+    if output is not sys.stdout:
+        output.close()
+
+
+if __name__ == '__main__':
+    main()
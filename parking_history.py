@@ -0,0 +1,188 @@
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from itertools import repeat
+from math import ceil
+from operator import floordiv, sub
+
+# NumPy is optional, the analytics fall back to the C loops of the standard library without it.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TicketHistory:
+    """
+    TicketHistory class is a columnar history of the parking tickets of the cars that left a parking lot, which is
+    filled once enable_history is called on a ParkingManagement. It holds the entry time, exit time, driver's age and
+    parking slot of every departed car in parallel arrays, and computes the occupancy, dwell times and driver's age
+    distribution on whole columns at once, with NumPy if it is installed.
+    """
+
+    def __init__(self):
+        """
+        This constructor method is used to initialize the parallel arrays of the class.
+        entry_times -> Array of the entry times of the departed cars in seconds since the epoch.
+        exit_times -> Array of the exit times of the departed cars in seconds since the epoch.
+        driver_ages -> Array of the driver's ages of the departed cars.
+        parking_slots -> Array of the parking slots of the departed cars.
+        sorted_columns -> Dictionary of column name to the sorted column, it is emptied whenever a ticket is added.
+        """
+
+        self.entry_times = array('d')
+        self.exit_times = array('d')
+        self.driver_ages = array('q')
+        self.parking_slots = array('q')
+        self.sorted_columns = {}
+
+    def __len__(self):
+        """
+        This method returns the number of departed cars in the history.
+        :return: length:int
+        """
+
+        return len(self.entry_times)
+
+    def add_parking_ticket(self, parking_ticket):
+        """
+        This method adds the parking ticket of a departed car to the history. Parking tickets without an entry time,
+        such as the ones recovered from a journal, are skipped.
+        :param parking_ticket:obj Object of the ParkingTicket Class, with its exit time set.
+        """
+
+        if parking_ticket.get_entry_time() is None:
+            return
+
+        # Every value is checked against its column first, so that a value which does not fit raises with the columns
+        # left the same length.
+        self.check_parking_ticket(parking_ticket)
+        self.entry_times.append(parking_ticket.get_entry_time())
+        self.exit_times.append(parking_ticket.get_exit_time())
+        self.driver_ages.append(parking_ticket.get_driver_age())
+        self.parking_slots.append(parking_ticket.get_parking_slot())
+        if self.sorted_columns:
+            self.sorted_columns = {}
+
+    def check_parking_ticket(self, parking_ticket):
+        """
+        This method checks that the values of the parking ticket of a departed car fit in the columns of the history.
+        :param parking_ticket:obj Object of the ParkingTicket Class, its exit time is not checked if it is not set yet.
+        """
+
+        if parking_ticket.get_entry_time() is not None:
+            exit_time = parking_ticket.get_exit_time()
+            array('d', (parking_ticket.get_entry_time(), 0.0 if exit_time is None else exit_time))
+            array('q', (parking_ticket.get_driver_age(), parking_ticket.get_parking_slot()))
+
+    def extend(self, entry_times, exit_times, driver_ages, parking_slots):
+        """
+        This method adds the columns of many departed cars to the history at once, e.g. when loading historical data.
+        :param entry_times:iterable
+        :param exit_times:iterable
+        :param driver_ages:iterable
+        :param parking_slots:iterable
+        """
+
+        # The columns are built and checked before any of them is extended, so that invalid input leaves the history
+        # unchanged.
+        columns = (array('d', entry_times), array('d', exit_times), array('q', driver_ages), array('q', parking_slots))
+        if len(set(map(len, columns))) != 1:
+            raise ValueError('Columns of the history must have the same length')
+
+        for column, values in zip((self.entry_times, self.exit_times, self.driver_ages, self.parking_slots), columns):
+            column.extend(values)
+        self.sorted_columns = {}
+
+    def get_sorted_column(self, name):
+        """
+        This method returns a column sorted in increasing order, as a NumPy array or a list. The dwell_times column is
+        worked out from the entry and exit times.
+        :param name:str One of 'entry_times', 'exit_times' and 'dwell_times'.
+        :return: sorted_column:obj
+        """
+
+        sorted_column = self.sorted_columns.get(name)
+        if sorted_column is None:
+            if name == 'dwell_times':
+                if numpy is not None:
+                    sorted_column = numpy.sort(numpy.array(self.exit_times) - numpy.array(self.entry_times))
+                else:
+                    sorted_column = sorted(map(sub, self.exit_times, self.entry_times))
+            elif numpy is not None:
+                sorted_column = numpy.sort(numpy.array(getattr(self, name)))
+            else:
+                sorted_column = sorted(getattr(self, name))
+            self.sorted_columns[name] = sorted_column
+        return sorted_column
+
+    def get_occupancy(self, times):
+        """
+        This method returns the number of cars of the history parked at every time of times. A car is parked from
+        its entry time, included, to its exit time, excluded.
+        :param times:list List of times in seconds since the epoch.
+        :return: occupancy:list Number of parked cars at every time.
+        """
+
+        entry_times = self.get_sorted_column('entry_times')
+        exit_times = self.get_sorted_column('exit_times')
+
+        if numpy is not None:
+            times = numpy.asarray(times, dtype=numpy.float64)
+            return (numpy.searchsorted(entry_times, times, 'right') -
+                    numpy.searchsorted(exit_times, times, 'right')).tolist()
+        return [bisect_right(entry_times, time) - bisect_right(exit_times, time) for time in times]
+
+    def get_peak_occupancy(self):
+        """
+        This method returns the highest number of cars of the history parked at the same time, and the first time it
+        was reached. The occupancy only rises when a car enters, so it is looked up at every entry time.
+        :return: (peak_time:float, peak_occupancy:int) or (None, 0) if the history is empty.
+        """
+
+        if not len(self):
+            return None, 0
+
+        entry_times = self.get_sorted_column('entry_times')
+        exit_times = self.get_sorted_column('exit_times')
+
+        if numpy is not None:
+            occupancy = (numpy.searchsorted(entry_times, entry_times, 'right') -
+                         numpy.searchsorted(exit_times, entry_times, 'right'))
+            index = int(numpy.argmax(occupancy))
+            return float(entry_times[index]), int(occupancy[index])
+
+        occupancy = list(map(sub, map(bisect_right, repeat(entry_times), entry_times),
+                             map(bisect_right, repeat(exit_times), entry_times)))
+        peak_occupancy = max(occupancy)
+        return entry_times[occupancy.index(peak_occupancy)], peak_occupancy
+
+    def get_dwell_time_percentiles(self, percentiles=(50, 90, 99)):
+        """
+        This method returns the nearest-rank percentiles of the time the cars of the history were parked for.
+        :param percentiles:tuple Percentiles in the range (0..100].
+        :return: dwell_time_percentiles:dict Dictionary of percentile to dwell time in seconds.
+        """
+
+        if not len(self):
+            raise ValueError('No departed parking tickets in the history')
+
+        dwell_times = self.get_sorted_column('dwell_times')
+        return {percentile: float(dwell_times[min(max(ceil(percentile / 100 * len(dwell_times)) - 1, 0),
+                                                  len(dwell_times) - 1)])
+                for percentile in percentiles}
+
+    def get_driver_age_distribution(self, bucket_size=10):
+        """
+        This method returns the number of cars of the history per driver's age group of bucket_size years.
+        :param bucket_size:int Number of years in every driver's age group.
+        :return: driver_age_distribution:dict Dictionary of the lowest driver's age of every age group to the number
+        of cars, in increasing order of driver's age.
+        """
+
+        if numpy is not None:
+            age_groups, counts = numpy.unique(numpy.array(self.driver_ages) // bucket_size, return_counts=True)
+            return {int(age_group) * bucket_size: int(count) for age_group, count in zip(age_groups, counts)}
+
+        counts = Counter(map(floordiv, self.driver_ages, repeat(bucket_size)))
+        return {age_group * bucket_size: counts[age_group] for age_group in sorted(counts)}
@@ -0,0 +1,118 @@
+from threading import Lock
+
+from parking_management import ParkingManagement
+
+
+class ParkingLotManager:
+    """
+    This is the Class for Managing many parking lots of a site, each with several entry and exit terminals.
+    Every parking lot is a ParkingManagement shard with its own lock, so terminals of different parking lots never
+    wait on each other, while terminals of the same parking lot are serialized.
+    """
+
+    def __init__(self):
+        """
+        This constructor method is used to initialize the parking_lots, parking_lot_locks and parking_lots_lock
+        parameters of the class.
+        parking_lots -> It is initialized to an empty dictionary, it maps a lot id to its ParkingManagement shard.
+        parking_lot_locks -> It is initialized to an empty dictionary, it maps a lot id to the lock of its shard.
+        parking_lots_lock -> It is the lock held while a parking lot is added to parking_lots and parking_lot_locks.
+        """
+
+        self.parking_lots = {}
+        self.parking_lot_locks = {}
+        self.parking_lots_lock = Lock()
+
+    def create_parking_lot(self, lot_id, max_capacity, bay_counts=None):
+        """
+        This method creates the parking lot lot_id with max_capacity parking slots, replacing any previous parking lot
+        with the same lot id.
+        :param lot_id:hashable Id of the parking lot
+        :param max_capacity:int It denotes the maximum capacity of the parking lot.
+        :param bay_counts:list List of (bay_type:str, count:int) tuples of the parking bays, as in create_parking_slots
+        of ParkingManagement.
+        :return: status:boolean It returns True if the parking lot is successfully created.
+        """
+
+        with self.parking_lots_lock:
+            if lot_id not in self.parking_lots:
+                self.parking_lot_locks[lot_id] = Lock()
+                self.parking_lots[lot_id] = ParkingManagement()
+            parking_management, parking_lot_lock = self.parking_lots[lot_id], self.parking_lot_locks[lot_id]
+
+        with parking_lot_lock:
+            return parking_management.create_parking_slots(max_capacity, bay_counts)
+
+    def get_parking_lot(self, lot_id):
+        """
+        This method returns the ParkingManagement shard of the parking lot lot_id and its lock.
+        :param lot_id:hashable Id of the parking lot
+        :return: (parking_management, parking_lot_lock):tuple
+        """
+
+        try:
+            return self.parking_lots[lot_id], self.parking_lot_locks[lot_id]
+        except KeyError:
+            raise KeyError(f'Parking lot {lot_id} does not exist') from None
+
+    def issue_parking_ticket(self, lot_id, vehicle_registration_number, driver_age, vehicle_type='Car'):
+        """
+        This method is used to issue parking ticket to the car entering the parking lot lot_id.
+        :param lot_id:hashable Id of the parking lot
+        :param vehicle_registration_number:str Vehicle registration Number of the car
+        :param driver_age:int Age of the driver driving the car
+        :param vehicle_type:str Type of the vehicle
+        :return: parking_slot:int It returns the parking slot number allocated to the car, or -1 if the parking lot is
+        full.
+        """
+
+        parking_management, parking_lot_lock = self.get_parking_lot(lot_id)
+        with parking_lot_lock:
+            return parking_management.issue_parking_ticket(vehicle_registration_number, driver_age, vehicle_type)
+
+    def return_parking_ticket(self, lot_id, parking_slot_number):
+        """
+        This method is used to accept back the parking ticket of the car leaving the parking slot parking_slot_number
+        of the parking lot lot_id.
+        :param lot_id:hashable Id of the parking lot
+        :param parking_slot_number:int Parking Slot number that was allocated to the car.
+        :return: parking_ticket:obj or False:boolean based on the deallocate status of the parking slot.
+        """
+
+        parking_management, parking_lot_lock = self.get_parking_lot(lot_id)
+        with parking_lot_lock:
+            return parking_management.return_parking_ticket(parking_slot_number)
+
+    def execute_query(self, lot_id, query):
+        """
+        This method executes the query on the parking lot lot_id, and returns its output.
+        :param lot_id:hashable Id of the parking lot
+        :param query:str Command to be executed with arguments separated by " ".
+        :return: output:str Output of the query, or None if the query has no output.
+        """
+
+        parking_management, parking_lot_lock = self.get_parking_lot(lot_id)
+        with parking_lot_lock:
+            return parking_management.execute_query(query)
+
+    def get_parking_slot_number_from_vehicle_registration_number(self, vehicle_registration_number):
+        """
+        This method is used to look up the car with vehicle_registration_number across all the parking lots, locking one
+        parking lot at a time.
+        :param vehicle_registration_number:str Vehicle Registration Number of the Car
+        :return: (lot_id, parking_slot):tuple Id of the parking lot and parking slot number occupied by the car, or
+        (None, -1) if the car is not parked in any parking lot.
+        """
+
+        with self.parking_lots_lock:
+            parking_lot_ids = list(self.parking_lots)
+
+        for lot_id in parking_lot_ids:
+            parking_management, parking_lot_lock = self.get_parking_lot(lot_id)
+            with parking_lot_lock:
+                parking_slot = parking_management.get_parking_slot_number_from_vehicle_registration_number(
+                    vehicle_registration_number)
+            if parking_slot != -1:
+                return lot_id, parking_slot
+
+        return None, -1
@@ -1,9 +1,34 @@
-import argparse
 import sys
+import time
+from bisect import bisect_left, bisect_right, insort
 from heapq import heapify, heappush, heappop
 
+from command_parser import Command, parse_query
+from Models.BayPool import BayPool
 from Models.Car import Car
+from Models.ElectricCar import ElectricCar
+from Models.Motorcycle import Motorcycle
 from Models.ParkingTicket import ParkingTicket
+from Models.Truck import Truck
+from query_cache import QueryCache
+from registration_number_index import RegistrationNumberIndex
+from reservation_calendar import START_EVENT, ReservationCalendar
+
+# Number of characters read at once from the input file, and number of output lines written at once to the output file.
+CHUNK_SIZE = 1 << 20
+LINES_PER_WRITE = 4096
+
+# Vehicle types accepted by the Park command and the classes of their vehicles.
+VEHICLE_CLASSES = {'Motorcycle': Motorcycle, 'Car': Car, 'EV': ElectricCar, 'Truck': Truck}
+
+# Parking bay types a vehicle of each type can be parked in, in the order they are tried. A vehicle falls back to a
+# larger parking bay type once every parking bay of its own type is occupied.
+BAY_FALLBACKS = {
+    'Motorcycle': ('Motorcycle', 'Car', 'Truck'),
+    'Car': ('Car', 'Truck'),
+    'EV': ('EV', 'Car', 'Truck'),
+    'Truck': ('Truck',),
+}
 
 
 class ParkingManagement:
@@ -13,71 +38,240 @@ class ParkingManagement:
 
     def __init__(self):
         """
-        This constructor method is used to initialize the capacity, available_parking_slots and occupied_parking_slots
-        parameters of the class.
+        This constructor method is used to initialize the capacity, next_parking_slot, available_parking_slots,
+        occupied_parking_slots and the index parameters of the class.
         capacity -> It is initialized to zero.
-        available_parking_slots -> It is initialized to an empty list.
+        next_parking_slot -> It is initialized to one, it is the nearest parking slot which has never been allocated,
+        all the parking slots in the range [next_parking_slot..capacity] are vacant.
+        available_parking_slots -> It is initialized to an empty list, it is a min heap of the vacated parking slots
+        below next_parking_slot.
         occupied_parking_slots -> It is initialized to an empty dictionary.
+        parking_slot_tickets -> It is initialized to an empty dictionary, it maps an occupied parking slot number to
+        the parking ticket issued for it and is kept consistent with occupied_parking_slots.
+        driver_age_parking_tickets -> It is initialized to an empty dictionary, it maps a driver's age to a dictionary
+        of vehicle_registration_number to parking ticket, for all the parked cars whose driver is of that age.
+        driver_ages -> It is initialized to an empty list, it holds the keys of driver_age_parking_tickets in sorted
+        order for driver's age range queries.
+        registration_number_index -> It is initialized to an empty RegistrationNumberIndex, it holds the keys of
+        occupied_parking_slots for vehicle registration number prefix queries.
+        command_handlers -> It is initialized to None, it is set to the dispatch table of the predefined commands on
+        the first command.
+        metrics -> It is initialized to None, it is set to an object of the ParkingMetrics Class by enable_metrics.
+        bay_pools -> It is initialized to None, it maps a parking bay type to the BayPool of its parking bays when the
+        parking lot is created with parking bay types. Otherwise every parking slot fits every vehicle type.
+        bay_pool_first_parking_slots -> It is initialized to an empty list, it holds the first parking slot of every
+        BayPool in increasing order, for looking up the BayPool of a parking slot.
+        bay_pools_by_parking_slot -> It is initialized to an empty list, it holds the BayPools in the same order as
+        bay_pool_first_parking_slots.
+        clock -> It is initialized to time.time, it returns the entry and exit times stamped on the parking tickets.
+        history -> It is initialized to None, it is set to an object of the TicketHistory Class by enable_history.
+        reservation_calendar -> It is initialized to an empty ReservationCalendar, it holds the outstanding reservations
+        and the calendar of the events holding and releasing their parking slots.
+        query_cache -> It is initialized to an empty QueryCache, it holds the results and outputs of the driver's age
+        queries, which are invalidated for a driver's age whenever a car with a driver of that age parks or leaves.
+        ticket_store -> It is initialized to None, it is set to an object of the TicketStore Class by
+        enable_ticket_store, which then holds the values of the parking tickets of the parked cars.
         """
 
         self.capacity = 0
+        self.next_parking_slot = 1
         self.available_parking_slots = []
         self.occupied_parking_slots = {}
+        self.parking_slot_tickets = {}
+        self.driver_age_parking_tickets = {}
+        self.driver_ages = []
+        self.registration_number_index = RegistrationNumberIndex()
+        self.command_handlers = None
+        self.metrics = None
+        self.query_cache = QueryCache()
+        self.bay_pools = None
+        self.bay_pool_first_parking_slots = []
+        self.bay_pools_by_parking_slot = []
+        self.clock = time.time
+        self.history = None
+        self.reservation_calendar = ReservationCalendar()
+        self.ticket_store = None
 
-    def create_parking_slots(self, max_capacity):
+    def create_parking_slots(self, max_capacity, bay_counts=None):
         """
-        This method takes in the max capacity of the parking lot and returns a min heap for all available parking lots.
+        This method takes in the max capacity of the parking lot and creates an empty parking lot with parking slots in
+        the range [1..capacity]. Parking slots are handed out lazily from next_parking_slot, so only vacated parking
+        slots are ever pushed to the available_parking_slots min heap. Any car parked in the previous parking lot is
+        removed.
         :param max_capacity:int It denotes the maximum capacity of the parking lot.
-        :return: status:boolean It returns True if a min heap containing parking lots in the range [1..capacity],
+        :param bay_counts:list List of (bay_type:str, count:int) tuples of the parking bays, which are laid out from
+        parking slot 1 in order and must add up to max_capacity. Every parking slot fits every vehicle type if not
+        passed. A ValueError is raised for an invalid layout, and the parking lot is left as it was.
+        :return: status:boolean It returns True if the parking lot with parking slots in the range [1..capacity],
         is successfully created otherwise it return False if an exception is thrown in the process.
         """
 
+        # An invalid layout of parking bays raises, so that it is reported like the errors of the other commands.
+        bay_pools = self.get_bay_pools(int(max_capacity), bay_counts) if bay_counts else None
+
         try:
-            self.capacity = max_capacity
+            self.capacity = int(max_capacity)
 
-            # Creating empty available_parking_lots heap
-            heapify(self.available_parking_slots)
+            # Resetting the high-water mark to the first parking slot and emptying the available_parking_slots heap,
+            # occupied_parking_slots and the indexes built on it.
+            self.next_parking_slot = 1
+            self.available_parking_slots = []
+            self.occupied_parking_slots = {}
+            self.parking_slot_tickets = {}
+            self.driver_age_parking_tickets = {}
+            self.driver_ages = []
+            self.registration_number_index.clear()
+            self.reservation_calendar.clear()
+            self.query_cache.clear()
+            if self.ticket_store is not None:
+                self.ticket_store.clear()
 
-            # Adding parking_lots_index in the range [1..capacity] to the available_parking_lots_heap using heappush
-            # function.
-            for parking_slots_index in range(1, self.capacity + 1):
-                heappush(self.available_parking_slots, parking_slots_index)
+            self.bay_pools = bay_pools
+            if bay_pools is None:
+                self.bay_pools_by_parking_slot = []
+            else:
+                # Every parking slot is handed out by the BayPools, so the parking lot wide allocator is left empty.
+                self.next_parking_slot = self.capacity + 1
+                self.bay_pools_by_parking_slot = list(bay_pools.values())
+            self.bay_pool_first_parking_slots = [bay_pool.first_parking_slot
+                                                 for bay_pool in self.bay_pools_by_parking_slot]
 
             return True
         except Exception as exception:
             print(exception)
             return False
 
+    def get_bay_pools(self, capacity, bay_counts):
+        """
+        This method lays out the parking bays of a parking lot from parking slot 1, in the order of bay_counts, and
+        returns a BayPool for every parking bay type.
+        :param capacity:int Capacity of the parking lot
+        :param bay_counts:list List of (bay_type:str, count:int) tuples of the parking bays.
+        :return: bay_pools:dict Dictionary of parking bay type to its BayPool, in the order of the parking slots.
+        """
+
+        return BayPool.lay_out(capacity, bay_counts)
+
+    def get_nearest_empty_bay_parking_slot(self, vehicle_type):
+        """
+        This method returns the nearest vacant parking slot of the first parking bay type in BAY_FALLBACKS for the
+        vehicle type that has a vacant parking slot.
+        :param vehicle_type:str
+        :return: available_parking_slot:int The nearest available parking slot, or -1 if no parking bay the vehicle
+        fits in is vacant.
+        """
+
+        for bay_type in BAY_FALLBACKS[vehicle_type]:
+            bay_pool = self.bay_pools.get(bay_type)
+            if bay_pool is not None and bay_pool.has_empty_parking_slot():
+                return bay_pool.get_nearest_empty_parking_slot()
+        return -1
+
+    def release_parking_slot(self, parking_slot_number):
+        """
+        This method pushes a vacated parking slot back to the available_parking_slots min heap, or to the BayPool it
+        belongs to if the parking lot has parking bay types.
+        :param parking_slot_number:int Parking Slot Number which is vacated.
+        """
+
+        if self.bay_pools is None:
+            heappush(self.available_parking_slots, parking_slot_number)
+        else:
+            index = bisect_right(self.bay_pool_first_parking_slots, parking_slot_number) - 1
+            self.bay_pools_by_parking_slot[index].release_parking_slot(parking_slot_number)
+
     def get_nearest_empty_parking_slot(self):
         """
-        This method returns the minimum value from the available_parking_slots min heap.
+        This method returns the nearest vacant parking slot. Every vacated parking slot in the available_parking_slots
+        min heap is below next_parking_slot, so the heap is used first and next_parking_slot otherwise.
         :return: available_parking_slot:int The nearest available parking slot to the entry terminal.
         """
 
-        available_parking_slot = heappop(self.available_parking_slots)
+        if self.available_parking_slots:
+            return heappop(self.available_parking_slots)
+
+        # Raising the same error as heappop on an empty heap, when every parking slot is allocated.
+        if self.next_parking_slot > self.capacity:
+            raise IndexError('index out of range')
+
+        available_parking_slot = self.next_parking_slot
+        self.next_parking_slot += 1
         return available_parking_slot
 
+    def get_nearest_empty_parking_slots(self, count):
+        """
+        This method returns the count nearest vacant parking slots in one pass, taking the vacated parking slots from
+        the available_parking_slots min heap first and the parking slots from next_parking_slot onwards after that.
+        :param count:int Number of parking slots to return, it must not be more than the vacant parking slots.
+        :return: available_parking_slots:list The nearest available parking slots in increasing order.
+        """
+
+        # Raising the same error as heappop on an empty heap, before any parking slot is taken.
+        if count > len(self.available_parking_slots) + self.capacity - self.next_parking_slot + 1:
+            raise IndexError('index out of range')
+
+        if count >= len(self.available_parking_slots):
+            # Every vacated parking slot is taken, so the heap is sorted once instead of being popped one by one.
+            available_parking_slots = sorted(self.available_parking_slots)
+            self.available_parking_slots = []
+        else:
+            available_parking_slots = [heappop(self.available_parking_slots) for _ in range(count)]
+
+        remaining_count = count - len(available_parking_slots)
+        if remaining_count > 0:
+            available_parking_slots.extend(range(self.next_parking_slot, self.next_parking_slot + remaining_count))
+            self.next_parking_slot += remaining_count
+
+        return available_parking_slots
+
+    def get_vacant_parking_slot(self, vehicle_type):
+        """
+        This method takes the nearest vacant parking slot a vehicle of vehicle_type fits in out of the vacant parking
+        slots. The parking slots held for reservations are not vacant.
+        :param vehicle_type:str
+        :return: parking_slot:int The nearest vacant parking slot, or -1 if no parking slot is vacant.
+        """
+
+        if self.bay_pools is not None:
+            # Looking up the nearest vacant parking bay the vehicle fits in.
+            return self.get_nearest_empty_bay_parking_slot(vehicle_type)
+
+        # Checking if there are vacant slots available in the parking lot
+        if len(self.occupied_parking_slots) + self.reservation_calendar.held_parking_slots_count < self.capacity:
+            return self.get_nearest_empty_parking_slot()
+        return -1
+
     def allocate_parking_slot(self, car):
         """
-        This method is used to allocate the nearest available parking slot to the car entering the entry terminal.
-        :param car:obj Object of the Car Class, to which the parking slot has to be allocated.
+        This method is used to allocate the nearest available parking slot to the car entering the entry terminal. A car
+        arriving for its reservation is allocated the parking slot held for it, and a car arriving before the start of
+        its reservation uses up the reservation once it is allocated a parking slot. A car which is refused keeps its
+        reservation.
+        :param car:obj Object of the Car Class or any other vehicle class, to which the parking slot has to be
+        allocated.
         :return: parking_slot:int It returns the assigned parking_slot to car or -1 if no parking_slot is available.
         """
 
-        # Checking if there are vacant slots available in the parking lot
-        if len(self.occupied_parking_slots) < self.capacity:
-            parking_slot = self.get_nearest_empty_parking_slot()
-            vehicle_registration_number = car.get_registration_number()
+        entry_time = self.clock()
 
+        reservation = None
+        if self.reservation_calendar:
+            self.process_reservations(entry_time)
+            reservation = self.reservation_calendar.get_vehicle_reservation(car.get_registration_number())
+
+        if reservation is not None and reservation.get_status() == 'held':
+            parking_slot = self.reservation_calendar.finish(reservation, 'claimed')
+        else:
+            parking_slot = self.get_vacant_parking_slot(car.get_vehicle_type())
+            if reservation is not None and parking_slot != -1:
+                self.reservation_calendar.finish(reservation, 'claimed')
+
+        if parking_slot != -1:
             # A parking ticket is created for the car with vehicle registration number, driver's age and parking slot
             # assigned mentioned on the ticket.
-            parking_ticket = ParkingTicket(car, parking_slot)
+            parking_ticket = self.create_parking_ticket(car, parking_slot, entry_time)
 
-            # Set the parking_ticket as value to key vehicle_registration_number in the occupied_parking_slots
-            # dictionary.
-            self.occupied_parking_slots[vehicle_registration_number] = parking_ticket
-        else:
-            parking_slot = -1
+            self.add_parking_ticket(parking_ticket)
 
         return parking_slot
 
@@ -89,38 +283,192 @@ class ParkingManagement:
         :return: parking_ticket:obj or False:boolean based on the deallocate status of the parking slot.
         """
 
-        if len(self.occupied_parking_slots) > 0:
-            key = -1
-
-            # Looking up the vehicle_registration_number and parking_ticket for the car which is allocated
-            # the parking_slot_number passed as argument, in occupied_parking_slots dictionary.
-            for vehicle_registration_number, parking_ticket in self.occupied_parking_slots.items():
-                if parking_ticket.get_parking_slot() == parking_slot_number:
-                    key = vehicle_registration_number
-                    value = parking_ticket
-                    break
-            if key == -1:
-                # If no car found which is allocated the parking_slot_number passed as argument, return False.
-                return False
-            else:
-                # Deleting the entry for the car vacating the parking_slot and pushing the vacated parking slot number
-                # back to available_parking_slots min heap.
-                del self.occupied_parking_slots[key]
-                heappush(self.available_parking_slots, parking_slot_number)
-                return value
-        else:
+        parking_ticket = self.remove_parking_ticket(parking_slot_number)
+        if parking_ticket is None:
+            # If no car found which is allocated the parking_slot_number passed as argument, return False.
             return False
 
-    def issue_parking_ticket(self, vehicle_registration_number, driver_age):
+        # Pushing the vacated parking slot number back to available_parking_slots min heap.
+        self.release_parking_slot(parking_slot_number)
+        # The parking ticket is added to the history once the parking slot is vacant, so that the parking slot is not
+        # lost if the history cannot record it.
+        if self.history is not None:
+            self.history.add_parking_ticket(parking_ticket)
+        return parking_ticket
+
+    def add_parking_ticket(self, parking_ticket):
+        """
+        This method is used to add a parking ticket issued to a car to the occupied_parking_slots dictionary and the
+        indexes built on it. The parking slot on the ticket must already be taken out of the vacant parking slots.
+        :param parking_ticket:obj Object of the ParkingTicket Class, which is issued to a car.
+        """
+
+        vehicle_registration_number = parking_ticket.get_vehicle_registration_number()
+
+        # Set the parking_ticket as value to key vehicle_registration_number in the occupied_parking_slots
+        # dictionary, and as value to key parking_slot in the parking_slot_tickets dictionary.
+        # If the same vehicle_registration_number is parked again, its previous ticket is replaced in place in all the
+        # dictionaries so that they stay consistent with each other, and the car keeps its place in the query outputs.
+        # Its previous parking slot is vacated, so that it is not lost to the parking lot.
+        previous_parking_ticket = self.occupied_parking_slots.get(vehicle_registration_number)
+        if previous_parking_ticket is not None:
+            del self.parking_slot_tickets[previous_parking_ticket.get_parking_slot()]
+            self.release_parking_slot(previous_parking_ticket.get_parking_slot())
+            self.occupied_parking_slots[vehicle_registration_number] = parking_ticket
+            self.parking_slot_tickets[parking_ticket.get_parking_slot()] = parking_ticket
+            self.replace_in_driver_age_index(previous_parking_ticket, parking_ticket)
+            if self.ticket_store is not None:
+                self.ticket_store.remove_parking_ticket(previous_parking_ticket.get_parking_slot())
+            return
+
+        # The interned vehicle registration number is shared by the registration_number_index and the key of
+        # occupied_parking_slots.
+        vehicle_registration_number = self.registration_number_index.add(vehicle_registration_number)
+        self.occupied_parking_slots[vehicle_registration_number] = parking_ticket
+        self.parking_slot_tickets[parking_ticket.get_parking_slot()] = parking_ticket
+        self.add_to_driver_age_index(parking_ticket)
+
+    def remove_parking_ticket(self, parking_slot_number):
+        """
+        This method is used to remove the parking ticket of the car parked in parking_slot_number from the
+        occupied_parking_slots dictionary and the indexes built on it. The parking slot is not made vacant.
+        The exit time is stamped on the parking ticket.
+        :param parking_slot_number:int Parking Slot Number which is getting vacated.
+        :return: parking_ticket:obj or None if no car is parked in parking_slot_number.
+        """
+
+        # Looking up the parking_ticket for the car which is allocated the parking_slot_number passed as argument,
+        # in parking_slot_tickets dictionary.
+        parking_ticket = self.parking_slot_tickets.pop(parking_slot_number, None)
+        if parking_ticket is not None:
+            del self.occupied_parking_slots[parking_ticket.get_vehicle_registration_number()]
+            self.registration_number_index.remove(parking_ticket.get_vehicle_registration_number())
+            self.remove_from_driver_age_index(parking_ticket)
+            if self.ticket_store is not None:
+                # The values of the parking ticket are copied out of the ticket_store before its parking slot is reused.
+                parking_ticket = self.ticket_store.remove_parking_ticket(parking_slot_number)
+            parking_ticket.exit_time = self.clock()
+
+        return parking_ticket
+
+    def load_parking_tickets(self, parking_tickets):
+        """
+        This method is used to add the parking tickets of cars with distinct vehicle registration numbers to an empty
+        parking lot at once, building occupied_parking_slots and the indexes on it in bulk. The parking slots on the
+        tickets must already be taken out of the vacant parking slots.
+        :param parking_tickets:list List of objects of the ParkingTicket Class, in the order the cars were parked.
+        """
+
+        self.occupied_parking_slots = {parking_ticket.get_vehicle_registration_number(): parking_ticket
+                                       for parking_ticket in parking_tickets}
+        self.parking_slot_tickets = {parking_ticket.get_parking_slot(): parking_ticket
+                                     for parking_ticket in parking_tickets}
+        self.registration_number_index.load(self.occupied_parking_slots)
+
+        self.driver_age_parking_tickets = {}
+        for vehicle_registration_number, parking_ticket in self.occupied_parking_slots.items():
+            driver_age = parking_ticket.get_driver_age()
+            if driver_age not in self.driver_age_parking_tickets:
+                self.driver_age_parking_tickets[driver_age] = {}
+            self.driver_age_parking_tickets[driver_age][vehicle_registration_number] = parking_ticket
+        self.driver_ages = sorted(self.driver_age_parking_tickets)
+        self.query_cache.clear()
+
+    def add_to_driver_age_index(self, parking_ticket):
+        """
+        This method is used to add a parking ticket to the driver_age_parking_tickets dictionary, under the age of the
+        driver mentioned on the ticket. A new driver's age is also inserted in the sorted driver_ages list.
+        :param parking_ticket:obj Object of the ParkingTicket Class, which is issued to a car.
+        """
+
+        driver_age = parking_ticket.get_driver_age()
+        self.query_cache.invalidate_driver_age(driver_age)
+        parking_tickets = self.driver_age_parking_tickets.get(driver_age)
+        if parking_tickets is None:
+            parking_tickets = self.driver_age_parking_tickets[driver_age] = {}
+            insort(self.driver_ages, driver_age)
+        parking_tickets[parking_ticket.get_vehicle_registration_number()] = parking_ticket
+
+    def remove_from_driver_age_index(self, parking_ticket):
+        """
+        This method is used to remove a parking ticket from the driver_age_parking_tickets dictionary. The driver's age
+        is removed from the sorted driver_ages list, once no parked car has a driver of that age.
+        :param parking_ticket:obj Object of the ParkingTicket Class, which is returned by a car.
+        """
+
+        driver_age = parking_ticket.get_driver_age()
+        self.query_cache.invalidate_driver_age(driver_age)
+        parking_tickets = self.driver_age_parking_tickets[driver_age]
+        del parking_tickets[parking_ticket.get_vehicle_registration_number()]
+        if not parking_tickets:
+            del self.driver_age_parking_tickets[driver_age]
+            del self.driver_ages[bisect_left(self.driver_ages, driver_age)]
+
+    def replace_in_driver_age_index(self, previous_parking_ticket, parking_ticket):
+        """
+        This method is used to replace the parking ticket of a car parked again in the driver_age_parking_tickets
+        dictionary. Every driver's age holds its parking tickets in the order of occupied_parking_slots, so the new
+        parking ticket takes the place of the previous one, or the parking tickets of the new driver's age are put back
+        in that order.
+        :param previous_parking_ticket:obj Object of the ParkingTicket Class, which is replaced.
+        :param parking_ticket:obj Object of the ParkingTicket Class, which is issued to the car parked again.
+        """
+
+        driver_age = parking_ticket.get_driver_age()
+        if previous_parking_ticket.get_driver_age() == driver_age:
+            self.query_cache.invalidate_driver_age(driver_age)
+            self.driver_age_parking_tickets[driver_age][parking_ticket.get_vehicle_registration_number()] = \
+                parking_ticket
+            return
+
+        # A car parked again with another driver's age is rare, so the parking lot is scanned for its new driver's age.
+        self.remove_from_driver_age_index(previous_parking_ticket)
+        self.query_cache.invalidate_driver_age(driver_age)
+        if driver_age not in self.driver_age_parking_tickets:
+            insort(self.driver_ages, driver_age)
+        self.driver_age_parking_tickets[driver_age] = {
+            vehicle_registration_number: occupied_parking_ticket
+            for vehicle_registration_number, occupied_parking_ticket in self.occupied_parking_slots.items()
+            if occupied_parking_ticket.get_driver_age() == driver_age}
+
+    def create_vehicle(self, vehicle_registration_number, driver_age, vehicle_type='Car'):
+        """
+        This method creates an object of the vehicle class of vehicle_type in VEHICLE_CLASSES.
+        :param vehicle_registration_number:str Vehicle registration Number of the vehicle
+        :param driver_age:int Age of the driver driving the vehicle
+        :param vehicle_type:str Type of the vehicle
+        :return: vehicle:obj
+        """
+
+        if vehicle_type not in VEHICLE_CLASSES:
+            raise ValueError(f'Vehicle type not recognized - {vehicle_type}')
+        return VEHICLE_CLASSES[vehicle_type](vehicle_registration_number, driver_age)
+
+    def create_parking_ticket(self, vehicle, parking_slot, entry_time=None):
+        """
+        This method creates the parking ticket of a vehicle allocated the parking slot. The values of the parking ticket
+        are stored in the ticket_store if it is turned on.
+        :param vehicle:obj Object of the Car Class or any other vehicle class
+        :param parking_slot:int
+        :param entry_time:float Time the vehicle entered the parking lot in seconds since the epoch, or None if unknown.
+        :return: parking_ticket:obj Object of the ParkingTicket Class, or of the StoredParkingTicket Class.
+        """
+
+        if self.ticket_store is not None:
+            return self.ticket_store.add_parking_ticket(vehicle, parking_slot, entry_time)
+        return ParkingTicket(vehicle, parking_slot, entry_time)
+
+    def issue_parking_ticket(self, vehicle_registration_number, driver_age, vehicle_type='Car'):
         """
         This method is used to issue parking ticket to the car entering the parking lot from the entry terminal.
         :param vehicle_registration_number:str Vehicle registration Number of the car
         :param driver_age:int Age of the driver driving the car
+        :param vehicle_type:str Type of the vehicle, one of the keys of VEHICLE_CLASSES.
         :return: parking_slot:int It returns the parking slot number allocated to the car
         """
 
-        # Create an object of Class Car by passing vehicle_registration_number and driver_age as arguments.
-        car = Car(vehicle_registration_number, driver_age)
+        # Create an object of the vehicle class by passing vehicle_registration_number and driver_age as arguments.
+        car = self.create_vehicle(vehicle_registration_number, driver_age, vehicle_type)
 
         parking_slot = self.allocate_parking_slot(car)
 
@@ -136,6 +484,276 @@ class ParkingManagement:
 
         return self.deallocate_parking_slot(parking_slot_number)
 
+    def park_many(self, cars):
+        """
+        This method is used to issue parking tickets to many cars entering the parking lot at once. The nearest vacant
+        parking slots for all the cars are taken in one pass, and allocated to the cars in order.
+        :param cars:list List of (vehicle_registration_number:str, driver_age:int) or (vehicle_registration_number:str,
+        driver_age:int, vehicle_type:str) tuples of the cars
+        :return: parking_slots:list It returns the parking slot number allocated to each car, or -1 for the cars
+        that could not be parked because the parking lot is full.
+        """
+
+        cars = [self.create_vehicle(*car) for car in cars]
+        vehicle_registration_numbers = {car.get_registration_number() for car in cars}
+
+        if self.bay_pools is not None or self.reservation_calendar or len(vehicle_registration_numbers) < len(cars) \
+                or not vehicle_registration_numbers.isdisjoint(self.occupied_parking_slots):
+            # Every car looks up its own parking bay type or reservation, and a car parked again vacates its previous
+            # parking slot for the cars after it, so the cars are parked one at a time.
+            return [self.allocate_parking_slot(car) for car in cars]
+
+        # The parking slots are counted from the allocator, which hands out every vacant parking slot.
+        vacant_parking_slots_count = max(min(self.capacity - len(self.occupied_parking_slots),
+                                             len(self.available_parking_slots) + self.capacity -
+                                             self.next_parking_slot + 1), 0)
+        parking_slots = self.get_nearest_empty_parking_slots(min(len(cars), vacant_parking_slots_count))
+
+        entry_time = self.clock()
+        for car, parking_slot in zip(cars, parking_slots):
+            self.add_parking_ticket(self.create_parking_ticket(car, parking_slot, entry_time))
+
+        parking_slots.extend([-1] * (len(cars) - len(parking_slots)))
+        return parking_slots
+
+    def reserve_parking_slot(self, vehicle_registration_number, start_time, end_time, vehicle_type='Car'):
+        """
+        This method is used to book a parking slot for a car in advance, for the time window [start_time..end_time).
+        The nearest vacant parking slot is held for the car from the start of the time window, and it is released if
+        the car has not arrived by the no-show deadline of the reservation_calendar. The reservation is unavailable
+        right away if the parking slots the vehicle fits in are all booked at some time in the time window.
+        :param vehicle_registration_number:str Vehicle registration Number of the car
+        :param start_time:float Start of the time window in seconds since the epoch.
+        :param end_time:float End of the time window in seconds since the epoch.
+        :param vehicle_type:str Type of the vehicle, one of the keys of VEHICLE_CLASSES.
+        :return: reservation:obj Object of the Reservation Class.
+        """
+
+        if vehicle_type not in VEHICLE_CLASSES:
+            raise ValueError(f'Vehicle type not recognized - {vehicle_type}')
+
+        start_time, end_time = float(start_time), float(end_time)
+        if self.bay_pools is None:
+            reservable_parking_slots_count = self.capacity
+            competing_vehicle_types = None
+        else:
+            # Counting the parking bays the vehicle fits in, and the reservations of every vehicle type that fits in
+            # any of them.
+            bay_types = set(BAY_FALLBACKS[vehicle_type]).intersection(self.bay_pools)
+            reservable_parking_slots_count = sum(self.bay_pools[bay_type].last_parking_slot -
+                                                 self.bay_pools[bay_type].first_parking_slot + 1
+                                                 for bay_type in bay_types)
+            competing_vehicle_types = {other_vehicle_type for other_vehicle_type, bay_fallbacks in BAY_FALLBACKS.items()
+                                       if bay_types.intersection(bay_fallbacks)}
+        booked_parking_slots_count = self.reservation_calendar.get_peak_reservations_count(start_time, end_time,
+                                                                                           competing_vehicle_types)
+
+        reservation = self.reservation_calendar.book(vehicle_registration_number, start_time, end_time, vehicle_type)
+        if booked_parking_slots_count >= reservable_parking_slots_count:
+            self.reservation_calendar.finish(reservation, 'unavailable')
+            return reservation
+
+        # A time window which has already started holds its parking slot right away.
+        self.process_reservations()
+        return reservation
+
+    def cancel_reservation(self, reservation_id):
+        """
+        This method is used to cancel an outstanding reservation, releasing the parking slot held for it.
+        :param reservation_id:int
+        :return: reservation:obj Object of the Reservation Class.
+        """
+
+        reservation = self.reservation_calendar.get_reservation(reservation_id)
+        parking_slot = self.reservation_calendar.finish(reservation, 'cancelled')
+        if parking_slot is not None:
+            self.release_parking_slot(parking_slot)
+        return reservation
+
+    def process_reservations(self, now=None):
+        """
+        This method applies the events of the reservation_calendar due at or before now. At the start of its time
+        window, the nearest vacant parking slot is held for a reservation, or the reservation becomes unavailable if
+        the parking lot is full. At its no-show deadline, the parking slot held for a car that has not arrived is
+        released.
+        :param now:float Current time in seconds since the epoch, it defaults to the time returned by clock.
+        """
+
+        if now is None:
+            now = self.clock()
+
+        for event, reservation in self.reservation_calendar.pop_due_events(now):
+            if event == START_EVENT:
+                parking_slot = self.get_vacant_parking_slot(reservation.vehicle_type)
+                if parking_slot == -1:
+                    self.reservation_calendar.finish(reservation, 'unavailable')
+                else:
+                    self.reservation_calendar.hold(reservation, parking_slot)
+            else:
+                self.release_parking_slot(self.reservation_calendar.finish(reservation, 'expired'))
+
+    def leave_many(self, parking_slot_numbers):
+        """
+        This method is used to accept back the parking tickets of many cars leaving the parking lot at once. The
+        vacated parking slots are pushed back to the available_parking_slots min heap in one pass.
+        :param parking_slot_numbers:list Parking Slot numbers that were allocated to the cars.
+        :return: parking_tickets:list It returns the parking ticket for each vacated parking slot, or False for the
+        parking slots that could not be vacated.
+        """
+
+        # Hashing every parking slot number, and checking that the history can record every parking ticket, first, so
+        # that an invalid one raises before any parking ticket is removed and execute_batch can execute the commands
+        # again one at a time.
+        for parking_slot_number in parking_slot_numbers:
+            hash(parking_slot_number)
+            if self.history is not None and parking_slot_number in self.parking_slot_tickets:
+                self.history.check_parking_ticket(self.parking_slot_tickets[parking_slot_number])
+
+        parking_tickets = []
+        vacated_parking_slots = []
+
+        for parking_slot_number in parking_slot_numbers:
+            parking_ticket = self.remove_parking_ticket(parking_slot_number)
+            if parking_ticket is None:
+                parking_tickets.append(False)
+            else:
+                parking_tickets.append(parking_ticket)
+                vacated_parking_slots.append(parking_slot_number)
+
+        # Re-heapifying is linear in the heap size, so it is only used when pushing one by one would cost more.
+        if self.bay_pools is not None:
+            for parking_slot_number in vacated_parking_slots:
+                self.release_parking_slot(parking_slot_number)
+        elif len(vacated_parking_slots) > len(self.available_parking_slots):
+            self.available_parking_slots.extend(vacated_parking_slots)
+            heapify(self.available_parking_slots)
+        else:
+            for parking_slot_number in vacated_parking_slots:
+                heappush(self.available_parking_slots, parking_slot_number)
+
+        if self.history is not None:
+            for parking_ticket in parking_tickets:
+                if parking_ticket:
+                    self.history.add_parking_ticket(parking_ticket)
+
+        return parking_tickets
+
+    def get_batch_command_methods(self):
+        """
+        This method returns the methods executing each command of execute_batch, one command at a time.
+        :return: command_methods:dict Dictionary of command name to the method executing it.
+        """
+
+        return {
+            'Create_parking_lot': self.create_parking_slots,
+            'Park': self.issue_parking_ticket,
+            'Leave': self.return_parking_ticket,
+            'Slot_number_for_car_with_number': self.get_parking_slot_number_from_vehicle_registration_number,
+            'Slot_numbers_for_driver_of_age': self.get_parking_slots_from_driver_age,
+            'Vehicle_registration_number_for_driver_of_age': self.get_vehicle_registration_numbers_from_driver_age,
+            'Slot_numbers_for_car_with_number_prefix': self.get_parking_tickets_from_vehicle_registration_number_prefix,
+            'Reserve': self.reserve_parking_slot,
+            'Cancel_reservation': self.cancel_reservation,
+        }
+
+    def execute_batch_commands_one_by_one(self, commands):
+        """
+        This method executes the commands of a batch one at a time, and returns their results.
+        :param commands:list List of commands to be executed in order, in the format accepted by execute_batch.
+        :return: results:list It returns, for each command, the value returned by the method executing it, or the
+        exception raised by it.
+        """
+
+        command_methods = self.get_batch_command_methods()
+
+        results = []
+        for command in commands:
+            try:
+                if command[0] not in command_methods:
+                    raise ValueError(f'Command not recognized - {command[0]}')
+                results.append(command_methods[command[0]](*command[1:]))
+            except Exception as exception:
+                results.append(exception)
+
+        return results
+
+    def get_batch_command(self, command):
+        """
+        This method converts a command of execute_batch to a tuple of the command name followed by its typed arguments.
+        :param command:obj Object of the Command Class, or a tuple which is returned as it is.
+        :return: batch_command:tuple or the exception for a Command object that could not be parsed.
+        """
+
+        if not isinstance(command, Command):
+            return command
+        if command.name is None:
+            return ValueError('Query not recognized.')
+        if command.error is not None:
+            return command.error
+        return command.get_batch_command()
+
+    def execute_batch(self, commands):
+        """
+        This method executes a batch of commands without parsing them from strings, and returns their results instead
+        of printing them. Consecutive Park and Leave commands are applied together through park_many and leave_many.
+
+        Commands are objects of the Command Class returned by parse_query, or tuples of the command name followed by
+        its typed arguments :
+        1. ('Create_parking_lot', capacity:int) or ('Create_parking_lot', capacity:int, bay_counts:tuple)
+        2. ('Park', vehicle_registration_number:str, driver_age:int) or ('Park', vehicle_registration_number:str,
+        driver_age:int, vehicle_type:str)
+        3. ('Leave', parking_slot:int)
+        4. ('Slot_number_for_car_with_number', vehicle_registration_number:str)
+        5. ('Slot_numbers_for_driver_of_age', age:int)
+        6. ('Vehicle_registration_number_for_driver_of_age', age:int)
+        7. ('Slot_numbers_for_car_with_number_prefix', prefix:str)
+        8. ('Reserve', vehicle_registration_number:str, start_time:float, end_time:float) or ('Reserve',
+        vehicle_registration_number:str, start_time:float, end_time:float, vehicle_type:str)
+        9. ('Cancel_reservation', reservation_id:int)
+
+        :param commands:list List of commands to be executed in order.
+        :return: results:list It returns, for each command, the value returned by the method executing it, or the
+        exception raised by it.
+        """
+
+        bulk_methods = {'Park': self.park_many, 'Leave': self.leave_many}
+
+        # Command objects are converted to tuples, and the ones that could not be parsed are replaced by their error,
+        # which is returned as their result.
+        commands = [self.get_batch_command(command) for command in commands]
+
+        results = []
+        index = 0
+        while index < len(commands):
+            if isinstance(commands[index], Exception):
+                results.append(commands[index])
+                index += 1
+                continue
+
+            command_name = commands[index][0]
+
+            if command_name in bulk_methods:
+                # Collecting the run of consecutive commands with the same name and executing it at once.
+                end = index + 1
+                while end < len(commands) and not isinstance(commands[end], Exception) and \
+                        commands[end][0] == command_name:
+                    end += 1
+                try:
+                    arguments = [command[1:] if command_name == 'Park' else command[1]
+                                 for command in commands[index:end]]
+                    results.extend(bulk_methods[command_name](arguments))
+                except Exception:
+                    # The bulk method validates every argument before changing the parking lot, so the run is
+                    # executed again one command at a time to find out which commands are failing.
+                    results.extend(self.execute_batch_commands_one_by_one(commands[index:end]))
+                index = end
+                continue
+
+            results.extend(self.execute_batch_commands_one_by_one(commands[index:index + 1]))
+            index += 1
+
+        return results
+
     def get_parking_slot_number_from_vehicle_registration_number(self, vehicle_registration_number):
         """
         This method is used to look up the occupied_parking_slots dictionary and return the assigned parking_slot number
@@ -153,39 +771,97 @@ class ParkingManagement:
 
         return parking_slot
 
+    def get_parking_tickets_from_vehicle_registration_number_prefix(self, prefix):
+        """
+        This method is used to look up the registration_number_index and return the parking tickets for the cars whose
+        vehicle registration number starts with the prefix passed as argument. A trailing "*" of the prefix is ignored.
+        :param prefix:str Prefix of the vehicle registration number, e.g. "KA-01-" or "KA-01-*".
+        :return: parking_tickets:list List of parking tickets ordered by region code and vehicle registration number.
+        """
+
+        return [self.occupied_parking_slots[vehicle_registration_number] for vehicle_registration_number in
+                self.registration_number_index.get_vehicle_registration_numbers_with_prefix(prefix.rstrip('*'))]
+
     def get_vehicle_registration_numbers_from_driver_age(self, driver_age):
         """
-        This method is used to look up the occupied_parking_slots dictionary and return the vehicle registration numbers
-        for the cars whose driver's age matches with the driver_age passed as argument in the parking ticket.
+        This method is used to look up the driver_age_parking_tickets dictionary and return the vehicle registration
+        numbers for the cars whose driver's age matches with the driver_age passed as argument in the parking ticket.
         :param driver_age:int Age of the driver
         :return: vehicle_registration_numbers:list List of all vehicle_registration_numbers for which driver's age
         matches with the driver_age passed as argument in the parking ticket.
         """
 
-        vehicle_registration_numbers = []
-
-        for vehicle_registration_number, parking_ticket in self.occupied_parking_slots.items():
-            if parking_ticket.get_driver_age() == driver_age:
-                vehicle_registration_numbers.append(vehicle_registration_number)
+        # The cached result is a tuple, so a copy is returned to keep it unchanged.
+        key = ('vehicle_registration_numbers', driver_age)
+        vehicle_registration_numbers = self.query_cache.get(key)
+        if vehicle_registration_numbers is None:
+            vehicle_registration_numbers = tuple(self.driver_age_parking_tickets.get(driver_age, ()))
+            self.query_cache.put(key, driver_age, vehicle_registration_numbers)
 
-        return vehicle_registration_numbers
+        return list(vehicle_registration_numbers)
 
     def get_parking_slots_from_driver_age(self, driver_age):
         """
-        This method is used to look up the occupied_parking_slots dictionary and return the allocated parking_slots
+        This method is used to look up the driver_age_parking_tickets dictionary and return the allocated parking_slots
         for the cars whose driver's age matches with the driver_age passed as argument in the parking ticket.
         :param driver_age:int Age of the driver
         :return: parking_slots:list List of parking_slots allocated to the cars for which driver's age
         matches with the driver_age passed as argument in the parking ticket.
         """
 
-        parking_slots = []
+        # The cached result is a tuple, so a copy is returned to keep it unchanged.
+        key = ('parking_slots', driver_age)
+        parking_slots = self.query_cache.get(key)
+        if parking_slots is None:
+            parking_tickets = self.driver_age_parking_tickets.get(driver_age, {})
+            parking_slots = tuple(parking_ticket.get_parking_slot() for parking_ticket in parking_tickets.values())
+            self.query_cache.put(key, driver_age, parking_slots)
 
-        for parking_ticket in self.occupied_parking_slots.values():
-            if parking_ticket.get_driver_age() == driver_age:
-                parking_slots.append(parking_ticket.get_parking_slot())
+        return list(parking_slots)
 
-        return parking_slots
+    def get_parking_tickets_from_driver_age_range(self, min_driver_age, max_driver_age):
+        """
+        This method is used to look up the sorted driver_ages list and return the parking tickets for the cars whose
+        driver's age lies in the range [min_driver_age..max_driver_age], ordered by driver's age.
+        :param min_driver_age:int Minimum age of the driver
+        :param max_driver_age:int Maximum age of the driver
+        :return: parking_tickets:list List of parking tickets for which driver's age lies in the range.
+        """
+
+        parking_tickets = []
+
+        start = bisect_left(self.driver_ages, min_driver_age)
+        end = bisect_right(self.driver_ages, max_driver_age)
+        for driver_age in self.driver_ages[start:end]:
+            parking_tickets.extend(self.driver_age_parking_tickets[driver_age].values())
+
+        return parking_tickets
+
+    def get_vehicle_registration_numbers_from_driver_age_range(self, min_driver_age, max_driver_age):
+        """
+        This method is used to return the vehicle registration numbers for the cars whose driver's age lies in the
+        range [min_driver_age..max_driver_age], ordered by driver's age.
+        :param min_driver_age:int Minimum age of the driver
+        :param max_driver_age:int Maximum age of the driver
+        :return: vehicle_registration_numbers:list List of all vehicle_registration_numbers for which driver's age
+        lies in the range.
+        """
+
+        return [parking_ticket.get_vehicle_registration_number()
+                for parking_ticket in self.get_parking_tickets_from_driver_age_range(min_driver_age, max_driver_age)]
+
+    def get_parking_slots_from_driver_age_range(self, min_driver_age, max_driver_age):
+        """
+        This method is used to return the allocated parking_slots for the cars whose driver's age lies in the range
+        [min_driver_age..max_driver_age], ordered by driver's age.
+        :param min_driver_age:int Minimum age of the driver
+        :param max_driver_age:int Maximum age of the driver
+        :return: parking_slots:list List of parking_slots allocated to the cars for which driver's age lies in the
+        range.
+        """
+
+        return [parking_ticket.get_parking_slot()
+                for parking_ticket in self.get_parking_tickets_from_driver_age_range(min_driver_age, max_driver_age)]
 
     def parse_commands(self, query):
         """
@@ -193,112 +869,398 @@ class ParkingManagement:
         to be executed, and prints the output to the console or writes it to a output file based on the mode selected.
 
         Predefined Commands :
-        1. Create_parking_lot <capacity:int>
-        2. Park <vehicle_registration_number:str> driver_age <age:int>
+        1. Create_parking_lot <capacity:int> [bays <bay_type:str> <count:int>...]
+        2. Park <vehicle_registration_number:str> driver_age <age:int> [vehicle_type <vehicle_type:str>]
         3. Leave <parking_slot:int>
         4. Slot_number_for_car_with_number <vehicle_registration_number:str>
         5. Slot_numbers_for_driver_of_age <age:int>
         6. Vehicle_registration_number_for_driver_of_age <age:int>
+        7. Slot_numbers_for_car_with_number_prefix <prefix:str>
+        8. Reserve <vehicle_registration_number:str> from <start_time:float> to <end_time:float>
+        [vehicle_type <vehicle_type:str>]
+        9. Cancel_reservation <reservation_id:int>
 
         :param query:str Command to be executed with arguments separated by " ".
         """
 
-        if query.startswith('Create_parking_lot'):
-            try:
-                capacity = int(query.split(' ')[1])
-                status = self.create_parking_slots(capacity)
-                if status:
-                    print(f'Created parking of {capacity} slots')
+        output = self.execute_query(query)
+        if output is not None:
+            print(output)
 
-            except Exception as exception:
-                print(f'Error in Query - {query} : {exception}')
+    def get_command_handlers(self):
+        """
+        This method returns the dispatch table of the predefined commands.
+        :return: command_handlers:dict Dictionary of command name to the method executing the command with its typed
+        arguments and returning its output.
+        """
 
-        elif query.startswith('Park'):
-            try:
-                vehicle_registration_number = query.split(' ')[1]
-                driver_age = query.split(' ')[3]
-                result = self.issue_parking_ticket(vehicle_registration_number, driver_age)
-                if result == -1:
-                    print('Sorry, Parking Lot is full, No Parking Slots Available.')
-                else:
-                    print(
-                        f'Car with vehicle registration number "{vehicle_registration_number}" has been parked at '
-                        f'slot number {result}')
-            except Exception as exception:
-                print(f'Error in Query - {query} : {exception}')
+        return {
+            'Create_parking_lot': self.execute_create_parking_lot_command,
+            'Park': self.execute_park_command,
+            'Leave': self.execute_leave_command,
+            'Slot_number_for_car_with_number': self.execute_slot_number_for_car_with_number_command,
+            'Vehicle_registration_number_for_driver_of_age':
+                self.execute_vehicle_registration_number_for_driver_of_age_command,
+            'Slot_numbers_for_driver_of_age': self.execute_slot_numbers_for_driver_of_age_command,
+            'Slot_numbers_for_car_with_number_prefix': self.execute_slot_numbers_for_car_with_number_prefix_command,
+            'Reserve': self.execute_reserve_command,
+            'Cancel_reservation': self.execute_cancel_reservation_command,
+        }
 
-        elif query.startswith('Leave'):
-            try:
-                leaving_parking_slot = int(query.split(' ')[1])
-                parking_ticket = self.return_parking_ticket(leaving_parking_slot)
-                if parking_ticket:
-                    print(f'Slot number {parking_ticket.get_parking_slot()} vacated, the car with vehicle registration '
-                          f'number "{parking_ticket.get_vehicle_registration_number()}" left the space, the driver of '
-                          f'the car was of age {parking_ticket.get_driver_age()}')
-                else:
-                    print(f'Slot number {leaving_parking_slot} cannot be vacated.')
-            except Exception as exception:
-                print(f'Error in Query - {query} : {exception}')
+    def execute_query(self, query):
+        """
+        This method parses the query into a Command object and executes it, returning its output.
+        :param query:str Command to be executed with arguments separated by " ".
+        :return: output:str Output of the query, without the trailing new line, or None if the query has no output.
+        """
 
-        elif query.startswith('Slot_number_for_car_with_number'):
-            try:
-                car_registration_number = query.split(' ')[1]
+        return self.execute_command(parse_query(query))
 
-                parking_slot = self.get_parking_slot_number_from_vehicle_registration_number(car_registration_number)
+    def execute_queries(self, queries):
+        """
+        This method executes many queries in order and returns their outputs, which are the same as calling
+        execute_query for every query. Runs of consecutive Park and Leave commands are executed together through
+        execute_batch, unless metrics are turned on as they measure every command on its own.
+        :param queries:list List of commands to be executed with arguments separated by " ".
+        :return: outputs:list Output of every query, without the trailing new line, or None if the query has no output.
+        """
 
-                if parking_slot == -1:
-                    print('No parked car matches the query')
-                else:
-                    print(parking_slot)
-            except Exception as exception:
-                print(f'Error in Query - {query} : {exception}')
+        commands = [parse_query(query) for query in queries]
+        if self.metrics is not None:
+            return [self.execute_command(command) for command in commands]
 
-        elif query.startswith('Vehicle_registration_number_for_driver_of_age'):
-            try:
-                driver_age = int(query.split(' ')[1])
+        output_methods = {'Park': self.get_park_command_output, 'Leave': self.get_leave_command_output}
 
-                vehicle_registration_numbers = self.get_vehicle_registration_numbers_from_driver_age(driver_age)
+        outputs = []
+        index = 0
+        while index < len(commands):
+            command = commands[index]
+            if command.name not in output_methods or command.error is not None:
+                outputs.append(self.execute_command(command))
+                index += 1
+                continue
 
-                if len(vehicle_registration_numbers) > 0:
-                    print(','.join(vehicle_registration_numbers))
+            # Collecting the run of consecutive parsed commands with the same name and executing it at once.
+            end = index + 1
+            while end < len(commands) and commands[end].name == command.name and commands[end].error is None:
+                end += 1
+            for run_command, result in zip(commands[index:end], self.execute_batch(commands[index:end])):
+                if isinstance(result, Exception):
+                    outputs.append(f'Error in Query - {run_command.query} : {result}')
                 else:
-                    print('No parked car matches the query')
-            except Exception as exception:
-                print(f'Error in Query - {query} : {exception}')
+                    outputs.append(output_methods[command.name](result, *run_command.arguments))
+            index = end
 
-        elif query.startswith('Slot_numbers_for_driver_of_age'):
-            try:
-                driver_age = int(query.split(' ')[1])
+        return outputs
 
-                parking_slots = self.get_parking_slots_from_driver_age(driver_age)
-                if len(parking_slots) > 0:
-                    print(','.join([str(parking_slot) for parking_slot in parking_slots]))
-                else:
-                    print('No parked car matches the query')
-            except Exception as exception:
-                print(f'Error in Query - {query} : {exception}')
+    def execute_command(self, command):
+        """
+        This method executes a parsed command and returns its output, measuring it if metrics are turned on.
+        :param command:obj Object of the Command Class.
+        :return: output:str Output of the command, without the trailing new line, or None if the command has no output.
+        """
 
-        else:
-            print('Query not recognized.')
+        if self.metrics is not None:
+            return self.metrics.measure_command(self.dispatch_command, command)
+        return self.dispatch_command(command)
 
+    def dispatch_command(self, command):
+        """
+        This method executes a parsed command through the dispatch table returned by get_command_handlers, and returns
+        its output.
+        :param command:obj Object of the Command Class.
+        :return: output:str Output of the command, without the trailing new line, or None if the command has no output.
+        """
 
-if __name__ == '__main__':
-    # Creates an object of Main Class Parking Management
-    parking_management = ParkingManagement()
+        if command.name is None:
+            return 'Query not recognized.'
+        if command.error is not None:
+            return f'Error in Query - {command.query} : {command.error}'
+
+        if self.command_handlers is None:
+            self.command_handlers = self.get_command_handlers()
+
+        try:
+            return self.command_handlers[command.name](*command.arguments)
+        except Exception as exception:
+            return f'Error in Query - {command.query} : {exception}'
+
+    def enable_metrics(self, metrics=None):
+        """
+        This method turns on the collection of metrics for every command executed through execute_command.
+        :param metrics:obj Object of the ParkingMetrics Class, a new one is created if not passed.
+        :return: metrics:obj The object of the ParkingMetrics Class collecting the metrics.
+        """
+
+        from parking_metrics import ParkingMetrics
+
+        self.metrics = metrics or ParkingMetrics()
+        return self.metrics
+
+    def disable_metrics(self):
+        """
+        This method turns off the collection of metrics.
+        """
+
+        self.metrics = None
+
+    def enable_history(self, history=None):
+        """
+        This method turns on the recording of the parking tickets of the departed cars in a columnar history.
+        :param history:obj Object of the TicketHistory Class, a new one is created if not passed.
+        :return: history:obj The object of the TicketHistory Class recording the parking tickets.
+        """
+
+        from parking_history import TicketHistory
+
+        self.history = history if history is not None else TicketHistory()
+        return self.history
+
+    def disable_history(self):
+        """
+        This method turns off the recording of the parking tickets of the departed cars.
+        """
+
+        self.history = None
+
+    def enable_ticket_store(self, ticket_store=None):
+        """
+        This method turns on the compact storage of the parking tickets of the parked cars in a columnar TicketStore,
+        instead of a ParkingTicket, vehicle and Driver object per parked car. The parked cars are moved to it.
+        :param ticket_store:obj Object of the TicketStore Class, a new one is created if not passed.
+        :return: ticket_store:obj The object of the TicketStore Class holding the parking tickets.
+        """
+
+        from Models.TicketStore import TicketStore
+
+        self.disable_ticket_store()
+        parking_tickets = list(self.occupied_parking_slots.values())
+        self.ticket_store = ticket_store if ticket_store is not None else TicketStore(VEHICLE_CLASSES)
+        self.ticket_store.clear()
+        self.load_parking_tickets([
+            self.ticket_store.add_parking_ticket(parking_ticket.get_vehicle(), parking_ticket.get_parking_slot(),
+                                                 parking_ticket.get_entry_time())
+            for parking_ticket in parking_tickets])
+        return self.ticket_store
+
+    def disable_ticket_store(self):
+        """
+        This method turns off the TicketStore, and moves the parked cars back to ParkingTicket objects.
+        """
+
+        if self.ticket_store is None:
+            return
+        parking_tickets = [ParkingTicket(parking_ticket.get_vehicle(), parking_ticket.get_parking_slot(),
+                                         parking_ticket.get_entry_time())
+                           for parking_ticket in self.occupied_parking_slots.values()]
+        self.ticket_store = None
+        self.load_parking_tickets(parking_tickets)
+
+    def execute_create_parking_lot_command(self, capacity, bay_counts=None):
+        """
+        This method executes the command Create_parking_lot <capacity:int> [bays <bay_type:str> <count:int>...] and
+        returns its output.
+        :param capacity:int
+        :param bay_counts:tuple
+        :return: output:str or None if the parking lot could not be created.
+        """
+
+        status = self.create_parking_slots(capacity, bay_counts)
+        if status:
+            return f'Created parking of {capacity} slots'
+        return None
+
+    def execute_park_command(self, vehicle_registration_number, driver_age, vehicle_type='Car'):
+        """
+        This method executes the command Park <vehicle_registration_number:str> driver_age <age:int>
+        [vehicle_type <vehicle_type:str>] and returns its output.
+        :param vehicle_registration_number:str
+        :param driver_age:int
+        :param vehicle_type:str
+        :return: output:str
+        """
 
-    parser = argparse.ArgumentParser()
-    parser.add_argument('--input_file', action="store", required=True, dest='input_file', help="Input File")
-    parser.add_argument('--output_file', action="store", required=False, dest='output_file', help="Output File")
+        result = self.issue_parking_ticket(vehicle_registration_number, driver_age, vehicle_type)
+        return self.get_park_command_output(result, vehicle_registration_number)
 
-    args = parser.parse_args()
+    def get_park_command_output(self, parking_slot, vehicle_registration_number, *arguments):
+        """
+        This method returns the output of the command Park for the parking slot allocated to the car.
+        :param parking_slot:int Parking slot allocated to the car, or -1 if the parking lot is full.
+        :param vehicle_registration_number:str
+        :param arguments:tuple The other arguments of the command, which are not part of the output.
+        :return: output:str
+        """
+
+        if parking_slot == -1:
+            return 'Sorry, Parking Lot is full, No Parking Slots Available.'
+        return (f'Car with vehicle registration number "{vehicle_registration_number}" has been parked at '
+                f'slot number {parking_slot}')
+
+    def execute_leave_command(self, leaving_parking_slot):
+        """
+        This method executes the command Leave <parking_slot:int> and returns its output.
+        :param leaving_parking_slot:int
+        :return: output:str
+        """
+
+        parking_ticket = self.return_parking_ticket(leaving_parking_slot)
+        return self.get_leave_command_output(parking_ticket, leaving_parking_slot)
+
+    def get_leave_command_output(self, parking_ticket, leaving_parking_slot):
+        """
+        This method returns the output of the command Leave for the parking ticket returned by the car.
+        :param parking_ticket:obj or False if the parking slot could not be vacated.
+        :param leaving_parking_slot:int
+        :return: output:str
+        """
+
+        if parking_ticket:
+            return (f'Slot number {parking_ticket.get_parking_slot()} vacated, the car with vehicle registration '
+                    f'number "{parking_ticket.get_vehicle_registration_number()}" left the space, the driver of '
+                    f'the car was of age {parking_ticket.get_driver_age()}')
+        return f'Slot number {leaving_parking_slot} cannot be vacated.'
+
+    def execute_slot_number_for_car_with_number_command(self, car_registration_number):
+        """
+        This method executes the command Slot_number_for_car_with_number <vehicle_registration_number:str> and returns
+        its output.
+        :param car_registration_number:str
+        :return: output:str
+        """
 
-    # if output_file is argument is specified, all the console output will be written to the output_file.
-    if args.output_file:
-        sys.stdout = open(args.output_file, "w")
+        parking_slot = self.get_parking_slot_number_from_vehicle_registration_number(car_registration_number)
+
+        if parking_slot == -1:
+            return 'No parked car matches the query'
+        return str(parking_slot)
+
+    def execute_vehicle_registration_number_for_driver_of_age_command(self, driver_age):
+        """
+        This method executes the command Vehicle_registration_number_for_driver_of_age <age:int> and returns its
+        output.
+        :param driver_age:int
+        :return: output:str
+        """
+
+        # A miss is counted by the lookup of the result the output is built from.
+        key = ('vehicle_registration_numbers_output', driver_age)
+        output = self.query_cache.get(key, count_miss=False)
+        if output is None:
+            vehicle_registration_numbers = self.get_vehicle_registration_numbers_from_driver_age(driver_age)
+
+            if len(vehicle_registration_numbers) > 0:
+                output = ','.join(vehicle_registration_numbers)
+            else:
+                output = 'No parked car matches the query'
+            self.query_cache.put(key, driver_age, output)
+
+        return output
+
+    def execute_slot_numbers_for_driver_of_age_command(self, driver_age):
+        """
+        This method executes the command Slot_numbers_for_driver_of_age <age:int> and returns its output.
+        :param driver_age:int
+        :return: output:str
+        """
+
+        # A miss is counted by the lookup of the result the output is built from.
+        key = ('parking_slots_output', driver_age)
+        output = self.query_cache.get(key, count_miss=False)
+        if output is None:
+            parking_slots = self.get_parking_slots_from_driver_age(driver_age)
+            if len(parking_slots) > 0:
+                output = ','.join([str(parking_slot) for parking_slot in parking_slots])
+            else:
+                output = 'No parked car matches the query'
+            self.query_cache.put(key, driver_age, output)
+
+        return output
+
+    def execute_slot_numbers_for_car_with_number_prefix_command(self, prefix):
+        """
+        This method executes the command Slot_numbers_for_car_with_number_prefix <prefix:str> and returns its output,
+        the vehicle registration number and parking slot of every matching car in the format
+        <vehicle_registration_number>:<parking_slot>.
+        :param prefix:str
+        :return: output:str
+        """
+
+        parking_tickets = self.get_parking_tickets_from_vehicle_registration_number_prefix(prefix)
+        if len(parking_tickets) > 0:
+            return ','.join([f'{parking_ticket.get_vehicle_registration_number()}:{parking_ticket.get_parking_slot()}'
+                             for parking_ticket in parking_tickets])
+        return 'No parked car matches the query'
+
+    def execute_reserve_command(self, vehicle_registration_number, start_time, end_time, vehicle_type='Car'):
+        """
+        This method executes the command Reserve <vehicle_registration_number:str> from <start_time:float>
+        to <end_time:float> [vehicle_type <vehicle_type:str>] and returns its output.
+        :param vehicle_registration_number:str
+        :param start_time:float
+        :param end_time:float
+        :param vehicle_type:str
+        :return: output:str
+        """
+
+        reservation = self.reserve_parking_slot(vehicle_registration_number, start_time, end_time, vehicle_type)
+        if reservation.get_status() == 'unavailable':
+            return 'Sorry, Parking Lot is full, No Parking Slots Available.'
+        return (f'Reservation {reservation.get_reservation_id()} booked for car with vehicle registration number '
+                f'"{vehicle_registration_number}"')
+
+    def execute_cancel_reservation_command(self, reservation_id):
+        """
+        This method executes the command Cancel_reservation <reservation_id:int> and returns its output.
+        :param reservation_id:int
+        :return: output:str
+        """
+
+        self.cancel_reservation(reservation_id)
+        return f'Reservation {reservation_id} cancelled'
+
+    def execute_query_stream(self, input_file, output_file, chunk_size=CHUNK_SIZE, lines_per_write=LINES_PER_WRITE):
+        """
+        This method executes every query of the input_file and writes their outputs to the output_file. The input is
+        read in chunks of chunk_size characters, and the outputs are written in blocks of lines_per_write lines, which
+        gives the same output as calling parse_commands for every line of the input_file.
+        :param input_file:file Text file to read the queries from, one query per line.
+        :param output_file:file Text file to write the outputs to, one output per line.
+        :param chunk_size:int Number of characters read from the input_file at once.
+        :param lines_per_write:int Number of output lines written to the output_file at once.
+        """
+
+        execute_query = self.execute_query
+        outputs = []
+        remainder = ''
+
+        while True:
+            chunk = input_file.read(chunk_size)
+            if not chunk:
+                break
+
+            # The last line of a chunk may be incomplete, so it is carried over to the next chunk.
+            queries = (remainder + chunk).split('\n')
+            remainder = queries.pop()
+
+            # Queries without output are dropped, as every output is a non-empty string.
+            outputs.extend(filter(None, map(execute_query, queries)))
+            if len(outputs) >= lines_per_write:
+                output_file.write('\n'.join(outputs) + '\n')
+                outputs = []
+
+        # A last line without a trailing new line is a query too.
+        if remainder:
+            outputs.extend(filter(None, [execute_query(remainder)]))
+        if outputs:
+            output_file.write('\n'.join(outputs) + '\n')
+        output_file.flush()
+
+
+if __name__ == '__main__':
+    # The command line runner imports this file as the parking_management module, so the module run as a script is
+    # registered under that name too, instead of being loaded a second time.
+    sys.modules.setdefault('parking_management', sys.modules[__name__])
+    from parking_cli import main
 
-    # Iterating through the input_file line by line and passing it to parse_commands method of Parking Management Class.
-    if args.input_file:
-        with open(args.input_file) as input_file:
-            for line in input_file:
-                line = line.rstrip('\n')
-                parking_management.parse_commands(line)
+    main()
@@ -0,0 +1,187 @@
+from bisect import bisect_left
+from cProfile import Profile
+from pstats import Stats
+from time import perf_counter
+
+# Upper bounds of the command latency histogram buckets in seconds, the last bucket is unbounded.
+LATENCY_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+# Label of the commands which are not recognized.
+UNRECOGNIZED_COMMAND = 'Not_recognized'
+
+
+class ParkingMetrics:
+    """
+    ParkingMetrics class contains the metrics of the commands executed by a ParkingManagement, which are collected
+    once enable_metrics is called on it. It counts the commands, keeps a latency histogram per command, and can profile
+    a sample of the commands with cProfile while profiling is turned on. The metrics, along with the gauges of the
+    parking lot, are exported as Prometheus text or passed to a callback.
+    """
+
+    def __init__(self):
+        """
+        This constructor method is used to initialize the metrics of the class.
+        command_counts -> Dictionary of command name to the number of commands executed.
+        command_latency_sums -> Dictionary of command name to the total latency of the commands in seconds.
+        command_latency_buckets -> Dictionary of command name to the list of command counts per latency bucket.
+        profiler -> Object of cProfile.Profile while profiling is turned on, otherwise None.
+        profile_sample_interval -> One in profile_sample_interval commands is profiled.
+        commands_until_profiled -> Number of commands until the next profiled command.
+        """
+
+        self.command_counts = {}
+        self.command_latency_sums = {}
+        self.command_latency_buckets = {}
+        self.profiler = None
+        self.profile_sample_interval = 1
+        self.commands_until_profiled = 1
+
+    def measure_command(self, execute_command, command):
+        """
+        This method executes the command and records its latency.
+        :param execute_command:function It executes the command and returns its output.
+        :param command:obj Object of the Command Class.
+        :return: output:str Output of the command.
+        """
+
+        profiler = self.profiler
+        if profiler is not None:
+            self.commands_until_profiled -= 1
+            if self.commands_until_profiled == 0:
+                self.commands_until_profiled = self.profile_sample_interval
+            else:
+                profiler = None
+
+        start = perf_counter()
+        if profiler is None:
+            output = execute_command(command)
+        else:
+            output = profiler.runcall(execute_command, command)
+        latency = perf_counter() - start
+
+        self.observe(command.name or UNRECOGNIZED_COMMAND, latency)
+        return output
+
+    def observe(self, command_name, latency):
+        """
+        This method records the latency of a command.
+        :param command_name:str
+        :param latency:float Latency in seconds
+        """
+
+        if command_name not in self.command_counts:
+            self.command_counts[command_name] = 0
+            self.command_latency_sums[command_name] = 0.0
+            self.command_latency_buckets[command_name] = [0] * (len(LATENCY_BUCKETS) + 1)
+
+        self.command_counts[command_name] += 1
+        self.command_latency_sums[command_name] += latency
+        self.command_latency_buckets[command_name][bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    def start_profiling(self, profile_sample_interval=100):
+        """
+        This method turns on profiling of one in profile_sample_interval commands.
+        :param profile_sample_interval:int
+        """
+
+        self.profiler = Profile()
+        self.profile_sample_interval = profile_sample_interval
+        self.commands_until_profiled = profile_sample_interval
+
+    def stop_profiling(self):
+        """
+        This method turns off profiling and returns the statistics of the profiled commands.
+        :return: stats:obj Object of pstats.Stats, or None if profiling was not turned on or no command was profiled.
+        """
+
+        profiler, self.profiler = self.profiler, None
+        if profiler is None:
+            return None
+
+        try:
+            return Stats(profiler)
+        except TypeError:
+            # pstats.Stats cannot be created from a profiler which has not profiled any command.
+            return None
+
+    def get_gauges(self, parking_management):
+        """
+        This method returns the gauges of the parking lot. The vacant parking slots are made of the vacated parking
+        slots in the available slots heaps and the parking slots which have never been allocated, which are read from
+        the BayPools if the parking lot has parking bay types.
+        :param parking_management:obj Object of the ParkingManagement Class
+        :return: gauges:dict Dictionary of gauge name to its value.
+        """
+
+        if parking_management.bay_pools is None:
+            available_slots_heap_size = len(parking_management.available_parking_slots)
+            unallocated_slots = parking_management.capacity - parking_management.next_parking_slot + 1
+        else:
+            bay_pools = parking_management.bay_pools.values()
+            available_slots_heap_size = sum(len(bay_pool.available_parking_slots) for bay_pool in bay_pools)
+            unallocated_slots = sum(bay_pool.last_parking_slot - bay_pool.next_parking_slot + 1
+                                    for bay_pool in bay_pools)
+
+        return {
+            'parking_capacity': parking_management.capacity,
+            'parking_occupied_slots': len(parking_management.occupied_parking_slots),
+            'parking_vacant_slots': available_slots_heap_size + unallocated_slots,
+            'parking_available_slots_heap_size': available_slots_heap_size,
+            'parking_unallocated_slots': unallocated_slots,
+        }
+
+    def get_snapshot(self, parking_management):
+        """
+        This method returns a copy of the metrics and the gauges of the parking lot.
+        :param parking_management:obj Object of the ParkingManagement Class
+        :return: snapshot:dict
+        """
+
+        return {
+            'gauges': self.get_gauges(parking_management),
+            'command_counts': dict(self.command_counts),
+            'command_latency_sums': dict(self.command_latency_sums),
+            'command_latency_buckets': {command_name: list(buckets)
+                                        for command_name, buckets in self.command_latency_buckets.items()},
+            'latency_bucket_bounds': LATENCY_BUCKETS,
+        }
+
+    def export(self, parking_management, callback):
+        """
+        This method passes the snapshot returned by get_snapshot to the callback.
+        :param parking_management:obj Object of the ParkingManagement Class
+        :param callback:function It takes the snapshot.
+        """
+
+        callback(self.get_snapshot(parking_management))
+
+    def get_prometheus_text(self, parking_management):
+        """
+        This method returns the metrics and the gauges of the parking lot in the Prometheus text format.
+        :param parking_management:obj Object of the ParkingManagement Class
+        :return: text:str
+        """
+
+        lines = []
+
+        for gauge_name, value in self.get_gauges(parking_management).items():
+            lines.append(f'# TYPE {gauge_name} gauge')
+            lines.append(f'{gauge_name} {value}')
+
+        lines.append('# TYPE parking_commands_total counter')
+        for command_name, count in self.command_counts.items():
+            lines.append(f'parking_commands_total{{command="{command_name}"}} {count}')
+
+        lines.append('# TYPE parking_command_duration_seconds histogram')
+        for command_name, buckets in self.command_latency_buckets.items():
+            cumulative_count = 0
+            for bound, count in zip(LATENCY_BUCKETS + ('+Inf',), buckets):
+                cumulative_count += count
+                lines.append(f'parking_command_duration_seconds_bucket{{command="{command_name}",le="{bound}"}} '
+                             f'{cumulative_count}')
+            lines.append(f'parking_command_duration_seconds_sum{{command="{command_name}"}} '
+                         f'{self.command_latency_sums[command_name]}')
+            lines.append(f'parking_command_duration_seconds_count{{command="{command_name}"}} '
+                         f'{self.command_counts[command_name]}')
+
+        return '\n'.join(lines) + '\n'
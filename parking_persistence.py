@@ -0,0 +1,592 @@
+import math
+import os
+from array import array
+from heapq import heapify, heappop, heappush
+from struct import Struct
+
+from Models.BayPool import BAY_TYPES
+from Models.Car import Car
+from Models.ParkingTicket import ParkingTicket
+from Models.Reservation import Reservation
+from parking_management import VEHICLE_CLASSES, ParkingManagement
+
+# Number of journal records written together with a single fsync, and number of journal records after which a snapshot
+# is taken.
+GROUP_COMMIT_SIZE = 256
+SNAPSHOT_INTERVAL = 1_000_000
+
+SNAPSHOT_FILE_NAME = 'snapshot.bin'
+SNAPSHOT_MAGIC = b'PMS2'
+SNAPSHOT_V1_MAGIC = b'PMS1'
+
+# Journal records, each starting with its record type :
+# 1. b'C' <capacity:uint64>
+# 2. b'P' <parking_slot:uint32> <driver_age:int32> <length:uint16> <vehicle_registration_number:utf-8>
+# 3. b'L' <parking_slot:uint32>
+# 4. b'T' <parking_slot:uint32> <driver_age:int32> <entry_time:float64> <vehicle_type:uint8> <length:uint16>
+# <vehicle_registration_number:utf-8>
+# Park is journaled as a b'T' record, b'P' records written before entry times and vehicle types were journaled are
+# still replayed, as a Car with an unknown entry time. An unknown entry time is stored as NaN.
+CREATE_RECORD = Struct('<Q')
+PARK_RECORD = Struct('<IiH')
+LEAVE_RECORD = Struct('<I')
+TICKET_RECORD = Struct('<IidBH')
+
+# Vehicle types in the order of their number in the journal and snapshot files.
+VEHICLE_TYPES = tuple(VEHICLE_CLASSES)
+
+# Snapshot header :
+# <magic:4s> <journal_generation:uint64> <capacity:uint64> <bay_types:uint64> <parking_tickets:uint64>
+# <reservations:uint64> <next_reservation_id:uint64>
+# It is followed by the bay type numbers and counts of the parking bays, the parking slots, driver's ages, entry times
+# and vehicle type numbers of the parking tickets, the ids, start times, end times, vehicle type numbers and held
+# parking slots (0 if none) of the reservations, and the vehicle registration numbers of the parking tickets and then
+# of the reservations, separated by new lines.
+SNAPSHOT_HEADER = Struct('<4sQQQQQQ')
+
+# Header of the b'PMS1' snapshots, written before parking bays, reservations, entry times and vehicle types were
+# stored. They are still loaded, as parking lots of Cars with unknown entry times.
+# <magic:4s> <journal_generation:uint64> <capacity:uint64> <next_parking_slot:uint64> <available_parking_slots:uint64>
+# <parking_tickets:uint64>
+SNAPSHOT_V1_HEADER = Struct('<4sQQQQQ')
+
+
+def get_journal_file_name(journal_generation):
+    """
+    This function returns the name of the journal file of a journal generation.
+    :param journal_generation:int
+    :return: journal_file_name:str
+    """
+
+    return f'journal-{journal_generation}.bin'
+
+
+def write_snapshot(parking_management, path, journal_generation=0):
+    """
+    This function writes a snapshot of the parking lot to path. The snapshot is written to a temporary file first and
+    renamed over path once it is on disk, so path always holds a complete snapshot.
+    :param parking_management:obj Object of the ParkingManagement Class
+    :param path:str Path of the snapshot file
+    :param journal_generation:int Generation of the journal holding the events after the snapshot.
+    """
+
+    parking_tickets = list(parking_management.occupied_parking_slots.values())
+    reservation_calendar = parking_management.reservation_calendar
+    reservations = list(reservation_calendar.reservations.values())
+    bay_pools = list(parking_management.bay_pools.values()) if parking_management.bay_pools is not None else []
+
+    # The vacant parking slots are not stored, they are worked out from the parking tickets and the held parking slots
+    # once the snapshot is loaded. So a parking slot taken for a parking ticket that is not added yet is loaded as
+    # vacant, and its Park record follows in the journal.
+    temporary_path = path + '.tmp'
+    with open(temporary_path, 'wb') as snapshot_file:
+        snapshot_file.write(SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC, journal_generation, parking_management.capacity, len(bay_pools), len(parking_tickets),
+            len(reservations), reservation_calendar.next_reservation_id))
+
+        array('B', [BAY_TYPES.index(bay_pool.bay_type) for bay_pool in bay_pools]).tofile(snapshot_file)
+        array('Q', [bay_pool.last_parking_slot - bay_pool.first_parking_slot + 1
+                    for bay_pool in bay_pools]).tofile(snapshot_file)
+
+        # Parking tickets are stored in the order of occupied_parking_slots, which is the order of the query outputs.
+        # An unknown entry time is stored as NaN.
+        array('Q', [parking_ticket.get_parking_slot() for parking_ticket in parking_tickets]).tofile(snapshot_file)
+        array('q', [parking_ticket.get_driver_age() for parking_ticket in parking_tickets]).tofile(snapshot_file)
+        array('d', [math.nan if parking_ticket.get_entry_time() is None else parking_ticket.get_entry_time()
+                    for parking_ticket in parking_tickets]).tofile(snapshot_file)
+        array('B', [VEHICLE_TYPES.index(parking_ticket.get_vehicle_type())
+                    for parking_ticket in parking_tickets]).tofile(snapshot_file)
+
+        array('Q', [reservation.reservation_id for reservation in reservations]).tofile(snapshot_file)
+        array('d', [reservation.start_time for reservation in reservations]).tofile(snapshot_file)
+        array('d', [reservation.end_time for reservation in reservations]).tofile(snapshot_file)
+        array('B', [VEHICLE_TYPES.index(reservation.vehicle_type)
+                    for reservation in reservations]).tofile(snapshot_file)
+        array('Q', [reservation.parking_slot or 0 for reservation in reservations]).tofile(snapshot_file)
+
+        snapshot_file.write('\n'.join([parking_ticket.get_vehicle_registration_number()
+                                       for parking_ticket in parking_tickets] +
+                                      [reservation.vehicle_registration_number
+                                       for reservation in reservations]).encode())
+
+        snapshot_file.flush()
+        os.fsync(snapshot_file.fileno())
+
+    os.replace(temporary_path, path)
+
+
+def read_snapshot(parking_management, path):
+    """
+    This function loads the snapshot at path into an empty parking lot.
+    :param parking_management:obj Object of the ParkingManagement Class
+    :param path:str Path of the snapshot file
+    :return: journal_generation:int Generation of the journal holding the events after the snapshot.
+    """
+
+    with open(path, 'rb') as snapshot_file:
+        magic = snapshot_file.read(4)
+        if magic == SNAPSHOT_V1_MAGIC:
+            return read_snapshot_v1(parking_management, snapshot_file)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f'{path} is not a snapshot file')
+
+        _, journal_generation, capacity, bay_types_count, parking_tickets_count, reservations_count, \
+            next_reservation_id = SNAPSHOT_HEADER.unpack(magic + snapshot_file.read(SNAPSHOT_HEADER.size - 4))
+
+        bay_types = array('B')
+        bay_types.fromfile(snapshot_file, bay_types_count)
+        bay_counts = array('Q')
+        bay_counts.fromfile(snapshot_file, bay_types_count)
+
+        parking_slots = array('Q')
+        parking_slots.fromfile(snapshot_file, parking_tickets_count)
+        driver_ages = array('q')
+        driver_ages.fromfile(snapshot_file, parking_tickets_count)
+        entry_times = array('d')
+        entry_times.fromfile(snapshot_file, parking_tickets_count)
+        vehicle_types = array('B')
+        vehicle_types.fromfile(snapshot_file, parking_tickets_count)
+
+        reservation_ids = array('Q')
+        reservation_ids.fromfile(snapshot_file, reservations_count)
+        start_times = array('d')
+        start_times.fromfile(snapshot_file, reservations_count)
+        end_times = array('d')
+        end_times.fromfile(snapshot_file, reservations_count)
+        reservation_vehicle_types = array('B')
+        reservation_vehicle_types.fromfile(snapshot_file, reservations_count)
+        held_parking_slots = array('Q')
+        held_parking_slots.fromfile(snapshot_file, reservations_count)
+
+        vehicle_registration_numbers = snapshot_file.read().decode().split('\n') \
+            if parking_tickets_count + reservations_count else []
+
+    parking_management.create_parking_slots(capacity, [(BAY_TYPES[bay_type], count)
+                                                       for bay_type, count in zip(bay_types, bay_counts)])
+    load_vacant_parking_slots(parking_management, set(parking_slots).union(held_parking_slots))
+
+    parking_management.load_parking_tickets([
+        parking_management.create_parking_ticket(
+            parking_management.create_vehicle(vehicle_registration_number, driver_age, VEHICLE_TYPES[vehicle_type]),
+            parking_slot, None if math.isnan(entry_time) else entry_time)
+        for vehicle_registration_number, driver_age, parking_slot, entry_time, vehicle_type in zip(
+            vehicle_registration_numbers, driver_ages, parking_slots, entry_times, vehicle_types)])
+
+    reservations = []
+    for reservation_id, vehicle_registration_number, start_time, end_time, vehicle_type, parking_slot in zip(
+            reservation_ids, vehicle_registration_numbers[parking_tickets_count:], start_times, end_times,
+            reservation_vehicle_types, held_parking_slots):
+        reservation = Reservation(reservation_id, vehicle_registration_number, start_time, end_time,
+                                  VEHICLE_TYPES[vehicle_type])
+        if parking_slot:
+            reservation.parking_slot = parking_slot
+            reservation.status = 'held'
+        reservations.append(reservation)
+    parking_management.reservation_calendar.load(reservations, next_reservation_id)
+
+    return journal_generation
+
+
+def read_snapshot_v1(parking_management, snapshot_file):
+    """
+    This function loads a b'PMS1' snapshot into an empty parking lot, as a parking lot of Cars with unknown entry
+    times.
+    :param parking_management:obj Object of the ParkingManagement Class
+    :param snapshot_file:obj The snapshot file, read up to the end of its magic.
+    :return: journal_generation:int Generation of the journal holding the events after the snapshot.
+    """
+
+    _, journal_generation, capacity, next_parking_slot, available_parking_slots_count, parking_tickets_count = \
+        SNAPSHOT_V1_HEADER.unpack(SNAPSHOT_V1_MAGIC + snapshot_file.read(SNAPSHOT_V1_HEADER.size - 4))
+
+    available_parking_slots = array('Q')
+    available_parking_slots.fromfile(snapshot_file, available_parking_slots_count)
+    parking_slots = array('Q')
+    parking_slots.fromfile(snapshot_file, parking_tickets_count)
+    driver_ages = array('q')
+    driver_ages.fromfile(snapshot_file, parking_tickets_count)
+    vehicle_registration_numbers = snapshot_file.read().decode().split('\n') if parking_tickets_count else []
+
+    parking_management.create_parking_slots(capacity)
+    parking_management.next_parking_slot = next_parking_slot
+    parking_management.available_parking_slots = available_parking_slots.tolist()
+
+    parking_management.load_parking_tickets([
+        parking_management.create_parking_ticket(Car(vehicle_registration_number, driver_age), parking_slot)
+        for vehicle_registration_number, driver_age, parking_slot in zip(vehicle_registration_numbers, driver_ages,
+                                                                         parking_slots)])
+
+    return journal_generation
+
+
+def load_vacant_parking_slots(parking_management, taken_parking_slots):
+    """
+    This function sets the vacant parking slots of a parking lot just created, which are all the parking slots but the
+    taken ones, in the available_parking_slots heap and next_parking_slot of the parking lot or of each of its BayPools.
+    A sorted list is a valid heap.
+    :param parking_management:obj Object of the ParkingManagement Class
+    :param taken_parking_slots:set Parking slots of the parking tickets and of the held reservations.
+    """
+
+    if parking_management.bay_pools is None:
+        allocators = [(parking_management, 1, parking_management.capacity)]
+    else:
+        allocators = [(bay_pool, bay_pool.first_parking_slot, bay_pool.last_parking_slot)
+                      for bay_pool in parking_management.bay_pools.values()]
+
+    for allocator, first_parking_slot, last_parking_slot in allocators:
+        allocator.next_parking_slot = max((parking_slot for parking_slot in taken_parking_slots
+                                           if first_parking_slot <= parking_slot <= last_parking_slot),
+                                          default=first_parking_slot - 1) + 1
+        allocator.available_parking_slots = [parking_slot
+                                             for parking_slot in range(first_parking_slot, allocator.next_parking_slot)
+                                             if parking_slot not in taken_parking_slots]
+
+
+class PersistentParkingManagement(ParkingManagement):
+    """
+    PersistentParkingManagement class inherits from the ParkingManagement Class, and makes the parking lot crash-safe.
+    Every Create_parking_lot, Park and Leave is appended to a binary journal, and fsync is called once for a group of
+    records. The execute methods commit the records of their queries before returning the outputs, so an acknowledged
+    query is on disk, and a batch of queries shares a single fsync. Records of the methods called directly are committed
+    once GROUP_COMMIT_SIZE of them are pending, or by commit and close, and are lost on a crash until then. A snapshot
+    of the parking lot is taken every SNAPSHOT_INTERVAL records, after which a new journal generation is started. On
+    restart, the latest snapshot is loaded and only the journal after it is replayed.
+    """
+
+    def __init__(self, directory, group_commit_size=GROUP_COMMIT_SIZE, snapshot_interval=SNAPSHOT_INTERVAL):
+        """
+        This constructor method initiates the constructor method for ParkingManagement Class, and recovers the parking
+        lot from the snapshot and journal files in directory.
+        directory -> Directory of the snapshot and journal files, it is created if it does not exist.
+        group_commit_size -> Maximum number of journal records waiting for a commit.
+        snapshot_interval -> Number of journal records after which a snapshot is taken.
+        journal_generation -> Generation of the journal file being appended to.
+        journal_file -> The journal file, it is None while the parking lot is recovered.
+        pending_records -> Journal records waiting for the next group commit.
+        journal_records_count -> Number of journal records since the last snapshot.
+        """
+
+        ParkingManagement.__init__(self)
+
+        self.directory = directory
+        self.group_commit_size = group_commit_size
+        self.snapshot_interval = snapshot_interval
+        self.journal_generation = 0
+        self.journal_file = None
+        self.pending_records = []
+        self.journal_records_count = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self.recover()
+
+    def recover(self):
+        """
+        This method loads the latest snapshot, if any, and replays the journal written after it. An incomplete record
+        at the end of the journal, left by a crash in the middle of a write, is discarded.
+        """
+
+        snapshot_path = os.path.join(self.directory, SNAPSHOT_FILE_NAME)
+        if os.path.exists(snapshot_path):
+            self.journal_generation = read_snapshot(self, snapshot_path)
+
+        journal_path = os.path.join(self.directory, get_journal_file_name(self.journal_generation))
+        if os.path.exists(journal_path):
+            with open(journal_path, 'rb') as journal_file:
+                journal = journal_file.read()
+            valid_length = self.replay_journal(journal)
+            if valid_length < len(journal):
+                with open(journal_path, 'r+b') as journal_file:
+                    journal_file.truncate(valid_length)
+
+        self.journal_file = open(journal_path, 'ab')
+
+        # The previous journal generation is left behind if a crash happened right after a snapshot.
+        previous_journal_path = os.path.join(self.directory, get_journal_file_name(self.journal_generation - 1))
+        if os.path.exists(previous_journal_path):
+            os.remove(previous_journal_path)
+
+    def replay_journal(self, journal):
+        """
+        This method applies the journal records to the parking lot. It is called before the journal file is opened, so
+        the records are not written to the journal again.
+        :param journal:bytes Content of the journal file
+        :return: valid_length:int Length of the complete records at the start of the journal.
+        """
+
+        offset = 0
+        while offset < len(journal):
+            record_type = journal[offset:offset + 1]
+            start = offset + 1
+
+            if record_type == b'C':
+                if start + CREATE_RECORD.size > len(journal):
+                    break
+                (capacity,) = CREATE_RECORD.unpack_from(journal, start)
+                self.create_parking_slots(capacity)
+                offset = start + CREATE_RECORD.size
+
+            elif record_type == b'P':
+                if start + PARK_RECORD.size > len(journal):
+                    break
+                parking_slot, driver_age, length = PARK_RECORD.unpack_from(journal, start)
+                start += PARK_RECORD.size
+                if start + length > len(journal):
+                    break
+                vehicle_registration_number = journal[start:start + length].decode()
+                self.replay_parking_ticket(vehicle_registration_number, driver_age, parking_slot)
+                offset = start + length
+
+            elif record_type == b'T':
+                if start + TICKET_RECORD.size > len(journal):
+                    break
+                parking_slot, driver_age, entry_time, vehicle_type, length = TICKET_RECORD.unpack_from(journal, start)
+                start += TICKET_RECORD.size
+                if start + length > len(journal):
+                    break
+                vehicle_registration_number = journal[start:start + length].decode()
+                self.replay_parking_ticket(vehicle_registration_number, driver_age, parking_slot,
+                                           None if math.isnan(entry_time) else entry_time, VEHICLE_TYPES[vehicle_type])
+                offset = start + length
+
+            elif record_type == b'L':
+                if start + LEAVE_RECORD.size > len(journal):
+                    break
+                (parking_slot,) = LEAVE_RECORD.unpack_from(journal, start)
+                self.deallocate_parking_slot(parking_slot)
+                offset = start + LEAVE_RECORD.size
+
+            else:
+                raise ValueError(f'Unknown journal record type {record_type!r} at offset {offset}')
+
+            self.journal_records_count += 1
+
+        return offset
+
+    def replay_parking_ticket(self, vehicle_registration_number, driver_age, parking_slot, entry_time=None,
+                              vehicle_type='Car'):
+        """
+        This method issues the parking ticket of a journal record. Parking slots are allocated nearest first, so the
+        parking slot on the record is normally the nearest empty parking slot, otherwise it is taken out of the vacant
+        parking slots directly.
+        :param vehicle_registration_number:str
+        :param driver_age:int
+        :param parking_slot:int
+        :param entry_time:float or None if unknown.
+        :param vehicle_type:str
+        """
+
+        if self.available_parking_slots and self.available_parking_slots[0] == parking_slot:
+            heappop(self.available_parking_slots)
+        elif not self.available_parking_slots and self.next_parking_slot == parking_slot:
+            self.next_parking_slot += 1
+        elif parking_slot >= self.next_parking_slot:
+            # The parking slots skipped over are vacant, so they are moved to the available_parking_slots heap.
+            for skipped_parking_slot in range(self.next_parking_slot, parking_slot):
+                heappush(self.available_parking_slots, skipped_parking_slot)
+            self.next_parking_slot = parking_slot + 1
+        elif parking_slot in self.available_parking_slots:
+            self.available_parking_slots.remove(parking_slot)
+            heapify(self.available_parking_slots)
+        else:
+            raise ValueError(f'Journal record for parking slot {parking_slot} does not match the parking lot, '
+                             f'the parking slot is not vacant')
+
+        self.add_parking_ticket(self.create_parking_ticket(
+            self.create_vehicle(vehicle_registration_number, driver_age, vehicle_type), parking_slot, entry_time))
+
+    def append_record(self, record):
+        """
+        This method appends a record to the journal, committing the pending records once there are group_commit_size
+        of them, and taking a snapshot every snapshot_interval records.
+        :param record:bytes
+        """
+
+        # Records are not journaled while the parking lot is recovered.
+        if self.journal_file is None:
+            return
+
+        self.pending_records.append(record)
+        self.journal_records_count += 1
+
+        if len(self.pending_records) >= self.group_commit_size:
+            self.commit()
+        if self.journal_records_count >= self.snapshot_interval:
+            self.snapshot()
+
+    def execute_query(self, query):
+        """
+        This method executes the query as ParkingManagement does, and commits its journal record before returning the
+        output.
+        :param query:str
+        :return: output:str
+        """
+
+        output = ParkingManagement.execute_query(self, query)
+        self.commit_pending_records()
+        return output
+
+    def execute_queries(self, queries):
+        """
+        This method executes the queries as ParkingManagement does, and commits their journal records with a single
+        fsync before returning the outputs.
+        :param queries:list
+        :return: outputs:list
+        """
+
+        outputs = ParkingManagement.execute_queries(self, queries)
+        self.commit_pending_records()
+        return outputs
+
+    def execute_batch(self, commands):
+        """
+        This method executes the batch of commands as ParkingManagement does, and commits their journal records with a
+        single fsync before returning the results.
+        :param commands:list
+        :return: results:list
+        """
+
+        results = ParkingManagement.execute_batch(self, commands)
+        self.commit_pending_records()
+        return results
+
+    def commit_pending_records(self):
+        """
+        This method commits the pending journal records, if any, so that no fsync is called for queries without
+        journal records.
+        """
+
+        if self.pending_records:
+            self.commit()
+
+    def commit(self):
+        """
+        This method writes the pending journal records to the journal file and calls fsync once for all of them.
+        """
+
+        if self.pending_records:
+            self.journal_file.write(b''.join(self.pending_records))
+            self.pending_records = []
+        self.journal_file.flush()
+        os.fsync(self.journal_file.fileno())
+
+    def snapshot(self):
+        """
+        This method writes a snapshot of the parking lot and starts a new journal generation after it. The previous
+        journal file is removed once the snapshot is on disk.
+        """
+
+        self.commit()
+        previous_journal_path = self.journal_file.name
+        self.journal_file.close()
+
+        self.journal_generation += 1
+        write_snapshot(self, os.path.join(self.directory, SNAPSHOT_FILE_NAME), self.journal_generation)
+        self.journal_file = open(os.path.join(self.directory, get_journal_file_name(self.journal_generation)), 'ab')
+        self.journal_records_count = 0
+
+        os.remove(previous_journal_path)
+
+    def close(self):
+        """
+        This method commits the pending journal records and closes the journal file.
+        """
+
+        self.commit()
+        self.journal_file.close()
+
+    def create_parking_slots(self, max_capacity, bay_counts=None):
+        """
+        This method creates the parking lot as ParkingManagement does, and journals it. The journal only holds the
+        capacity of the parking lot, so parking bay types are not supported.
+        :param max_capacity:int It denotes the maximum capacity of the parking lot.
+        :param bay_counts:list It must not be passed.
+        :return: status:boolean
+        """
+
+        if bay_counts:
+            raise ValueError('Parking bay types are not supported by the journal')
+
+        # The record is packed before the parking lot is changed, so that a capacity whose parking slots do not fit in
+        # the records raises with the parking lot and the journal left as they were.
+        capacity = int(max_capacity)
+        LEAVE_RECORD.pack(capacity)
+        record = b'C' + CREATE_RECORD.pack(capacity)
+
+        status = ParkingManagement.create_parking_slots(self, capacity)
+        if status:
+            self.append_record(record)
+        return status
+
+    def create_vehicle(self, vehicle_registration_number, driver_age, vehicle_type='Car'):
+        """
+        This method creates the vehicle as ParkingManagement does, and checks that its Park record can be packed. Every
+        vehicle is created before it is given a parking slot, so a driver's age or vehicle registration number which
+        does not fit in the record raises with the parking lot and the journal left as they were.
+        :param vehicle_registration_number:str Vehicle registration Number of the vehicle
+        :param driver_age:int Age of the driver driving the vehicle
+        :param vehicle_type:str Type of the vehicle
+        :return: vehicle:obj
+        """
+
+        vehicle = ParkingManagement.create_vehicle(self, vehicle_registration_number, driver_age, vehicle_type)
+        self.get_ticket_record(ParkingTicket(vehicle, 0))
+        return vehicle
+
+    def reserve_parking_slot(self, vehicle_registration_number, start_time, end_time, vehicle_type='Car'):
+        """
+        This method is not supported, as the journal does not hold reservations, nor the parking slots held for them
+        and released as the clock moves. A parking lot recovered from the journal would not match the parking lot
+        before.
+        :param vehicle_registration_number:str Vehicle registration Number of the car
+        :param start_time:float Start of the time window in seconds since the epoch.
+        :param end_time:float End of the time window in seconds since the epoch.
+        :param vehicle_type:str Type of the vehicle
+        """
+
+        raise ValueError('Reservations are not supported by the journal')
+
+    def get_ticket_record(self, parking_ticket):
+        """
+        This method returns the journal record of a parking ticket issued to a car.
+        :param parking_ticket:obj Object of the ParkingTicket Class
+        :return: record:bytes
+        """
+
+        entry_time = parking_ticket.get_entry_time()
+        vehicle_registration_number = parking_ticket.get_vehicle_registration_number().encode()
+        return b'T' + TICKET_RECORD.pack(parking_ticket.get_parking_slot(), parking_ticket.get_driver_age(),
+                                         math.nan if entry_time is None else entry_time,
+                                         VEHICLE_TYPES.index(parking_ticket.get_vehicle_type()),
+                                         len(vehicle_registration_number)) + vehicle_registration_number
+
+    def add_parking_ticket(self, parking_ticket):
+        """
+        This method adds the parking ticket as ParkingManagement does, and journals it.
+        :param parking_ticket:obj Object of the ParkingTicket Class, which is issued to a car.
+        """
+
+        # Records are not journaled while the parking lot is recovered.
+        if self.journal_file is None:
+            ParkingManagement.add_parking_ticket(self, parking_ticket)
+            return
+
+        record = self.get_ticket_record(parking_ticket)
+        ParkingManagement.add_parking_ticket(self, parking_ticket)
+        self.append_record(record)
+
+    def remove_parking_ticket(self, parking_slot_number):
+        """
+        This method removes the parking ticket as ParkingManagement does, and journals it.
+        :param parking_slot_number:int Parking Slot Number which is getting vacated.
+        :return: parking_ticket:obj or None if no car is parked in parking_slot_number.
+        """
+
+        record = None
+        if parking_slot_number in self.parking_slot_tickets:
+            record = b'L' + LEAVE_RECORD.pack(parking_slot_number)
+
+        parking_ticket = ParkingManagement.remove_parking_ticket(self, parking_slot_number)
+        if parking_ticket is not None:
+            self.append_record(record)
+        return parking_ticket
@@ -0,0 +1,152 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from command_parser import parse_query
+from parking_management import ParkingManagement
+
+# Number of queries above which a partition is replayed in a worker process, smaller partitions are replayed in the
+# main process as sending them to a worker costs more than replaying them.
+MIN_PARTITION_SIZE = 10_000
+
+
+def is_create_parking_lot_query(query):
+    """
+    This function returns whether a query is a Create_parking_lot command which parses, with a valid capacity and
+    layout of parking bays. Only such a query empties the parking lot, a Create_parking_lot which fails leaves it as it
+    was, so the queries after it do not depend on the queries before it.
+    :param query:str
+    :return: status:boolean
+    """
+
+    if not query.startswith('Create_parking_lot'):
+        return False
+    command = parse_query(query)
+    return command.name == 'Create_parking_lot' and command.error is None
+
+
+def partition_queries(queries):
+    """
+    This function partitions the queries of a single parking lot into runs of consecutive queries, a new run being
+    started at every Create_parking_lot command. Every run can be replayed on its own ParkingManagement.
+    :param queries:list List of queries, in the order they were executed.
+    :return: partitions:list List of (start, end) tuples of the runs, with end excluded.
+    """
+
+    partitions = []
+    start = 0
+    for index, query in enumerate(queries):
+        if index > start and is_create_parking_lot_query(query):
+            partitions.append((start, index))
+            start = index
+    if start < len(queries):
+        partitions.append((start, len(queries)))
+    return partitions
+
+
+def split_lot_tag(line):
+    """
+    This function splits a line of a lot tagged input into its lot id and query. A lot tagged line is the lot id
+    followed by the query, separated by " ".
+    :param line:str
+    :return: (lot_id:str, query:str)
+    """
+
+    lot_id, _, query = line.partition(' ')
+    return lot_id, query
+
+
+def replay_partition(queries):
+    """
+    This function replays the queries of a partition on a new ParkingManagement, and returns their outputs.
+    :param queries:list List of queries, starting with a Create_parking_lot command unless it is the first partition.
+    :return: outputs:list Output of every query, or None for the queries without output.
+    """
+
+    execute_query = ParkingManagement().execute_query
+    return [execute_query(query) for query in queries]
+
+
+def replay_queries(queries, workers=None, lot_tagged=False, min_partition_size=MIN_PARTITION_SIZE):
+    """
+    This function replays the queries of one or many parking lots in a pool of worker processes, and returns their
+    outputs in the original order of the queries. The queries are partitioned by parking lot and by Create_parking_lot
+    command, and every partition is replayed independently, so the outputs match a serial replay.
+    :param queries:list List of queries, or lot tagged lines if lot_tagged is True.
+    :param workers:int Number of worker processes, it defaults to the number of CPUs.
+    :param lot_tagged:boolean Whether every line starts with the id of the parking lot it is executed on. The output
+    of a lot tagged line is tagged with the same lot id.
+    :param min_partition_size:int Number of queries above which a partition is replayed in a worker process.
+    :return: outputs:list Output of every query, or None for the queries without output.
+    """
+
+    if lot_tagged:
+        lot_ids = []
+        lot_line_indexes = {}
+        lot_queries = {}
+        for index, line in enumerate(queries):
+            lot_id, query = split_lot_tag(line)
+            lot_ids.append(lot_id)
+            lot_line_indexes.setdefault(lot_id, []).append(index)
+            lot_queries.setdefault(lot_id, []).append(query)
+    else:
+        lot_line_indexes = {None: None}
+        lot_queries = {None: queries}
+
+    # Partitions are (lot id, start, end) tuples of a run of queries of a parking lot.
+    partitions = [(lot_id, start, end)
+                  for lot_id, queries_of_lot in lot_queries.items()
+                  for start, end in partition_queries(queries_of_lot)]
+
+    large_partitions = [partition for partition in partitions if partition[2] - partition[1] >= min_partition_size]
+    partition_outputs = {}
+    if large_partitions:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            futures = [executor.submit(replay_partition, lot_queries[lot_id][start:end])
+                       for lot_id, start, end in large_partitions]
+            # Small partitions are replayed in the main process while the worker processes are busy.
+            for lot_id, start, end in partitions:
+                if end - start < min_partition_size:
+                    partition_outputs[lot_id, start] = replay_partition(lot_queries[lot_id][start:end])
+            for (lot_id, start, end), future in zip(large_partitions, futures):
+                partition_outputs[lot_id, start] = future.result()
+    else:
+        for lot_id, start, end in partitions:
+            partition_outputs[lot_id, start] = replay_partition(lot_queries[lot_id][start:end])
+
+    if not lot_tagged:
+        outputs = []
+        for lot_id, start, end in partitions:
+            outputs.extend(partition_outputs[lot_id, start])
+        return outputs
+
+    # Every output is put back at the index of its line, and tagged with the lot id of the line.
+    outputs = [None] * len(queries)
+    for lot_id, start, end in partitions:
+        line_indexes = lot_line_indexes[lot_id]
+        for offset, output in enumerate(partition_outputs[lot_id, start]):
+            if output is not None:
+                outputs[line_indexes[start + offset]] = f'{lot_id} {output}'
+    return outputs
+
+
+def replay_file(input_file, output_file, workers=None, lot_tagged=False, min_partition_size=MIN_PARTITION_SIZE):
+    """
+    This function replays every query of the input_file with replay_queries, and writes their outputs to the
+    output_file. It gives the same output as execute_query_stream when the input is not lot tagged.
+    :param input_file:file Text file to read the queries from, one query per line.
+    :param output_file:file Text file to write the outputs to, one output per line.
+    :param workers:int Number of worker processes, it defaults to the number of CPUs.
+    :param lot_tagged:boolean Whether every line starts with the id of the parking lot it is executed on.
+    :param min_partition_size:int Number of queries above which a partition is replayed in a worker process.
+    """
+
+    queries = input_file.read().split('\n')
+    # A trailing new line does not start another query.
+    if queries and not queries[-1]:
+        queries.pop()
+
+    outputs = [output for output in replay_queries(queries, workers, lot_tagged, min_partition_size)
+               if output is not None]
+    if outputs:
+        output_file.write('\n'.join(outputs) + '\n')
+    output_file.flush()
@@ -0,0 +1,270 @@
+import argparse
+import asyncio
+from collections import deque
+
+from parking_management import ParkingManagement
+
+# Maximum number of queries of a connection that may wait for their output, before the connection stops being read.
+MAX_PENDING_QUERIES = 1024
+
+# Maximum number of bytes of a query, longer queries are answered with an error and dropped.
+MAX_QUERY_LENGTH = 1 << 16
+
+
+class ParkingServer:
+    """
+    This is the asyncio TCP server of the Parking Management System. It speaks the query protocol of parse_commands,
+    one query per line in and one output per line out, in the same order.
+    Clients may pipeline queries without waiting for their output. The queries received from every connection within
+    an event loop tick are executed together once per tick through execute_queries, and a connection is not read
+    further while MAX_PENDING_QUERIES of its queries are waiting for their output to be written.
+    """
+
+    def __init__(self, parking_management=None, max_pending_queries=MAX_PENDING_QUERIES,
+                 max_query_length=MAX_QUERY_LENGTH):
+        """
+        This constructor method is used to initialize the parking_management, max_pending_queries, max_query_length,
+        pending_queries, connections and server parameters of the class.
+        :param parking_management:obj Object of the ParkingManagement Class, a new one is created if not passed.
+        :param max_pending_queries:int Maximum number of queries of a connection waiting for their output.
+        :param max_query_length:int Maximum number of bytes of a query.
+        """
+
+        self.parking_management = parking_management or ParkingManagement()
+        self.max_pending_queries = max_pending_queries
+        self.max_query_length = max_query_length
+        self.pending_queries = []
+        self.connections = {}
+        self.server = None
+
+    async def start(self, host='127.0.0.1', port=0):
+        """
+        This method starts listening for connections on host and port.
+        :param host:str
+        :param port:int A free port is chosen if it is zero.
+        :return: (host, port):tuple Address the server is listening on.
+        """
+
+        self.server = await asyncio.start_server(self.handle_connection, host, port, limit=self.max_query_length)
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self):
+        """
+        This method serves connections until the server is closed.
+        """
+
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        """
+        This method stops listening for connections, closes the open connections and waits for their handlers to
+        finish.
+        """
+
+        self.server.close()
+        for writer in self.connections.values():
+            writer.close()
+        await asyncio.gather(*self.connections, return_exceptions=True)
+        await self.server.wait_closed()
+
+    def submit_query(self, query):
+        """
+        This method queues the query to be executed with the other queries received in the same event loop tick.
+        :param query:str Command to be executed with arguments separated by " ".
+        :return: future:obj Future set to the output of the query.
+        """
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        if not self.pending_queries:
+            loop.call_soon(self.execute_pending_queries)
+        self.pending_queries.append((query, future))
+
+        return future
+
+    def get_error_future(self, error):
+        """
+        This method returns a future already set to the output of a line which could not be read as a query, so that
+        it is written back in order with the outputs of the queries.
+        :param error:str Description of the error.
+        :return: future:obj
+        """
+
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(f'Error in Query - {error}')
+        return future
+
+    def execute_pending_queries(self):
+        """
+        This method executes every query queued in the current event loop tick as one batch, in the order they were
+        received, and sets their futures to their outputs.
+        """
+
+        pending_queries, self.pending_queries = self.pending_queries, []
+        outputs = self.parking_management.execute_queries([query for query, _ in pending_queries])
+
+        for (_, future), output in zip(pending_queries, outputs):
+            if not future.cancelled():
+                future.set_result('' if output is None else output)
+
+    async def handle_connection(self, reader, writer):
+        """
+        This method reads the queries of a connection line by line and submits them, while write_outputs writes their
+        outputs back in order.
+        :param reader:obj asyncio.StreamReader of the connection
+        :param writer:obj asyncio.StreamWriter of the connection
+        """
+
+        connection = asyncio.current_task()
+        self.connections[connection] = writer
+
+        outputs = asyncio.Queue(self.max_pending_queries)
+        output_writer = asyncio.create_task(self.write_outputs(outputs, writer))
+
+        # Set once a line longer than max_query_length is found, until the rest of it has been read and dropped.
+        dropping_line = False
+
+        try:
+            while True:
+                try:
+                    line = await reader.readuntil(b'\n')
+                except asyncio.IncompleteReadError as error:
+                    # The last line of the connection may not end with a new line.
+                    line = error.partial
+                except asyncio.LimitOverrunError as error:
+                    # The part of the line in the buffer is dropped, and the rest of it once it has been received.
+                    await reader.readexactly(error.consumed)
+                    dropping_line = True
+                    continue
+
+                if dropping_line:
+                    dropping_line = False
+                    future = self.get_error_future(f'Query is longer than {self.max_query_length} bytes')
+                elif not line:
+                    break
+                else:
+                    try:
+                        future = self.submit_query(line.decode().rstrip('\r\n'))
+                    except UnicodeDecodeError as error:
+                        future = self.get_error_future(f'Query is not valid UTF-8 : {error}')
+
+                # The queue is bounded, so reading stops here while too many outputs are waiting to be written.
+                await outputs.put(future)
+                if not line.endswith(b'\n'):
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            await outputs.put(None)
+            await output_writer
+            del self.connections[connection]
+
+    async def write_outputs(self, outputs, writer):
+        """
+        This method writes the outputs of the queries of a connection in order, waiting for the connection to drain
+        once no more outputs are ready, so that a slow client holds back the reading of its own queries.
+        :param outputs:obj asyncio.Queue of the futures of the queries, ended by None.
+        :param writer:obj asyncio.StreamWriter of the connection
+        """
+
+        connection_lost = False
+
+        while True:
+            future = await outputs.get()
+            if future is None:
+                break
+            output = await future
+
+            # Outputs are still taken off the queue after the connection is lost, so that reading is never blocked.
+            if connection_lost:
+                continue
+            try:
+                writer.write(output.encode() + b'\n')
+                if outputs.empty():
+                    await writer.drain()
+            except ConnectionError:
+                connection_lost = True
+
+        writer.close()
+
+
+class ParkingClient:
+    """
+    This is the asyncio client of the ParkingServer. Queries may be pipelined, the outputs are matched to the queries
+    in the order they were sent.
+    """
+
+    def __init__(self):
+        """
+        This constructor method is used to initialize the reader, writer, pending_outputs and output_reader parameters
+        of the class.
+        """
+
+        self.reader = None
+        self.writer = None
+        self.pending_outputs = deque()
+        self.output_reader = None
+
+    async def connect(self, host, port):
+        """
+        This method connects to the ParkingServer listening on host and port.
+        :param host:str
+        :param port:int
+        """
+
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        self.output_reader = asyncio.create_task(self.read_outputs())
+
+    async def read_outputs(self):
+        """
+        This method reads the outputs line by line and sets the futures of the queries in the order they were sent.
+        """
+
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                break
+            self.pending_outputs.popleft().set_result(line.decode().rstrip('\n'))
+
+        while self.pending_outputs:
+            self.pending_outputs.popleft().set_exception(ConnectionError('Connection closed by the server'))
+
+    async def execute_query(self, query):
+        """
+        This method sends the query to the server and returns its output. Other queries may be sent before the output
+        is received.
+        :param query:str Command to be executed with arguments separated by " ".
+        :return: output:str Output of the query.
+        """
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending_outputs.append(future)
+        self.writer.write(query.encode() + b'\n')
+        await self.writer.drain()
+        return await future
+
+    async def close(self):
+        """
+        This method closes the connection to the server.
+        """
+
+        self.writer.close()
+        await self.writer.wait_closed()
+        await self.output_reader
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', action="store", default='127.0.0.1', dest='host', help="Host to listen on")
+    parser.add_argument('--port', action="store", type=int, default=9000, dest='port', help="Port to listen on")
+
+    args = parser.parse_args()
+
+    async def main():
+        parking_server = ParkingServer()
+        await parking_server.start(args.host, args.port)
+        await parking_server.serve_forever()
+
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+from collections import OrderedDict
+
+# Maximum number of results held by a QueryCache.
+QUERY_CACHE_SIZE = 256
+
+
+class QueryCache:
+    """
+    QueryCache class is a bounded least recently used cache of the results of the driver's age queries. Every result
+    is stored along with the driver's age it was computed for, so that parking or leaving of a car only invalidates
+    the results for the age of its driver.
+    """
+
+    def __init__(self, max_size=QUERY_CACHE_SIZE):
+        """
+        This constructor method is used to initialize the parameters of the class.
+        max_size -> Maximum number of results held, the least recently used result is evicted beyond it. No result is
+        held if it is zero.
+        results -> Ordered dictionary of query key to result, from the least to the most recently used.
+        driver_age_keys -> Dictionary of driver's age to the set of query keys of the results for that age.
+        hits -> Number of lookups that found a result.
+        misses -> Number of lookups that did not find a result.
+        """
+
+        self.max_size = max_size
+        self.results = OrderedDict()
+        self.driver_age_keys = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, count_miss=True):
+        """
+        This method returns the result for the query key, and marks it as the most recently used.
+        :param key:hashable Query key
+        :param count_miss:boolean False if the caller looks up another query key on a miss, which counts the lookup
+        instead, so that every lookup is counted once.
+        :return: result or None if there is no result for the query key.
+        """
+
+        result = self.results.get(key)
+        if result is None:
+            if count_miss:
+                self.misses += 1
+        else:
+            self.hits += 1
+            self.results.move_to_end(key)
+        return result
+
+    def put(self, key, driver_age, result):
+        """
+        This method stores the result for the query key, evicting the least recently used result if the cache is full.
+        :param key:hashable Query key
+        :param driver_age:int Driver's age the result was computed for
+        :param result: Result of the query, it must not be None.
+        """
+
+        if self.max_size <= 0:
+            return
+
+        if key not in self.results and len(self.results) >= self.max_size:
+            evicted_key, _ = self.results.popitem(last=False)
+            self.discard_driver_age_key(evicted_key)
+
+        self.results[key] = result
+        self.driver_age_keys.setdefault(driver_age, set()).add(key)
+
+    def discard_driver_age_key(self, key):
+        """
+        This method removes an evicted query key from driver_age_keys. The driver's age is the second item of every
+        query key.
+        :param key:tuple Query key
+        """
+
+        keys = self.driver_age_keys.get(key[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self.driver_age_keys[key[1]]
+
+    def invalidate_driver_age(self, driver_age):
+        """
+        This method removes all the results for the driver's age.
+        :param driver_age:int
+        """
+
+        keys = self.driver_age_keys.pop(driver_age, None)
+        if keys:
+            for key in keys:
+                del self.results[key]
+
+    def clear(self):
+        """
+        This method removes all the results.
+        """
+
+        self.results.clear()
+        self.driver_age_keys.clear()
+
+    def get_hit_rate(self):
+        """
+        This method returns the fraction of lookups that found a result.
+        :return: hit_rate:float
+        """
+
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
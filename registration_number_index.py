@@ -0,0 +1,235 @@
+from bisect import bisect_left, insort
+from sys import intern
+
+# Character sorting after every character of a vehicle registration number, used as the upper bound of a prefix.
+MAX_CHARACTER = chr(0x10FFFF)
+
+# Number of strings of a chunk of a SortedStringList, a chunk is split in two once it holds twice as many.
+CHUNK_SIZE = 512
+
+
+def get_region_code(vehicle_registration_number):
+    """
+    This function returns the region code of a vehicle registration number, which is the part before its second "-",
+    e.g. "KA-01" for "KA-01-HH-1234". A vehicle registration number with fewer than two "-" is its own region code.
+    :param vehicle_registration_number:str
+    :return: region_code:str
+    """
+
+    first_separator = vehicle_registration_number.find('-')
+    if first_separator == -1:
+        return vehicle_registration_number
+    second_separator = vehicle_registration_number.find('-', first_separator + 1)
+    if second_separator == -1:
+        return vehicle_registration_number
+    return vehicle_registration_number[:second_separator]
+
+
+def get_prefix_range(sorted_strings, prefix):
+    """
+    This function returns the range of the strings starting with prefix in a sorted list of strings.
+    :param sorted_strings:list
+    :param prefix:str
+    :return: (start:int, end:int) The range with end excluded.
+    """
+
+    return bisect_left(sorted_strings, prefix), bisect_left(sorted_strings, prefix + MAX_CHARACTER)
+
+
+class SortedStringList:
+    """
+    SortedStringList class is a sorted list of distinct strings, held as a list of sorted chunks of at most
+    2 * CHUNK_SIZE strings along with the largest string of every chunk. A string is added or removed with a bisect
+    over the chunks and a shift of a single chunk, so the cost does not grow with the number of strings, unlike insort
+    into one flat list which shifts every string after the insertion point.
+    """
+
+    def __init__(self, sorted_strings=()):
+        """
+        This constructor method is used to initialize the parameters of the class.
+        chunks -> List of the sorted chunks, every chunk holding strings greater than the ones of the chunk before.
+        maxes -> List of the largest string of every chunk.
+        :param sorted_strings:list Distinct strings in increasing order.
+        """
+
+        self.chunks = [list(sorted_strings[index:index + CHUNK_SIZE])
+                       for index in range(0, len(sorted_strings), CHUNK_SIZE)]
+        self.maxes = [chunk[-1] for chunk in self.chunks]
+
+    def __len__(self):
+        """
+        This method returns the number of strings in the list.
+        :return: length:int
+        """
+
+        return sum(map(len, self.chunks))
+
+    def __iter__(self):
+        """
+        This method returns an iterator over the strings in increasing order.
+        :return: iterator:obj
+        """
+
+        for chunk in self.chunks:
+            yield from chunk
+
+    def add(self, string):
+        """
+        This method adds a string to the list.
+        :param string:str
+        """
+
+        if not self.chunks:
+            self.chunks.append([string])
+            self.maxes.append(string)
+            return
+
+        # The string goes to the first chunk whose largest string is not smaller, or to the last chunk.
+        index = min(bisect_left(self.maxes, string), len(self.chunks) - 1)
+        chunk = self.chunks[index]
+        insort(chunk, string)
+        self.maxes[index] = chunk[-1]
+
+        if len(chunk) > 2 * CHUNK_SIZE:
+            self.chunks[index + 1:index + 1] = [chunk[CHUNK_SIZE:]]
+            del chunk[CHUNK_SIZE:]
+            self.maxes[index:index + 1] = [chunk[-1], self.chunks[index + 1][-1]]
+
+    def remove(self, string):
+        """
+        This method removes a string from the list.
+        :param string:str It must be in the list.
+        """
+
+        index = bisect_left(self.maxes, string)
+        chunk = self.chunks[index]
+        del chunk[bisect_left(chunk, string)]
+
+        if chunk:
+            self.maxes[index] = chunk[-1]
+        else:
+            del self.chunks[index]
+            del self.maxes[index]
+
+    def get_strings_with_prefix(self, prefix):
+        """
+        This method returns the strings of the list starting with prefix, in increasing order.
+        :param prefix:str
+        :return: strings:list
+        """
+
+        strings = []
+        for index in range(bisect_left(self.maxes, prefix), len(self.chunks)):
+            chunk = self.chunks[index]
+            start, end = get_prefix_range(chunk, prefix)
+            strings.extend(chunk[start:end])
+            if end < len(chunk):
+                break
+        return strings
+
+
+class RegistrationNumberIndex:
+    """
+    RegistrationNumberIndex class is a prefix index over the vehicle registration numbers of the parked cars.
+    The vehicle registration numbers are split by region code into SortedStringLists, so that parking or leaving of a
+    car only updates a chunk of the list of its region code, and a prefix is looked up with bisect in
+    O(log n + matches). Region codes and vehicle registration numbers are interned, so every repeated region code is
+    stored once.
+    """
+
+    def __init__(self):
+        """
+        This constructor method is used to initialize the parameters of the class.
+        region_codes -> Sorted list of the region codes of the parked cars.
+        region_vehicle_registration_numbers -> Dictionary of region code to the SortedStringList of the vehicle
+        registration numbers of the parked cars with that region code.
+        """
+
+        self.region_codes = []
+        self.region_vehicle_registration_numbers = {}
+
+    def __len__(self):
+        """
+        This method returns the number of vehicle registration numbers in the index.
+        :return: length:int
+        """
+
+        return sum(map(len, self.region_vehicle_registration_numbers.values()))
+
+    def add(self, vehicle_registration_number):
+        """
+        This method adds a vehicle registration number to the index.
+        :param vehicle_registration_number:str
+        :return: vehicle_registration_number:str The interned vehicle registration number.
+        """
+
+        vehicle_registration_number = intern(vehicle_registration_number)
+        region_code = intern(get_region_code(vehicle_registration_number))
+
+        vehicle_registration_numbers = self.region_vehicle_registration_numbers.get(region_code)
+        if vehicle_registration_numbers is None:
+            vehicle_registration_numbers = self.region_vehicle_registration_numbers[region_code] = SortedStringList()
+            insort(self.region_codes, region_code)
+        vehicle_registration_numbers.add(vehicle_registration_number)
+
+        return vehicle_registration_number
+
+    def remove(self, vehicle_registration_number):
+        """
+        This method removes a vehicle registration number from the index. The region code is removed once no parked car
+        has it.
+        :param vehicle_registration_number:str
+        """
+
+        region_code = get_region_code(vehicle_registration_number)
+        vehicle_registration_numbers = self.region_vehicle_registration_numbers[region_code]
+        vehicle_registration_numbers.remove(vehicle_registration_number)
+        if not vehicle_registration_numbers.chunks:
+            del self.region_vehicle_registration_numbers[region_code]
+            del self.region_codes[bisect_left(self.region_codes, region_code)]
+
+    def load(self, vehicle_registration_numbers):
+        """
+        This method replaces the content of the index with the vehicle registration numbers, building it in bulk.
+        :param vehicle_registration_numbers:iterable Distinct vehicle registration numbers.
+        """
+
+        region_vehicle_registration_numbers = {}
+        for vehicle_registration_number in vehicle_registration_numbers:
+            vehicle_registration_number = intern(vehicle_registration_number)
+            region_code = intern(get_region_code(vehicle_registration_number))
+            region_vehicle_registration_numbers.setdefault(region_code, []).append(vehicle_registration_number)
+        self.region_vehicle_registration_numbers = {
+            region_code: SortedStringList(sorted(vehicle_registration_numbers_of_region))
+            for region_code, vehicle_registration_numbers_of_region in region_vehicle_registration_numbers.items()}
+        self.region_codes = sorted(self.region_vehicle_registration_numbers)
+
+    def clear(self):
+        """
+        This method removes all the vehicle registration numbers.
+        """
+
+        self.region_codes = []
+        self.region_vehicle_registration_numbers = {}
+
+    def get_vehicle_registration_numbers_with_prefix(self, prefix):
+        """
+        This method returns the vehicle registration numbers starting with prefix, ordered by region code and vehicle
+        registration number. A prefix holding a whole region code is looked up in the list of that region code only,
+        otherwise every region code starting with the prefix is matched.
+        :param prefix:str
+        :return: vehicle_registration_numbers:list
+        """
+
+        region_code = get_region_code(prefix)
+        if region_code != prefix:
+            vehicle_registration_numbers = self.region_vehicle_registration_numbers.get(region_code)
+            if vehicle_registration_numbers is None:
+                return []
+            return vehicle_registration_numbers.get_strings_with_prefix(prefix)
+
+        start, end = get_prefix_range(self.region_codes, prefix)
+        result = []
+        for region_code in self.region_codes[start:end]:
+            result.extend(self.region_vehicle_registration_numbers[region_code])
+        return result
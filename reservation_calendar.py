@@ -0,0 +1,213 @@
+from heapq import heapify, heappush, heappop
+
+from Models.Reservation import Reservation
+
+# Number of seconds after the start of its time window after which the parking slot held for a car that has not
+# arrived is released.
+NO_SHOW_GRACE_PERIOD = 15 * 60
+
+# Events of the calendar, the parking slot is held for a reservation at the start of its time window and released at
+# its no-show deadline if the car has not arrived.
+START_EVENT = 0
+NO_SHOW_EVENT = 1
+
+
+class ReservationCalendar:
+    """
+    ReservationCalendar class holds the outstanding reservations of a parking lot, and a calendar queue of their start
+    and no-show events. The calendar is a min heap ordered by event time, so scheduling a reservation and taking the due
+    events are O(log n) and the parking lot is never scanned. Cancelled reservations leave their events in the heap,
+    and those events are skipped once they are due. Admission of a new reservation scans the outstanding ones.
+    """
+
+    def __init__(self, no_show_grace_period=NO_SHOW_GRACE_PERIOD):
+        """
+        This constructor method is used to initialize the parameters of the class.
+        no_show_grace_period -> Number of seconds after the start of a time window after which the parking slot of a
+        car that has not arrived is released.
+        events -> Min heap of (event_time, reservation_id, event) tuples.
+        reservations -> Dictionary of reservation id to the booked and held reservations.
+        vehicle_reservations -> Dictionary of vehicle registration number to its booked or held reservation.
+        held_parking_slots_count -> Number of parking slots held for reservations.
+        next_reservation_id -> Id of the next reservation booked.
+        """
+
+        self.no_show_grace_period = no_show_grace_period
+        self.events = []
+        self.reservations = {}
+        self.vehicle_reservations = {}
+        self.held_parking_slots_count = 0
+        self.next_reservation_id = 1
+
+    def __len__(self):
+        """
+        This method returns the number of booked and held reservations.
+        :return: length:int
+        """
+
+        return len(self.reservations)
+
+    def book(self, vehicle_registration_number, start_time, end_time, vehicle_type='Car'):
+        """
+        This method books a reservation for the car, and schedules its start event.
+        :param vehicle_registration_number:str
+        :param start_time:float Start of the time window in seconds since the epoch.
+        :param end_time:float End of the time window in seconds since the epoch.
+        :param vehicle_type:str
+        :return: reservation:obj Object of the Reservation Class.
+        """
+
+        if end_time <= start_time:
+            raise ValueError('End of the reservation must be after its start')
+        if vehicle_registration_number in self.vehicle_reservations:
+            raise ValueError(f'Car with vehicle registration number "{vehicle_registration_number}" already has a '
+                             f'reservation')
+
+        reservation = Reservation(self.next_reservation_id, vehicle_registration_number, start_time, end_time,
+                                  vehicle_type)
+        self.next_reservation_id += 1
+
+        self.reservations[reservation.reservation_id] = reservation
+        self.vehicle_reservations[vehicle_registration_number] = reservation
+        heappush(self.events, (start_time, reservation.reservation_id, START_EVENT))
+        return reservation
+
+    def get_peak_reservations_count(self, start_time, end_time, vehicle_types=None):
+        """
+        This method returns the largest number of outstanding reservations whose time windows overlap at the same time
+        within the time window [start_time..end_time).
+        :param start_time:float Start of the time window in seconds since the epoch.
+        :param end_time:float End of the time window in seconds since the epoch.
+        :param vehicle_types:set Vehicle types of the reservations counted, every reservation is counted if not passed.
+        :return: peak_reservations_count:int
+        """
+
+        # A time window ending at a time frees its parking slot before a time window starting at that time takes one,
+        # so the ends (-1) are sorted before the starts (+1) of the same time.
+        boundaries = []
+        for reservation in self.reservations.values():
+            if reservation.start_time < end_time and start_time < reservation.end_time and \
+                    (vehicle_types is None or reservation.vehicle_type in vehicle_types):
+                boundaries.append((max(reservation.start_time, start_time), 1))
+                boundaries.append((reservation.end_time, -1))
+        boundaries.sort()
+
+        peak_reservations_count = reservations_count = 0
+        for _, change in boundaries:
+            reservations_count += change
+            peak_reservations_count = max(peak_reservations_count, reservations_count)
+        return peak_reservations_count
+
+    def load(self, reservations, next_reservation_id):
+        """
+        This method loads the booked and held reservations into an empty calendar, and schedules the start event of
+        every booked reservation and the no-show event of every held reservation.
+        :param reservations:list List of Reservation objects.
+        :param next_reservation_id:int Id of the next reservation booked.
+        """
+
+        for reservation in reservations:
+            self.reservations[reservation.reservation_id] = reservation
+            self.vehicle_reservations[reservation.vehicle_registration_number] = reservation
+            if reservation.status == 'held':
+                self.held_parking_slots_count += 1
+                no_show_time = min(reservation.start_time + self.no_show_grace_period, reservation.end_time)
+                self.events.append((no_show_time, reservation.reservation_id, NO_SHOW_EVENT))
+            else:
+                self.events.append((reservation.start_time, reservation.reservation_id, START_EVENT))
+        heapify(self.events)
+        self.next_reservation_id = next_reservation_id
+
+    def get_next_event_time(self):
+        """
+        This method returns the time of the next event of the calendar.
+        :return: event_time:float or None if the calendar is empty.
+        """
+
+        return self.events[0][0] if self.events else None
+
+    def pop_due_events(self, now):
+        """
+        This method takes the events due at or before now out of the calendar, skipping the events of the reservations
+        which are no longer outstanding.
+        :param now:float Current time in seconds since the epoch.
+        :return: due_events:list List of (event:int, reservation:obj) tuples in the order of their event time.
+        """
+
+        due_events = []
+        events = self.events
+        while events and events[0][0] <= now:
+            _, reservation_id, event = heappop(events)
+            reservation = self.reservations.get(reservation_id)
+            if reservation is None:
+                continue
+            if (event == START_EVENT and reservation.status == 'booked') or \
+                    (event == NO_SHOW_EVENT and reservation.status == 'held'):
+                due_events.append((event, reservation))
+        return due_events
+
+    def hold(self, reservation, parking_slot):
+        """
+        This method holds the parking slot for a reservation whose time window has started, and schedules its no-show
+        event.
+        :param reservation:obj
+        :param parking_slot:int
+        """
+
+        reservation.parking_slot = parking_slot
+        reservation.status = 'held'
+        self.held_parking_slots_count += 1
+        no_show_time = min(reservation.start_time + self.no_show_grace_period, reservation.end_time)
+        heappush(self.events, (no_show_time, reservation.reservation_id, NO_SHOW_EVENT))
+
+    def finish(self, reservation, status):
+        """
+        This method removes a reservation from the outstanding reservations, with its final status. The parking slot
+        held for it, if any, is returned and is no longer held.
+        :param reservation:obj
+        :param status:str One of 'claimed', 'expired', 'cancelled' and 'unavailable'.
+        :return: parking_slot:int or None if no parking slot was held for the reservation.
+        """
+
+        parking_slot = reservation.parking_slot if reservation.status == 'held' else None
+        if parking_slot is not None:
+            self.held_parking_slots_count -= 1
+
+        reservation.status = status
+        del self.reservations[reservation.reservation_id]
+        del self.vehicle_reservations[reservation.vehicle_registration_number]
+        # Every event left belongs to a finished reservation once no reservation is outstanding.
+        if not self.reservations:
+            self.events = []
+        return parking_slot
+
+    def get_vehicle_reservation(self, vehicle_registration_number):
+        """
+        This method returns the outstanding reservation of the car.
+        :param vehicle_registration_number:str
+        :return: reservation:obj or None if the car has no outstanding reservation.
+        """
+
+        return self.vehicle_reservations.get(vehicle_registration_number)
+
+    def get_reservation(self, reservation_id):
+        """
+        This method returns an outstanding reservation.
+        :param reservation_id:int
+        :return: reservation:obj
+        """
+
+        try:
+            return self.reservations[reservation_id]
+        except KeyError:
+            raise ValueError(f'Reservation {reservation_id} does not exist') from None
+
+    def clear(self):
+        """
+        This method removes all the reservations and events.
+        """
+
+        self.events = []
+        self.reservations = {}
+        self.vehicle_reservations = {}
+        self.held_parking_slots_count = 0
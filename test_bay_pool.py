@@ -0,0 +1,29 @@
+import unittest
+from Models.BayPool import BayPool
+
+
+class TestBayPool(unittest.TestCase):
+    """
+    This is a Test class which contains the methods for unit testing the methods present in BayPool Class.
+    It asserts the value returned by calling the method in BayPool Class against the expected output.
+    """
+
+    def test_get_nearest_empty_parking_slot(self):
+        bay_pool = BayPool("Truck", 5, 7)
+        result = [bay_pool.get_nearest_empty_parking_slot() for _ in range(3)]
+        self.assertEqual([5, 6, 7], result)
+        self.assertFalse(bay_pool.has_empty_parking_slot())
+        self.assertRaises(IndexError, bay_pool.get_nearest_empty_parking_slot)
+
+    def test_release_parking_slot(self):
+        bay_pool = BayPool("Truck", 5, 7)
+        for _ in range(3):
+            bay_pool.get_nearest_empty_parking_slot()
+        bay_pool.release_parking_slot(7)
+        bay_pool.release_parking_slot(6)
+        self.assertTrue(bay_pool.has_empty_parking_slot())
+        self.assertEqual(6, bay_pool.get_nearest_empty_parking_slot())
+
+
+if __name__ == '__main__':
+    unittest.main()
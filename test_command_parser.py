@@ -0,0 +1,48 @@
+import unittest
+from command_parser import parse_query
+
+
+class TestCommandParser(unittest.TestCase):
+    """
+    This is a Test class which contains the methods for unit testing the functions present in command_parser module.
+    It asserts the Command object returned by parse_query against the expected command name and typed arguments.
+    """
+
+    def test_parse_query(self):
+        result = parse_query("Park KA-01-HH-1234 driver_age 21")
+        self.assertEqual("Park", result.name)
+        self.assertEqual(("KA-01-HH-1234", 21), result.arguments)
+        self.assertIsNone(result.error)
+
+    def test_parse_query_with_command_prefix(self):
+        result = parse_query("Parking KA-01-HH-1234 driver_age 21")
+        self.assertEqual("Park", result.name)
+        self.assertEqual(("KA-01-HH-1234", 21), result.arguments)
+
+    def test_parse_query_with_invalid_arguments(self):
+        result = parse_query("Leave x")
+        self.assertEqual("Leave", result.name)
+        self.assertIsInstance(result.error, ValueError)
+
+    def test_parse_query_with_vehicle_type(self):
+        result = parse_query("Park KA-01-HH-1234 driver_age 21 vehicle_type Truck")
+        self.assertEqual(("KA-01-HH-1234", 21, "Truck"), result.arguments)
+
+    def test_parse_query_with_bay_counts(self):
+        result = parse_query("Create_parking_lot 6 bays Motorcycle 2 Car 4")
+        self.assertEqual((6, (("Motorcycle", 2), ("Car", 4))), result.arguments)
+        self.assertIsInstance(parse_query("Create_parking_lot 6 bays Motorcycle").error, ValueError)
+        self.assertIsInstance(parse_query("Create_parking_lot 6 bays Motorcycle 2 Car 2").error, ValueError)
+        self.assertIsInstance(parse_query("Create_parking_lot 6 bays Bus 6").error, ValueError)
+
+    def test_parse_query_ignores_extra_tokens(self):
+        self.assertEqual((6,), parse_query("Create_parking_lot 6 x").arguments)
+        self.assertEqual(("KC", 1), parse_query("Park KC driver_age 1 a b").arguments)
+
+    def test_parse_query_not_recognized(self):
+        result = parse_query("Unpark 1")
+        self.assertIsNone(result.name)
+
+
+if __name__ == '__main__':
+    unittest.main()
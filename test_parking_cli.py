@@ -0,0 +1,60 @@
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from parking_cli import main, parse_arguments
+from parking_management import ParkingManagement
+
+
+class TestParkingCli(unittest.TestCase):
+    """
+    This is a Test class which contains the methods for unit testing the command line runner of the Parking Management
+    System. It asserts the parsed arguments and the output file written by the runner against the expected output.
+    """
+
+    def test_parse_arguments(self):
+        result = parse_arguments(["--input_file=input.txt", "--output_file", "output.txt", "--workers=4"])
+        self.assertEqual({"input_file": "input.txt", "output_file": "output.txt", "snapshot_file": None, "workers": 4,
+                          "lot_tagged": False}, result)
+        with redirect_stderr(io.StringIO()):
+            self.assertRaises(SystemExit, parse_arguments, ["--output_file=output.txt"])
+            self.assertRaises(SystemExit, parse_arguments, ["--input_file=input.txt", "--workers=four"])
+
+    def test_main_with_snapshot_file(self):
+        from parking_persistence import write_snapshot
+
+        parking_management = ParkingManagement()
+        parking_management.create_parking_slots(6)
+        parking_management.issue_parking_ticket("KA-01-HH-1234", 21)
+        with tempfile.TemporaryDirectory() as directory:
+            snapshot_path = os.path.join(directory, "snapshot.bin")
+            input_path = os.path.join(directory, "input.txt")
+            output_path = os.path.join(directory, "output.txt")
+            write_snapshot(parking_management, snapshot_path)
+            with open(input_path, "w") as input_file:
+                input_file.write("Park PB-01-HH-1234 driver_age 21\nSlot_numbers_for_driver_of_age 21\n")
+            main(["--input_file", input_path, "--output_file", output_path, "--snapshot_file", snapshot_path])
+            with open(output_path) as output_file:
+                result = output_file.read()
+        self.assertEqual('Car with vehicle registration number "PB-01-HH-1234" has been parked at slot number 2\n'
+                         '1,2\n', result)
+
+    def test_parking_management_script_is_loaded_once(self):
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, "input.txt")
+            with open(input_path, "w") as input_file:
+                input_file.write("Create_parking_lot 6\n")
+            result = subprocess.run([sys.executable, "-X", "importtime", "parking_management.py",
+                                     f"--input_file={input_path}"], capture_output=True, text=True,
+                                    cwd=os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual("Created parking of 6 slots\n", result.stdout)
+        imported_modules = [line.rpartition("|")[2].strip() for line in result.stderr.splitlines()]
+        self.assertNotIn("parking_management", imported_modules)
+        self.assertIn("parking_cli", imported_modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+from parking_management import ParkingManagement
+from parking_history import TicketHistory
+
+
+class TestTicketHistory(unittest.TestCase):
+    """
+    This is a Test class which contains the methods for unit testing the TicketHistory Class, recording the parking
+    tickets of the cars that left a ParkingManagement. It asserts the analytics against the recorded parking tickets.
+    """
+
+    def get_history(self):
+        history = TicketHistory()
+        history.extend([0, 10, 20, 30], [100, 40, 25, 60], [21, 25, 40, 62], [1, 2, 3, 4])
+        return history
+
+    def test_enable_history(self):
+        parking_management = ParkingManagement()
+        times = iter([10.0, 20.0, 50.0])
+        parking_management.clock = lambda: next(times)
+        history = parking_management.enable_history()
+        parking_management.create_parking_slots(6)
+        parking_management.issue_parking_ticket("KA-01-HH-1234", 21)
+        parking_management.issue_parking_ticket("PB-01-HH-1234", 40)
+        parking_ticket = parking_management.return_parking_ticket(1)
+        self.assertEqual((10.0, 50.0), (parking_ticket.get_entry_time(), parking_ticket.get_exit_time()))
+        self.assertEqual(1, len(history))
+        self.assertEqual([21], list(history.driver_ages))
+
+    def test_leave_with_driver_age_out_of_range(self):
+        parking_management = ParkingManagement()
+        history = parking_management.enable_history()
+        parking_management.create_parking_slots(2)
+        parking_management.issue_parking_ticket("KA-01-HH-1234", 3000000000)
+        parking_management.issue_parking_ticket("PB-01-HH-1234", 2 ** 63)
+        self.assertEqual(1, parking_management.return_parking_ticket(1).get_parking_slot())
+        self.assertEqual([3000000000], list(history.driver_ages))
+        self.assertRaises(OverflowError, parking_management.return_parking_ticket, 2)
+        self.assertEqual([1, 1], [len(history.entry_times), len(history.driver_ages)])
+        self.assertEqual(["Car with vehicle registration number \"DL-01-HH-1234\" has been parked at slot number 1",
+                          "Car with vehicle registration number \"MH-01-HH-1234\" has been parked at slot number 2"],
+                         parking_management.execute_queries(["Park DL-01-HH-1234 driver_age 21",
+                                                             "Park MH-01-HH-1234 driver_age 21"]))
+
+    def test_extend_with_columns_of_different_lengths(self):
+        history = self.get_history()
+        self.assertRaises(ValueError, history.extend, [0, 10], [20, 30], [21], [1, 2])
+        self.assertRaises(OverflowError, history.extend, [0], [20], [2 ** 63], [1])
+        self.assertEqual([4, 4, 4, 4], list(map(len, (history.entry_times, history.exit_times, history.driver_ages,
+                                                       history.parking_slots))))
+
+    def test_get_occupancy(self):
+        history = self.get_history()
+        self.assertEqual([0, 1, 3, 3, 1, 0], history.get_occupancy([-1, 0, 20, 30, 60, 100]))
+
+    def test_get_peak_occupancy(self):
+        self.assertEqual((20.0, 3), self.get_history().get_peak_occupancy())
+        self.assertEqual((None, 0), TicketHistory().get_peak_occupancy())
+
+    def test_get_dwell_time_percentiles(self):
+        history = self.get_history()
+        self.assertEqual({50: 30.0, 100: 100.0}, history.get_dwell_time_percentiles((50, 100)))
+        self.assertRaises(ValueError, TicketHistory().get_dwell_time_percentiles)
+
+    def test_get_driver_age_distribution(self):
+        history = self.get_history()
+        self.assertEqual({20: 2, 40: 1, 60: 1}, history.get_driver_age_distribution())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from parking_lot_manager import ParkingLotManager
+
+
+class TestParkingLotManager(unittest.TestCase):
+    """
+    This is a Test class which contains the methods for unit testing the methods present in ParkingLotManager Class.
+    It asserts the value returned by calling the method in ParkingLotManager Class against the expected output.
+    """
+
+    def test_create_parking_lot(self):
+        parking_lot_manager = ParkingLotManager()
+        result = parking_lot_manager.create_parking_lot("North", 6)
+        self.assertEqual(True, result)
+
+    def test_issue_parking_ticket(self):
+        parking_lot_manager = ParkingLotManager()
+        parking_lot_manager.create_parking_lot("North", 6)
+        parking_lot_manager.create_parking_lot("South", 6)
+        parking_lot_manager.issue_parking_ticket("North", "WB-01-RM-1234", "23")
+        result = parking_lot_manager.issue_parking_ticket("South", "WB-01-RM-5678", "23")
+        self.assertEqual(1, result)
+        self.assertRaises(KeyError, parking_lot_manager.issue_parking_ticket, "East", "WB-01-RM-9012", "23")
+
+    def test_return_parking_ticket(self):
+        parking_lot_manager = ParkingLotManager()
+        parking_lot_manager.create_parking_lot("North", 6)
+        parking_lot_manager.issue_parking_ticket("North", "WB-01-RM-1234", "23")
+        result = parking_lot_manager.return_parking_ticket("North", 1)
+        self.assertEqual("WB-01-RM-1234", result.get_vehicle_registration_number())
+
+    def test_get_parking_slot_number_from_vehicle_registration_number(self):
+        parking_lot_manager = ParkingLotManager()
+        parking_lot_manager.create_parking_lot("North", 6)
+        parking_lot_manager.create_parking_lot("South", 6)
+        parking_lot_manager.issue_parking_ticket("North", "WB-01-RM-1234", "23")
+        parking_lot_manager.issue_parking_ticket("South", "WB-01-RM-5678", "23")
+        parking_lot_manager.issue_parking_ticket("South", "WB-01-RM-9012", "23")
+        result = parking_lot_manager.get_parking_slot_number_from_vehicle_registration_number("WB-01-RM-9012")
+        self.assertEqual(("South", 2), result)
+
+    def test_concurrent_issue_parking_ticket(self):
+        parking_lot_manager = ParkingLotManager()
+        parking_lot_manager.create_parking_lot("North", 1000)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            result = list(executor.map(
+                lambda index: parking_lot_manager.issue_parking_ticket("North", f"WB-01-RM-{index}", "23"),
+                range(1000)))
+        self.assertEqual(list(range(1, 1001)), sorted(result))
+
+
+if __name__ == '__main__':
+    unittest.main()
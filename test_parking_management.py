@@ -1,4 +1,7 @@
+import io
 import unittest
+from contextlib import redirect_stdout
+from command_parser import parse_query
 from parking_management import ParkingManagement
 
 
@@ -14,6 +17,24 @@ class TestParkingLot(unittest.TestCase):
         result = parking_management.create_parking_slots(6)
         self.assertEqual(True, result)
 
+    def test_create_parking_lot_resets_parking_lot(self):
+        parking_management = ParkingManagement()
+        parking_management.create_parking_slots(6)
+        parking_management.issue_parking_ticket("WB-01-RM-1234", "23")
+        parking_management.create_parking_slots(2)
+        self.assertEqual({}, parking_management.occupied_parking_slots)
+        self.assertEqual(1, parking_management.issue_parking_ticket("WB-01-RM-5678", "31"))
+
+    def test_get_nearest_empty_parking_slot(self):
+        parking_management = ParkingManagement()
+        parking_management.create_parking_slots(6)
+        for vehicle_registration_number in ["WB-01-RM-1234", "WB-01-RM-5678", "WB-01-RM-9012"]:
+            parking_management.issue_parking_ticket(vehicle_registration_number, "23")
+        parking_management.return_parking_ticket(2)
+        result = [parking_management.get_nearest_empty_parking_slot() for _ in range(4)]
+        self.assertEqual([2, 4, 5, 6], result)
+        self.assertRaises(IndexError, parking_management.get_nearest_empty_parking_slot)
+
     def test_issue_parking_ticket(self):
         parking_management = ParkingManagement()
         parking_management.create_parking_slots(6)
@@ -27,6 +48,17 @@ class TestParkingLot(unittest.TestCase):
         result = parking_management.return_parking_ticket(1)
         self.assertNotEqual(False, result)
 
+    def test_return_parking_ticket_for_vacant_parking_slot(self):
+        parking_management = ParkingManagement()
+        parking_management.create_parking_slots(6)
+        parking_management.issue_parking_ticket("WB-01-RM-1234", "23")
+        parking_management.issue_parking_ticket("WB-01-RM-5678", "31")
+        parking_management.return_parking_ticket(1)
+        result = parking_management.return_parking_ticket(1)
+        self.assertEqual(False, result)
+        self.assertEqual({2: parking_management.occupied_parking_slots["WB-01-RM-5678"]},
+                         parking_management.parking_slot_tickets)
+
     def test_get_parking_slot_number_from_vehicle_registration_number(self):
         parking_management = ParkingManagement()
         parking_management.create_parking_slots(6)
@@ -41,6 +73,19 @@ class TestParkingLot(unittest.TestCase):
         result = parking_management.get_vehicle_registration_numbers_from_driver_age(23)
         self.assertEqual(["WB-01-RM-1234"], result)
 
+    def test_parking_again_keeps_order_of_cars(self):
+        parking_management = ParkingManagement()
+        parking_management.create_parking_slots(6)
+        parking_management.issue_parking_ticket("WB-01-RM-1234", "23")
+        parking_management.issue_parking_ticket("WB-01-RM-5678", "23")
+        parking_management.issue_parking_ticket("WB-01-RM-9012", "40")
+        parking_management.issue_parking_ticket("WB-01-RM-1234", "23")
+        parking_management.issue_parking_ticket("WB-01-RM-9012", "23")
+        self.assertEqual(["WB-01-RM-1234", "WB-01-RM-5678", "WB-01-RM-9012"],
+                         parking_management.get_vehicle_registration_numbers_from_driver_age(23))
+        self.assertEqual([4, 2, 1], parking_management.get_parking_slots_from_driver_age(23))
+        self.assertEqual([], parking_management.get_parking_slots_from_driver_age(40))
+
     def test_get_parking_slots_from_driver_age(self):
         parking_management = ParkingManagement()
         parking_management.create_parking_slots(6)
@@ -48,6 +93,178 @@ class TestParkingLot(unittest.TestCase):
         result = parking_management.get_parking_slots_from_driver_age(23)
         self.assertEqual([1], result)
 
+    def test_get_vehicle_registration_numbers_from_driver_age_range(self):
+        parking_management = ParkingManagement()
+        parking_management.create_parking_slots(6)
+        parking_management.issue_parking_ticket("WB-01-RM-1234", "23")
+        parking_management.issue_parking_ticket("WB-01-RM-5678", "40")
+        parking_management.issue_parking_ticket("WB-01-RM-9012", "18")
+        parking_management.return_parking_ticket(3)
+        result = parking_management.get_vehicle_registration_numbers_from_driver_age_range(18, 25)
+        self.assertEqual(["WB-01-RM-1234"], result)
+
+    def test_get_parking_slots_from_driver_age_range(self):
+        parking_management = ParkingManagement()
+        parking_management.create_parking_slots(6)
+        parking_management.issue_parking_ticket("WB-01-RM-1234", "23")
+        parking_management.issue_parking_ticket("WB-01-RM-5678", "40")
+        parking_management.issue_parking_ticket("WB-01-RM-9012", "18")
+        result = parking_management.get_parking_slots_from_driver_age_range(18, 25)
+        self.assertEqual([3, 1], result)
+
+    def test_issue_parking_ticket_with_vehicle_type(self):
+        parking_management = ParkingManagement()
+        parking_management.create_parking_slots(6, [("Motorcycle", 1), ("Car", 2), ("EV", 1), ("Truck", 2)])
+        result = [parking_management.issue_parking_ticket("KA-01-HH-1", "21", "EV"),
+                  parking_management.issue_parking_ticket("KA-01-HH-2", "21", "EV"),
+                  parking_management.issue_parking_ticket("KA-01-HH-3", "21", "Motorcycle"),
+                  parking_management.issue_parking_ticket("KA-01-HH-4", "21", "Motorcycle"),
+                  parking_management.issue_parking_ticket("KA-01-HH-5", "21", "Car"),
+                  parking_management.issue_parking_ticket("KA-01-HH-6", "21", "Truck"),
+                  parking_management.issue_parking_ticket("KA-01-HH-7", "21", "Truck")]
+        self.assertEqual([4, 2, 1, 3, 5, 6, -1], result)
+        parking_management.return_parking_ticket(2)
+        self.assertEqual(2, parking_management.issue_parking_ticket("KA-01-HH-8", "21", "Car"))
+        self.assertRaises(ValueError, parking_management.issue_parking_ticket, "KA-01-HH-9", "21", "Bus")
+
+    def test_create_parking_lot_with_invalid_bay_counts(self):
+        parking_management = ParkingManagement()
+        parking_management.create_parking_slots(2)
+        parking_management.issue_parking_ticket("KA-01-HH-1", "21")
+        self.assertRaises(ValueError, parking_management.create_parking_slots, 6, [("Car", 4)])
+        self.assertRaises(ValueError, parking_management.create_parking_slots, 6, [("Bus", 6)])
+        self.assertEqual("Error in Query - Create_parking_lot 6 bays Car 4 : Parking bays add up to 4 parking slots "
+                         "instead of 6", parking_management.execute_query("Create_parking_lot 6 bays Car 4"))
+        self.assertEqual(2, parking_management.issue_parking_ticket("KA-01-HH-2", "21"))
+
+    def test_execute_query_ignores_extra_tokens(self):
+        parking_management = ParkingManagement()
+        self.assertEqual("Created parking of 6 slots", parking_management.execute_query("Create_parking_lot 6 x"))
+        self.assertEqual('Car with vehicle registration number "KC" has been parked at slot number 1',
+                         parking_management.execute_query("Park KC driver_age 1 a b"))
+
+    def test_park_many(self):
+        parking_management = ParkingManagement()
+        parking_management.create_parking_slots(3)
+        parking_management.issue_parking_ticket("WB-01-RM-1234", "23")
+        parking_management.issue_parking_ticket("WB-01-RM-5678", "23")
+        parking_management.return_parking_ticket(1)
+        result = parking_management.park_many([("WB-01-RM-9012", 30), ("WB-01-RM-3456", 31), ("WB-01-RM-7890", 32)])
+        self.assertEqual([1, 3, -1], result)
+        self.assertEqual(3,
+                         parking_management.get_parking_slot_number_from_vehicle_registration_number("WB-01-RM-3456"))
+
+    def test_leave_many(self):
+        parking_management = ParkingManagement()
+        parking_management.create_parking_slots(6)
+        parking_management.park_many([("WB-01-RM-1234", 23), ("WB-01-RM-5678", 23), ("WB-01-RM-9012", 30)])
+        result = parking_management.leave_many([3, 1, 5])
+        self.assertEqual(["WB-01-RM-9012", "WB-01-RM-1234", False],
+                         [parking_ticket and parking_ticket.get_vehicle_registration_number()
+                          for parking_ticket in result])
+        self.assertEqual(1, parking_management.issue_parking_ticket("WB-01-RM-3456", "40"))
+
+    def test_execute_batch_with_car_parked_again(self):
+        commands = [('Create_parking_lot', 3), ('Park', "WB-01-RM-1234", 23), ('Park', "WB-01-RM-1234", 23),
+                    ('Park', "WB-01-RM-5678", 31), ('Park', "WB-01-RM-9012", 30), ('Park', "WB-01-RM-3456", 40),
+                    ('Leave', 2), ('Park', "WB-01-RM-5678", 31), ('Park', "WB-01-RM-7890", 31),
+                    ('Park', "WB-01-RM-7890", 32), ('Park', "WB-01-RM-1111", 50)]
+        parking_management = ParkingManagement()
+        expected = parking_management.execute_batch_commands_one_by_one(commands)
+        self.assertEqual([True, 1, 2, 1, 3, -1, "WB-01-RM-1234", 2, 1, -1, -1],
+                         [result.get_vehicle_registration_number() if hasattr(result, 'get_parking_slot') else result
+                          for result in expected])
+        result = ParkingManagement().execute_batch(commands)
+        self.assertEqual(list(map(repr, expected)), list(map(repr, result)))
+
+    def test_execute_queries(self):
+        queries = ["Create_parking_lot 2", "Park KA-01-HH-1234 driver_age 21", "Park KA-01-HH-9999 driver_age age",
+                   "Park KA-01-BB-0001 driver_age 40", "Park KA-01-HH-7777 driver_age 50", "Leave 1", "Leave x",
+                   "Leave 3", "Slot_numbers_for_driver_of_age 40", "Unknown"]
+        parking_management = ParkingManagement()
+        expected = [parking_management.execute_query(query) for query in queries]
+        self.assertEqual(expected, ParkingManagement().execute_queries(queries))
+
+    def test_execute_queries_with_car_parked_again(self):
+        queries = ["Create_parking_lot 3", "Park KA-01-HH-1234 driver_age 21", "Park KA-01-HH-1234 driver_age 40",
+                   "Park KA-01-BB-0001 driver_age 40", "Park KA-01-HH-7777 driver_age 50",
+                   "Park KA-01-HH-9999 driver_age 21", "Leave 2", "Park KA-01-BB-0001 driver_age 40",
+                   "Park KA-01-HH-5555 driver_age 21", "Park KA-01-HH-6666 driver_age 21",
+                   "Vehicle_registration_number_for_driver_of_age 40", "Slot_numbers_for_driver_of_age 21"]
+        parking_management = ParkingManagement()
+        expected = [parking_management.execute_query(query) for query in queries]
+        self.assertEqual('Car with vehicle registration number "KA-01-HH-5555" has been parked at slot number 1',
+                         expected[8])
+        self.assertEqual(expected, ParkingManagement().execute_queries(queries))
+
+    def test_execute_batch_with_invalid_leave(self):
+        parking_management = ParkingManagement()
+        result = parking_management.execute_batch([
+            ('Create_parking_lot', 2),
+            ('Park', "WB-01-RM-1234", 23),
+            ('Park', "WB-01-RM-5678", 31),
+            ('Leave', 1),
+            ('Leave', [2]),
+            ('Park', "WB-01-RM-9012", 30),
+            ('Park', "WB-01-RM-3456", 40),
+        ])
+        self.assertEqual("WB-01-RM-1234", result[3].get_vehicle_registration_number())
+        self.assertIsInstance(result[4], TypeError)
+        self.assertEqual([1, -1], result[5:])
+
+    def test_execute_batch(self):
+        parking_management = ParkingManagement()
+        result = parking_management.execute_batch([
+            ('Create_parking_lot', 2),
+            ('Park', "WB-01-RM-1234", 23),
+            ('Park', "WB-01-RM-5678", "age"),
+            ('Park', "WB-01-RM-9012", 30),
+            ('Leave', 1),
+            ('Slot_numbers_for_driver_of_age', 30),
+            ('Unknown',),
+        ])
+        self.assertEqual([True, 1], result[:2])
+        self.assertIsInstance(result[2], ValueError)
+        self.assertEqual(2, result[3])
+        self.assertEqual("WB-01-RM-1234", result[4].get_vehicle_registration_number())
+        self.assertEqual([2], result[5])
+        self.assertIsInstance(result[6], ValueError)
+
+    def test_execute_batch_with_parsed_commands(self):
+        parking_management = ParkingManagement()
+        queries = ["Create_parking_lot 2", "Park KA-01-HH-1234 driver_age 21", "Park KA-01-HH-5678 driver_age x",
+                   "Unknown", "Slot_number_for_car_with_number KA-01-HH-1234"]
+        result = parking_management.execute_batch([parse_query(query) for query in queries])
+        self.assertEqual([True, 1], result[:2])
+        self.assertIsInstance(result[2], ValueError)
+        self.assertIsInstance(result[3], ValueError)
+        self.assertEqual(1, result[4])
+
+    def test_execute_query(self):
+        parking_management = ParkingManagement()
+        parking_management.execute_query("Create_parking_lot 6")
+        self.assertEqual('Car with vehicle registration number "KA-01-HH-1234" has been parked at slot number 1',
+                         parking_management.execute_query("Park KA-01-HH-1234 driver_age 21"))
+        self.assertEqual("Error in Query - Park KA-01-HH-1234 : list index out of range",
+                         parking_management.execute_query("Park KA-01-HH-1234"))
+        self.assertEqual("Query not recognized.", parking_management.execute_query("Unpark 1"))
+
+    def test_execute_query_stream(self):
+        queries = ["Create_parking_lot 2", "Park KA-01-HH-1234 driver_age 21", "Parking KA-01-HH-9999 driver_age 40",
+                   "", "Leave x", "Unknown 1", "Slot_numbers_for_driver_of_age 21", "Park KA-01-HH-5678 driver_age 30"]
+
+        parking_management = ParkingManagement()
+        expected_output = io.StringIO()
+        with redirect_stdout(expected_output):
+            for query in queries:
+                parking_management.parse_commands(query)
+
+        parking_management = ParkingManagement()
+        output = io.StringIO()
+        parking_management.execute_query_stream(io.StringIO("\n".join(queries)), output, chunk_size=7,
+                                                lines_per_write=2)
+        self.assertEqual(expected_output.getvalue(), output.getvalue())
+
 
 if __name__ == '__main__':
     unittest.main()
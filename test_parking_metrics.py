@@ -0,0 +1,61 @@
+import unittest
+from parking_management import ParkingManagement
+
+
+class TestParkingMetrics(unittest.TestCase):
+    """
+    This is a Test class which contains the methods for unit testing the ParkingMetrics Class, collecting the metrics
+    of the commands executed by a ParkingManagement. It asserts the metrics against the commands executed.
+    """
+
+    def test_enable_metrics(self):
+        parking_management = ParkingManagement()
+        metrics = parking_management.enable_metrics()
+        for query in ["Create_parking_lot 6", "Park KA-01-HH-1234 driver_age 21", "Park KA-01-HH-5678 driver_age 21",
+                      "Leave 1", "Unpark 1"]:
+            parking_management.execute_query(query)
+        self.assertEqual({"Create_parking_lot": 1, "Park": 2, "Leave": 1, "Not_recognized": 1}, metrics.command_counts)
+        self.assertEqual(2, sum(metrics.command_latency_buckets["Park"]))
+
+    def test_disable_metrics(self):
+        parking_management = ParkingManagement()
+        metrics = parking_management.enable_metrics()
+        parking_management.execute_query("Create_parking_lot 6")
+        parking_management.disable_metrics()
+        parking_management.execute_query("Park KA-01-HH-1234 driver_age 21")
+        self.assertEqual({"Create_parking_lot": 1}, metrics.command_counts)
+
+    def test_get_prometheus_text(self):
+        parking_management = ParkingManagement()
+        metrics = parking_management.enable_metrics()
+        parking_management.execute_query("Create_parking_lot 6")
+        parking_management.execute_query("Park KA-01-HH-1234 driver_age 21")
+        result = metrics.get_prometheus_text(parking_management)
+        self.assertIn("parking_occupied_slots 1\n", result)
+        self.assertIn('parking_commands_total{command="Park"} 1\n', result)
+        self.assertIn('parking_command_duration_seconds_bucket{command="Park",le="+Inf"} 1\n', result)
+
+    def test_get_gauges_with_bay_pools(self):
+        parking_management = ParkingManagement()
+        metrics = parking_management.enable_metrics()
+        parking_management.create_parking_slots(6, [("Motorcycle", 2), ("Car", 4)])
+        parking_management.issue_parking_ticket("KA-01-HH-1234", 21, "Motorcycle")
+        parking_management.issue_parking_ticket("KA-01-HH-5678", 21)
+        parking_management.issue_parking_ticket("KA-01-HH-9012", 21)
+        parking_management.return_parking_ticket(3)
+        result = metrics.get_gauges(parking_management)
+        self.assertEqual({"parking_capacity": 6, "parking_occupied_slots": 2, "parking_vacant_slots": 4,
+                          "parking_available_slots_heap_size": 1, "parking_unallocated_slots": 3}, result)
+
+    def test_start_profiling(self):
+        parking_management = ParkingManagement()
+        metrics = parking_management.enable_metrics()
+        metrics.start_profiling(profile_sample_interval=2)
+        parking_management.execute_query("Create_parking_lot 6")
+        parking_management.execute_query("Park KA-01-HH-1234 driver_age 21")
+        result = metrics.stop_profiling()
+        self.assertIn("issue_parking_ticket", str(result.stats))
+
+
+if __name__ == '__main__':
+    unittest.main()
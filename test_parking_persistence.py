@@ -0,0 +1,198 @@
+import os
+import struct
+import tempfile
+import unittest
+from array import array
+from parking_management import ParkingManagement
+from parking_persistence import SNAPSHOT_V1_HEADER, PersistentParkingManagement, read_snapshot, write_snapshot
+
+
+class TestParkingPersistence(unittest.TestCase):
+    """
+    This is a Test class which contains the methods for unit testing the PersistentParkingManagement Class and the
+    snapshot functions. It asserts the state of a parking lot recovered from disk against the parking lot before.
+    """
+
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.directory = self.temporary_directory.name
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def park_and_leave(self, parking_management):
+        parking_management.create_parking_slots(6)
+        parking_management.issue_parking_ticket("WB-01-RM-1234", "23")
+        parking_management.issue_parking_ticket("WB-01-RM-5678", "40")
+        parking_management.issue_parking_ticket("WB-01-RM-9012", "23")
+        parking_management.return_parking_ticket(2)
+        parking_management.park_many([("WB-01-RM-3456", 23), ("WB-01-RM-7890", 31)])
+
+    def test_recover_from_journal(self):
+        parking_management = PersistentParkingManagement(self.directory)
+        self.park_and_leave(parking_management)
+        parking_management.close()
+
+        result = PersistentParkingManagement(self.directory)
+        self.assertEqual(["WB-01-RM-1234", "WB-01-RM-9012", "WB-01-RM-3456"],
+                         result.get_vehicle_registration_numbers_from_driver_age(23))
+        self.assertEqual(4, result.get_parking_slot_number_from_vehicle_registration_number("WB-01-RM-7890"))
+        self.assertEqual(5, result.issue_parking_ticket("WB-01-RM-1111", "50"))
+        result.close()
+
+    def test_recover_from_snapshot_and_journal(self):
+        parking_management = PersistentParkingManagement(self.directory, snapshot_interval=4)
+        self.park_and_leave(parking_management)
+        parking_management.return_parking_ticket(1)
+        parking_management.close()
+
+        result = PersistentParkingManagement(self.directory)
+        self.assertEqual(["WB-01-RM-9012", "WB-01-RM-3456"],
+                         result.get_vehicle_registration_numbers_from_driver_age(23))
+        self.assertEqual(1, result.issue_parking_ticket("WB-01-RM-1111", "50"))
+        self.assertEqual(["journal-2.bin", "snapshot.bin"], sorted(os.listdir(self.directory)))
+        result.close()
+
+    def test_recover_with_car_parked_again(self):
+        for snapshot_interval in [3, 100]:
+            directory = os.path.join(self.directory, str(snapshot_interval))
+            parking_management = PersistentParkingManagement(directory, snapshot_interval=snapshot_interval)
+            parking_management.create_parking_slots(4)
+            parking_management.issue_parking_ticket("WB-01-RM-1234", "23")
+            parking_management.issue_parking_ticket("WB-01-RM-1234", "23")
+            parking_management.issue_parking_ticket("WB-01-RM-5678", "40")
+            parking_management.issue_parking_ticket("WB-01-RM-5678", "40")
+            parking_management.close()
+
+            result = PersistentParkingManagement(directory)
+            self.assertEqual(list(map(repr, parking_management.occupied_parking_slots.values())),
+                             list(map(repr, result.occupied_parking_slots.values())))
+            self.assertEqual(parking_management.get_nearest_empty_parking_slots(2),
+                             result.get_nearest_empty_parking_slots(2))
+            result.close()
+
+    def test_execute_query_commits_before_returning(self):
+        parking_management = PersistentParkingManagement(self.directory)
+        parking_management.execute_query("Create_parking_lot 6")
+        parking_management.execute_query("Park WB-01-RM-1234 driver_age 23")
+        parking_management.execute_queries(["Park WB-01-RM-5678 driver_age 40", "Leave 1"])
+        parking_management.execute_batch([("Park", "WB-01-RM-9012", 23)])
+        self.assertEqual([], parking_management.pending_records)
+
+        # The journal is read back without closing the parking lot, as after a crash.
+        result = PersistentParkingManagement(self.directory)
+        self.assertEqual(["WB-01-RM-5678", "WB-01-RM-9012"], list(result.occupied_parking_slots))
+        result.close()
+        parking_management.close()
+
+    def test_recover_with_incomplete_journal_record(self):
+        parking_management = PersistentParkingManagement(self.directory)
+        self.park_and_leave(parking_management)
+        parking_management.close()
+        with open(os.path.join(self.directory, "journal-0.bin"), "ab") as journal_file:
+            journal_file.write(b"P\x07\x00")
+
+        result = PersistentParkingManagement(self.directory)
+        self.assertEqual(4, len(result.occupied_parking_slots))
+        result.close()
+
+    def test_recover_entry_time_and_vehicle_type(self):
+        parking_management = PersistentParkingManagement(self.directory)
+        parking_management.clock = lambda: 1000.5
+        parking_management.create_parking_slots(6)
+        parking_management.issue_parking_ticket("WB-01-RM-1234", "23", "Motorcycle")
+        parking_management.close()
+
+        result = PersistentParkingManagement(self.directory)
+        parking_ticket = result.parking_slot_tickets[1]
+        self.assertEqual(1000.5, parking_ticket.get_entry_time())
+        self.assertEqual("Motorcycle", parking_ticket.get_vehicle_type())
+        result.close()
+
+    def test_record_overflow_leaves_parking_lot_unchanged(self):
+        parking_management = PersistentParkingManagement(self.directory)
+        parking_management.create_parking_slots(2)
+        self.assertRaises(struct.error, parking_management.issue_parking_ticket, "WB-01-RM-1234", 2 ** 31)
+        self.assertRaises(struct.error, parking_management.issue_parking_ticket, "W" * 65536, 23)
+        self.assertRaises(struct.error, parking_management.create_parking_slots, 2 ** 32)
+        self.assertEqual(1, parking_management.issue_parking_ticket("WB-01-RM-5678", "40"))
+        parking_management.close()
+
+        result = PersistentParkingManagement(self.directory)
+        self.assertEqual(2, result.capacity)
+        self.assertEqual(["WB-01-RM-5678"], list(result.occupied_parking_slots))
+        self.assertEqual(2, result.issue_parking_ticket("WB-01-RM-9012", "31"))
+        result.close()
+
+    def test_write_snapshot(self):
+        parking_management = ParkingManagement()
+        self.park_and_leave(parking_management)
+        snapshot_path = os.path.join(self.directory, "snapshot.bin")
+        write_snapshot(parking_management, snapshot_path)
+
+        result = ParkingManagement()
+        read_snapshot(result, snapshot_path)
+        self.assertEqual(list(map(repr, parking_management.occupied_parking_slots.values())),
+                         list(map(repr, result.occupied_parking_slots.values())))
+        self.assertEqual(parking_management.get_nearest_empty_parking_slots(2),
+                         result.get_nearest_empty_parking_slots(2))
+
+
+    def test_write_snapshot_with_bays_and_reservations(self):
+        now = [10.0]
+        parking_management = ParkingManagement()
+        parking_management.clock = lambda: now[0]
+        parking_management.create_parking_slots(6, [("Motorcycle", 2), ("Car", 4)])
+        parking_management.issue_parking_ticket("WB-01-RM-1234", 23, "Motorcycle")
+        parking_management.issue_parking_ticket("WB-01-RM-5678", 40, "EV")
+        parking_management.issue_parking_ticket("WB-01-RM-9012", 31)
+        parking_management.return_parking_ticket(3)
+        parking_management.reserve_parking_slot("KA-01-HH-1234", 0.0, 3600.0)
+        parking_management.reserve_parking_slot("PB-01-HH-1234", 100.0, 3600.0, "EV")
+        snapshot_path = os.path.join(self.directory, "snapshot.bin")
+        write_snapshot(parking_management, snapshot_path)
+
+        result = ParkingManagement()
+        result.clock = parking_management.clock
+        read_snapshot(result, snapshot_path)
+        self.assertEqual(list(map(repr, parking_management.bay_pools.values())),
+                         list(map(repr, result.bay_pools.values())))
+        self.assertEqual([(parking_ticket.get_parking_slot(), parking_ticket.get_entry_time(),
+                           parking_ticket.get_vehicle_type())
+                          for parking_ticket in parking_management.occupied_parking_slots.values()],
+                         [(parking_ticket.get_parking_slot(), parking_ticket.get_entry_time(),
+                           parking_ticket.get_vehicle_type())
+                          for parking_ticket in result.occupied_parking_slots.values()])
+        self.assertEqual(list(map(repr, parking_management.reservation_calendar.reservations.values())),
+                         list(map(repr, result.reservation_calendar.reservations.values())))
+        self.assertEqual(3, result.reservation_calendar.get_vehicle_reservation("KA-01-HH-1234").get_parking_slot())
+
+        now[0] = 100.0
+        self.assertEqual(*[[parking_lot.issue_parking_ticket("DL-01-HH-1234", 21),
+                            parking_lot.issue_parking_ticket("DL-01-HH-5678", 21, "Motorcycle"),
+                            parking_lot.issue_parking_ticket("KA-01-HH-1234", 21),
+                            parking_lot.reservation_calendar.get_vehicle_reservation("PB-01-HH-1234").get_status(),
+                            parking_lot.reserve_parking_slot("MH-01-HH-1234", 100.0, 200.0).get_reservation_id()]
+                           for parking_lot in [parking_management, result]])
+
+    def test_read_snapshot_v1(self):
+        snapshot_path = os.path.join(self.directory, "snapshot.bin")
+        with open(snapshot_path, "wb") as snapshot_file:
+            snapshot_file.write(SNAPSHOT_V1_HEADER.pack(b"PMS1", 3, 6, 4, 1, 2))
+            array("Q", [2, 1, 3, 21, 40]).tofile(snapshot_file)
+            snapshot_file.write(b"WB-01-RM-1234\nWB-01-RM-9012")
+
+        result = ParkingManagement()
+        self.assertEqual(3, read_snapshot(result, snapshot_path))
+        self.assertEqual(["WB-01-RM-1234"], result.get_vehicle_registration_numbers_from_driver_age(21))
+        self.assertEqual([2, 4], result.get_nearest_empty_parking_slots(2))
+
+    def test_reservations_are_not_journaled(self):
+        parking_management = PersistentParkingManagement(self.directory)
+        parking_management.create_parking_slots(6)
+        self.assertRaises(ValueError, parking_management.reserve_parking_slot, "KA-01-HH-1234", 0.0, 3600.0)
+        parking_management.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
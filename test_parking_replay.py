@@ -0,0 +1,60 @@
+import io
+import unittest
+from parking_management import ParkingManagement
+from parking_replay import partition_queries, replay_file, replay_queries
+
+QUERIES = ["Create_parking_lot 2", "Park KA-01-HH-1234 driver_age 21", "Park PB-01-HH-1234 driver_age 21",
+           "Park PB-01-TG-2341 driver_age 40", "Leave 1", "Create_parking_lot abc",
+           "Slot_numbers_for_driver_of_age 21", "Create_parking_lot 3", "Park HR-29-TG-3098 driver_age 39",
+           "Vehicle_registration_number_for_driver_of_age 21", "Leave 5"]
+
+
+class TestParkingReplay(unittest.TestCase):
+    """
+    This is a Test class which contains the methods for unit testing the parallel replay of queries by parking lot.
+    It asserts the outputs of the parallel replay against the outputs of a serial replay.
+    """
+
+    def test_partition_queries(self):
+        result = partition_queries(QUERIES)
+        self.assertEqual([(0, 7), (7, 11)], result)
+
+    def test_replay_queries(self):
+        parking_management = ParkingManagement()
+        expected = [parking_management.execute_query(query) for query in QUERIES]
+        self.assertEqual(expected, replay_queries(QUERIES, workers=2, min_partition_size=1))
+        self.assertEqual(expected, replay_queries(QUERIES))
+
+    def test_replay_queries_lot_tagged(self):
+        lines = ["A Create_parking_lot 1", "B Create_parking_lot 1", "A Park KA-01-HH-1234 driver_age 21",
+                 "B Park PB-01-HH-1234 driver_age 21", "A Park PB-01-TG-2341 driver_age 40", "B Leave 1"]
+        result = replay_queries(lines, workers=2, lot_tagged=True, min_partition_size=1)
+        self.assertEqual(["A Created parking of 1 slots", "B Created parking of 1 slots",
+                          'A Car with vehicle registration number "KA-01-HH-1234" has been parked at slot number 1',
+                          'B Car with vehicle registration number "PB-01-HH-1234" has been parked at slot number 1',
+                          "A Sorry, Parking Lot is full, No Parking Slots Available.",
+                          'B Slot number 1 vacated, the car with vehicle registration number "PB-01-HH-1234" left the '
+                          'space, the driver of the car was of age 21'], result)
+
+    def test_replay_queries_with_failing_create_parking_lot(self):
+        queries = ["Create_parking_lot 2", "Park KA-01-HH-1234 driver_age 21", "Create_parking_lot 6 bays Car 4",
+                   "Park PB-01-HH-1234 driver_age 21", "Create_parking_lot 6 bays Bus 6",
+                   "Park PB-01-TG-2341 driver_age 40"]
+        self.assertEqual([(0, 6)], partition_queries(queries))
+        parking_management = ParkingManagement()
+        expected = [parking_management.execute_query(query) for query in queries]
+        self.assertEqual('Car with vehicle registration number "PB-01-HH-1234" has been parked at slot number 2',
+                         expected[3])
+        self.assertEqual(expected, replay_queries(queries, workers=2, min_partition_size=1))
+
+    def test_replay_file(self):
+        input_text = "\n".join(QUERIES) + "\n"
+        expected = io.StringIO()
+        ParkingManagement().execute_query_stream(io.StringIO(input_text), expected)
+        output = io.StringIO()
+        replay_file(io.StringIO(input_text), output, workers=2, min_partition_size=1)
+        self.assertEqual(expected.getvalue(), output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import asyncio
+import unittest
+from parking_management import ParkingManagement
+from parking_server import ParkingClient, ParkingServer
+
+
+class TestParkingServer(unittest.IsolatedAsyncioTestCase):
+    """
+    This is a Test class which contains the methods for testing the ParkingServer Class against localhost, through the
+    ParkingClient Class. It asserts the outputs received by the client against the expected output.
+    """
+
+    async def asyncSetUp(self):
+        self.parking_server = ParkingServer()
+        self.host, self.port = await self.parking_server.start()
+
+    async def asyncTearDown(self):
+        await self.parking_server.close()
+
+    async def test_execute_query(self):
+        parking_client = ParkingClient()
+        await parking_client.connect(self.host, self.port)
+        self.assertEqual("Created parking of 6 slots", await parking_client.execute_query("Create_parking_lot 6"))
+        self.assertEqual('Car with vehicle registration number "KA-01-HH-1234" has been parked at slot number 1',
+                         await parking_client.execute_query("Park KA-01-HH-1234 driver_age 21"))
+        await parking_client.close()
+
+    async def test_pipelined_queries(self):
+        parking_client = ParkingClient()
+        await parking_client.connect(self.host, self.port)
+        await parking_client.execute_query("Create_parking_lot 100")
+        result = await asyncio.gather(*[parking_client.execute_query(f"Park KA-01-HH-{index} driver_age 21")
+                                        for index in range(100)])
+        self.assertEqual([f'Car with vehicle registration number "KA-01-HH-{index}" has been parked at slot number '
+                          f'{index + 1}' for index in range(100)], result)
+        await parking_client.close()
+
+    async def test_concurrent_connections(self):
+        parking_clients = [ParkingClient() for _ in range(10)]
+        for parking_client in parking_clients:
+            await parking_client.connect(self.host, self.port)
+        await parking_clients[0].execute_query("Create_parking_lot 10")
+        await asyncio.gather(*[parking_client.execute_query(f"Park KA-01-HH-{index} driver_age 21")
+                               for index, parking_client in enumerate(parking_clients)])
+        result = await parking_clients[0].execute_query("Slot_numbers_for_driver_of_age 21")
+        self.assertEqual(list(range(1, 11)), sorted(map(int, result.split(','))))
+        for parking_client in parking_clients:
+            await parking_client.close()
+
+    async def test_pipelined_queries_are_batched(self):
+        parking_management = self.parking_server.parking_management = ParkingManagement()
+        park_many_sizes = []
+        park_many = parking_management.park_many
+        parking_management.park_many = lambda cars: park_many_sizes.append(len(cars)) or park_many(cars)
+
+        parking_client = ParkingClient()
+        await parking_client.connect(self.host, self.port)
+        await parking_client.execute_query("Create_parking_lot 2")
+        result = await asyncio.gather(*[parking_client.execute_query(f"Park KA-01-HH-{index} driver_age 21")
+                                        for index in range(3)])
+        self.assertEqual('Sorry, Parking Lot is full, No Parking Slots Available.', result[2])
+        self.assertEqual([3], park_many_sizes)
+        await parking_client.close()
+
+    async def test_pipelined_queries_with_car_parked_again(self):
+        queries = ["Create_parking_lot 2", "Park KA-01-HH-1234 driver_age 21", "Park KA-01-HH-1234 driver_age 21",
+                   "Park KA-01-HH-5678 driver_age 21", "Park KA-01-HH-9012 driver_age 21",
+                   "Slot_numbers_for_driver_of_age 21"]
+        parking_management = ParkingManagement()
+        expected = [parking_management.execute_query(query) for query in queries]
+
+        parking_client = ParkingClient()
+        await parking_client.connect(self.host, self.port)
+        result = await asyncio.gather(*[parking_client.execute_query(query) for query in queries])
+        self.assertEqual(expected, result)
+        await parking_client.close()
+
+    async def test_invalid_lines(self):
+        parking_server = ParkingServer(max_query_length=64)
+        host, port = await parking_server.start()
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(b"Create_parking_lot 6\n\xff\xfe\n" + b"Park " * 100 + b"\nLeave 1")
+        writer.write_eof()
+        result = (await reader.read()).decode().split('\n')
+        writer.close()
+        await parking_server.close()
+        self.assertEqual("Created parking of 6 slots", result[0])
+        self.assertTrue(result[1].startswith("Error in Query - Query is not valid UTF-8"))
+        self.assertEqual("Error in Query - Query is longer than 64 bytes", result[2])
+        self.assertEqual(["Slot number 1 cannot be vacated.", ""], result[3:])
+
+
+if __name__ == '__main__':
+    unittest.main()
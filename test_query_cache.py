@@ -0,0 +1,80 @@
+import unittest
+from parking_management import ParkingManagement
+from query_cache import QueryCache
+
+
+class TestQueryCache(unittest.TestCase):
+    """
+    This is a Test class which contains the methods for unit testing the QueryCache Class, and the caching of the
+    driver's age queries of a ParkingManagement. It asserts the cached results against the state of the parking lot.
+    """
+
+    def test_get(self):
+        query_cache = QueryCache()
+        self.assertIsNone(query_cache.get(("parking_slots", 21)))
+        query_cache.put(("parking_slots", 21), 21, (1, 2))
+        self.assertEqual((1, 2), query_cache.get(("parking_slots", 21)))
+        self.assertEqual(0.5, query_cache.get_hit_rate())
+
+    def test_put_evicts_least_recently_used(self):
+        query_cache = QueryCache(2)
+        query_cache.put(("parking_slots", 21), 21, (1,))
+        query_cache.put(("parking_slots", 22), 22, (2,))
+        query_cache.get(("parking_slots", 21))
+        query_cache.put(("parking_slots", 23), 23, (3,))
+        self.assertEqual([("parking_slots", 21), ("parking_slots", 23)], list(query_cache.results))
+        self.assertEqual({21, 23}, set(query_cache.driver_age_keys))
+
+    def test_put_with_zero_max_size(self):
+        query_cache = QueryCache(0)
+        query_cache.put(("parking_slots", 21), 21, (1,))
+        self.assertIsNone(query_cache.get(("parking_slots", 21)))
+
+    def test_invalidate_driver_age(self):
+        query_cache = QueryCache()
+        query_cache.put(("parking_slots", 21), 21, (1,))
+        query_cache.put(("parking_slots_output", 21), 21, "1")
+        query_cache.put(("parking_slots", 22), 22, (2,))
+        query_cache.invalidate_driver_age(21)
+        self.assertEqual([("parking_slots", 22)], list(query_cache.results))
+
+    def test_park_and_leave_invalidate_driver_age(self):
+        parking_management = ParkingManagement()
+        parking_management.create_parking_slots(6)
+        parking_management.issue_parking_ticket("KA-01-HH-1234", 21)
+        parking_management.issue_parking_ticket("PB-01-HH-1234", 40)
+        self.assertEqual("1", parking_management.execute_query("Slot_numbers_for_driver_of_age 21"))
+        self.assertEqual("2", parking_management.execute_query("Slot_numbers_for_driver_of_age 40"))
+
+        parking_management.issue_parking_ticket("KA-01-HH-9999", 21)
+        self.assertEqual("1,3", parking_management.execute_query("Slot_numbers_for_driver_of_age 21"))
+        self.assertIn(("parking_slots_output", 40), parking_management.query_cache.results)
+
+        parking_management.return_parking_ticket(1)
+        self.assertEqual("KA-01-HH-9999",
+                         parking_management.execute_query("Vehicle_registration_number_for_driver_of_age 21"))
+        parking_management.leave_many([3])
+        self.assertEqual([], parking_management.get_vehicle_registration_numbers_from_driver_age(21))
+        parking_management.park_many([("KA-01-HH-5555", 21)])
+        self.assertEqual([1], parking_management.get_parking_slots_from_driver_age(21))
+
+    def test_query_counts_one_lookup(self):
+        parking_management = ParkingManagement()
+        parking_management.create_parking_slots(6)
+        parking_management.issue_parking_ticket("KA-01-HH-1234", 21)
+        for _ in range(2):
+            parking_management.execute_query("Slot_numbers_for_driver_of_age 21")
+        self.assertEqual((1, 1), (parking_management.query_cache.hits, parking_management.query_cache.misses))
+        self.assertEqual(0.5, parking_management.query_cache.get_hit_rate())
+
+    def test_create_parking_lot_clears_query_cache(self):
+        parking_management = ParkingManagement()
+        parking_management.create_parking_slots(6)
+        parking_management.issue_parking_ticket("KA-01-HH-1234", 21)
+        parking_management.get_parking_slots_from_driver_age(21)
+        parking_management.create_parking_slots(6)
+        self.assertEqual([], parking_management.get_parking_slots_from_driver_age(21))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import random
+import unittest
+from parking_management import ParkingManagement
+from registration_number_index import CHUNK_SIZE, RegistrationNumberIndex, SortedStringList, get_region_code
+
+
+class TestRegistrationNumberIndex(unittest.TestCase):
+    """
+    This is a Test class which contains the methods for unit testing the RegistrationNumberIndex Class, and the
+    vehicle registration number prefix queries of a ParkingManagement. It asserts the matches against a full scan.
+    """
+
+    VEHICLE_REGISTRATION_NUMBERS = ["KA-01-HH-1234", "KA-01-BB-0001", "KA-02-HH-9999", "KA-012-AA-1", "PB-01-HH-1234",
+                                    "DL1234"]
+
+    def get_index(self):
+        registration_number_index = RegistrationNumberIndex()
+        for vehicle_registration_number in self.VEHICLE_REGISTRATION_NUMBERS:
+            registration_number_index.add(vehicle_registration_number)
+        return registration_number_index
+
+    def test_get_region_code(self):
+        self.assertEqual("KA-01", get_region_code("KA-01-HH-1234"))
+        self.assertEqual("KA-01", get_region_code("KA-01"))
+        self.assertEqual("DL1234", get_region_code("DL1234"))
+
+    def test_get_vehicle_registration_numbers_with_prefix(self):
+        registration_number_index = self.get_index()
+        for prefix in ["", "K", "KA-0", "KA-01", "KA-01-", "KA-01-H", "KA-01-HH-1234", "KA-01-HH-12345", "DL", "X"]:
+            expected = sorted(vehicle_registration_number
+                              for vehicle_registration_number in self.VEHICLE_REGISTRATION_NUMBERS
+                              if vehicle_registration_number.startswith(prefix))
+            result = registration_number_index.get_vehicle_registration_numbers_with_prefix(prefix)
+            self.assertEqual(expected, sorted(result), prefix)
+
+    def test_remove(self):
+        registration_number_index = self.get_index()
+        registration_number_index.remove("KA-02-HH-9999")
+        registration_number_index.remove("DL1234")
+        self.assertEqual(4, len(registration_number_index))
+        self.assertNotIn("KA-02", registration_number_index.region_codes)
+        self.assertEqual([], registration_number_index.get_vehicle_registration_numbers_with_prefix("KA-02"))
+
+    def test_load(self):
+        registration_number_index = RegistrationNumberIndex()
+        registration_number_index.load(self.VEHICLE_REGISTRATION_NUMBERS)
+        self.assertEqual({region_code: list(vehicle_registration_numbers) for region_code, vehicle_registration_numbers
+                          in self.get_index().region_vehicle_registration_numbers.items()},
+                         {region_code: list(vehicle_registration_numbers) for region_code, vehicle_registration_numbers
+                          in registration_number_index.region_vehicle_registration_numbers.items()})
+
+    def test_sorted_string_list(self):
+        strings = [f"KA-01-HH-{number:05}" for number in range(5 * CHUNK_SIZE)]
+        random.Random(0).shuffle(strings)
+        sorted_string_list = SortedStringList()
+        for string in strings:
+            sorted_string_list.add(string)
+        self.assertEqual(sorted(strings), list(sorted_string_list))
+        self.assertTrue(all(len(chunk) <= 2 * CHUNK_SIZE for chunk in sorted_string_list.chunks))
+        self.assertEqual([chunk[-1] for chunk in sorted_string_list.chunks], sorted_string_list.maxes)
+
+        for string in strings[::2]:
+            sorted_string_list.remove(string)
+        self.assertEqual(sorted(strings[1::2]), list(sorted_string_list))
+        self.assertEqual(sorted(string for string in strings[1::2] if string.startswith("KA-01-HH-01")),
+                         sorted_string_list.get_strings_with_prefix("KA-01-HH-01"))
+
+    def test_slot_numbers_for_car_with_number_prefix_command(self):
+        parking_management = ParkingManagement()
+        parking_management.create_parking_slots(6)
+        for vehicle_registration_number in ["KA-01-HH-1234", "PB-01-HH-1234", "KA-01-BB-0001"]:
+            parking_management.issue_parking_ticket(vehicle_registration_number, 21)
+        parking_management.return_parking_ticket(1)
+        self.assertEqual("KA-01-BB-0001:3", parking_management.execute_query(
+            "Slot_numbers_for_car_with_number_prefix KA-01-*"))
+        self.assertEqual("No parked car matches the query", parking_management.execute_query(
+            "Slot_numbers_for_car_with_number_prefix KA-02"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+from parking_management import ParkingManagement
+from reservation_calendar import ReservationCalendar, START_EVENT
+
+
+class TestReservationCalendar(unittest.TestCase):
+    """
+    This is a Test class which contains the methods for unit testing the ReservationCalendar Class, and the
+    reservations of a ParkingManagement. It asserts the parking slots held for the reservations as the clock moves.
+    """
+
+    def get_parking_management(self, capacity=2):
+        parking_management = ParkingManagement()
+        self.now = 0.0
+        parking_management.clock = lambda: self.now
+        parking_management.create_parking_slots(capacity)
+        return parking_management
+
+    def test_pop_due_events(self):
+        reservation_calendar = ReservationCalendar()
+        first_reservation = reservation_calendar.book("KA-01-HH-1234", 20.0, 30.0)
+        second_reservation = reservation_calendar.book("PB-01-HH-1234", 10.0, 30.0)
+        self.assertEqual([(START_EVENT, second_reservation)], reservation_calendar.pop_due_events(15.0))
+        reservation_calendar.finish(first_reservation, "cancelled")
+        self.assertEqual([], reservation_calendar.pop_due_events(25.0))
+        self.assertRaises(ValueError, reservation_calendar.book, "PB-01-HH-1234", 10.0, 30.0)
+        self.assertRaises(ValueError, reservation_calendar.book, "DL-01-HH-1234", 30.0, 10.0)
+
+    def test_reserved_parking_slot_is_held_during_time_window(self):
+        parking_management = self.get_parking_management()
+        parking_management.reserve_parking_slot("KA-01-HH-1234", 100.0, 3600.0)
+        self.assertEqual(1, parking_management.issue_parking_ticket("PB-01-HH-1234", 21))
+        parking_management.return_parking_ticket(1)
+
+        self.now = 100.0
+        self.assertEqual(2, parking_management.issue_parking_ticket("PB-01-HH-1234", 21))
+        self.assertEqual(-1, parking_management.issue_parking_ticket("DL-01-HH-1234", 21))
+        self.assertEqual(1, parking_management.issue_parking_ticket("KA-01-HH-1234", 40))
+        self.assertEqual(0, len(parking_management.reservation_calendar))
+
+    def test_refused_early_arrival_keeps_reservation(self):
+        parking_management = self.get_parking_management(1)
+        reservation = parking_management.reserve_parking_slot("KA-01-HH-1234", 100.0, 3600.0)
+        self.assertEqual(1, parking_management.issue_parking_ticket("PB-01-HH-1234", 21))
+        self.assertEqual(-1, parking_management.issue_parking_ticket("KA-01-HH-1234", 40))
+        self.assertEqual("booked", reservation.get_status())
+        parking_management.return_parking_ticket(1)
+
+        self.now = 100.0
+        self.assertEqual(-1, parking_management.issue_parking_ticket("DL-01-HH-1234", 21))
+        self.assertEqual(1, parking_management.issue_parking_ticket("KA-01-HH-1234", 40))
+        self.assertEqual("claimed", reservation.get_status())
+
+    def test_early_arrival_uses_up_reservation(self):
+        parking_management = self.get_parking_management(2)
+        reservation = parking_management.reserve_parking_slot("KA-01-HH-1234", 100.0, 3600.0)
+        self.assertEqual(1, parking_management.issue_parking_ticket("KA-01-HH-1234", 40))
+        self.assertEqual("claimed", reservation.get_status())
+        self.now = 100.0
+        self.assertEqual(2, parking_management.issue_parking_ticket("PB-01-HH-1234", 21))
+
+    def test_no_show_releases_parking_slot(self):
+        parking_management = self.get_parking_management(1)
+        reservation = parking_management.reserve_parking_slot("KA-01-HH-1234", 100.0, 3600.0)
+        self.now = 100.0
+        self.assertEqual(-1, parking_management.issue_parking_ticket("PB-01-HH-1234", 21))
+        self.now = 100.0 + parking_management.reservation_calendar.no_show_grace_period
+        self.assertEqual(1, parking_management.issue_parking_ticket("PB-01-HH-1234", 21))
+        self.assertEqual("expired", reservation.get_status())
+
+    def test_reservation_is_refused_when_time_window_is_fully_booked(self):
+        parking_management = self.get_parking_management(1)
+        self.assertEqual("booked", parking_management.reserve_parking_slot("KA-01-HH-1234", 100.0, 200.0).get_status())
+        self.assertEqual("unavailable",
+                         parking_management.reserve_parking_slot("PB-01-HH-1234", 150.0, 300.0).get_status())
+        self.assertEqual("booked", parking_management.reserve_parking_slot("DL-01-HH-1234", 200.0, 300.0).get_status())
+        self.assertEqual(2, len(parking_management.reservation_calendar))
+
+        parking_management.create_parking_slots(2, [("Motorcycle", 1), ("Car", 1)])
+        self.assertEqual("booked", parking_management.reserve_parking_slot("KA-01-HH-1234", 100.0, 200.0).get_status())
+        reservation = parking_management.reserve_parking_slot("PB-01-HH-1234", 100.0, 200.0, "Motorcycle")
+        self.assertEqual("booked", reservation.get_status())
+        self.assertEqual("unavailable",
+                         parking_management.reserve_parking_slot("DL-01-HH-1234", 150.0, 300.0).get_status())
+
+    def test_reserve_and_cancel_reservation_commands(self):
+        parking_management = self.get_parking_management(1)
+        self.now = 50.0
+        self.assertEqual('Reservation 1 booked for car with vehicle registration number "KA-01-HH-1234"',
+                         parking_management.execute_query("Reserve KA-01-HH-1234 from 0 to 3600"))
+        self.assertEqual("Sorry, Parking Lot is full, No Parking Slots Available.",
+                         parking_management.execute_query("Reserve PB-01-HH-1234 from 0 to 3600"))
+        self.assertEqual("Reservation 1 cancelled", parking_management.execute_query("Cancel_reservation 1"))
+        self.assertEqual("Error in Query - Cancel_reservation 1 : Reservation 1 does not exist",
+                         parking_management.execute_query("Cancel_reservation 1"))
+        self.assertEqual('Reservation 3 booked for car with vehicle registration number "WB-01-HH-1234"',
+                         parking_management.execute_query("Reserve WB-01-HH-1234 from 100 to 3600 a b"))
+        self.assertEqual('Car with vehicle registration number "DL-01-HH-1234" has been parked at slot number 1',
+                         parking_management.execute_query("Park DL-01-HH-1234 driver_age 21"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from Models.Car import Car
+from Models.Motorcycle import Motorcycle
+from Models.TicketStore import TicketStore
+from parking_management import VEHICLE_CLASSES, ParkingManagement
+
+
+class TestTicketStore(unittest.TestCase):
+    """
+    This is a Test class which contains the methods for unit testing the methods present in TicketStore Class, and the
+    parking tickets of a ParkingManagement stored in it. It asserts the value returned by calling the method in
+    TicketStore Class against the expected output.
+    """
+
+    def test_add_parking_ticket(self):
+        ticket_store = TicketStore(VEHICLE_CLASSES)
+        parking_ticket = ticket_store.add_parking_ticket(Motorcycle("WB-01-RM-1234", "23"), 3, 10.0)
+        self.assertEqual(1, len(ticket_store))
+        self.assertIn(3, ticket_store)
+        self.assertNotIn(2, ticket_store)
+        self.assertEqual("WB-01-RM-1234 - 23 - 3", repr(parking_ticket))
+        self.assertEqual(("Motorcycle", 10.0, None), (parking_ticket.get_vehicle_type(),
+                                                      parking_ticket.get_entry_time(), parking_ticket.get_exit_time()))
+
+    def test_add_parking_ticket_with_driver_age_out_of_range(self):
+        ticket_store = TicketStore(VEHICLE_CLASSES)
+        self.assertRaises(OverflowError, ticket_store.add_parking_ticket, Car("WB-01-RM-1234", 2 ** 63), 1)
+        self.assertEqual(0, len(ticket_store))
+        self.assertNotIn(1, ticket_store)
+
+    def test_remove_parking_ticket(self):
+        ticket_store = TicketStore(VEHICLE_CLASSES)
+        ticket_store.add_parking_ticket(Car("WB-01-RM-1234", "23"), 3)
+        result = ticket_store.remove_parking_ticket(3)
+        self.assertEqual("WB-01-RM-1234 - 23 - 3", repr(result))
+        self.assertEqual((None, "Car"), (result.get_entry_time(), result.get_vehicle_type()))
+        self.assertIsNone(ticket_store.remove_parking_ticket(3))
+        self.assertEqual(0, len(ticket_store))
+
+    def test_enable_ticket_store(self):
+        queries = ["Create_parking_lot 4", "Park KA-01-HH-1234 driver_age 21", "Park PB-01-HH-1234 driver_age 21",
+                   "Park KA-01-HH-1234 driver_age 40", "Leave 2", "Park DL-01-HH-1234 driver_age 21",
+                   "Vehicle_registration_number_for_driver_of_age 21", "Slot_numbers_for_driver_of_age 40",
+                   "Slot_numbers_for_car_with_number_prefix KA", "Leave 3"]
+        parking_management = ParkingManagement()
+        expected = [parking_management.execute_query(query) for query in queries]
+
+        parking_management = ParkingManagement()
+        ticket_store = parking_management.enable_ticket_store()
+        self.assertEqual(expected, [parking_management.execute_query(query) for query in queries])
+        self.assertEqual(1, len(ticket_store))
+
+        parking_management.disable_ticket_store()
+        self.assertEqual(["DL-01-HH-1234 - 21 - 1"],
+                         list(map(repr, parking_management.occupied_parking_slots.values())))
+        parking_management.enable_ticket_store(ticket_store)
+        self.assertEqual("DL-01-HH-1234", ticket_store.get_vehicle_registration_number(1))
+
+
+if __name__ == '__main__':
+    unittest.main()